@@ -1,16 +1,25 @@
 import re
 import logging
 import json
-from bs4 import BeautifulSoup
-from typing import Dict, Optional, Tuple, Any
+from lxml import html as lxml_html
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse, parse_qs
 from src.interfaces import IHttpClient
 from src.http.client import RequestsHttpClient
+from src.ops.circuit_breaker import CircuitOpenError
+from src.ops.probe import EndpointProbe
 
 logger = logging.getLogger(__name__)
 
 class ArticleParser:
-    def __init__(self, http_client: IHttpClient):
+    def __init__(
+        self,
+        http_client: IHttpClient,
+        extract_body: bool = True,
+        probe: Optional[EndpointProbe] = None,
+    ):
+        self.extract_body = extract_body
+        self.probe = probe
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
@@ -38,11 +47,18 @@ class ArticleParser:
         except Exception:
             return None, None
 
-    def fetch_and_parse(self, url: str) -> Dict[str, Any]:
+    def fetch_and_parse(self, url: str, include_body: Optional[bool] = None) -> Dict[str, Any]:
         """
         Fetch article HTML and extract metadata.
         Returns dictionary with title, published_at, etc.
+        When include_body is False (or the parser was built with extract_body=False),
+        everything from #dic_area onwards is skipped before parsing.
+        If a probe is attached, comment API parameters are discovered from the inline
+        scripts and returned as "probe_params"; the page text itself is not kept.
         """
+        if include_body is None:
+            include_body = self.extract_body
+
         result = {
             "title": None,
             "published_at": None,
@@ -54,6 +70,7 @@ class ArticleParser:
             "body_length": 0,
             "status": "FAIL-PARSE",
             "status_code": None,
+            "probe_params": None,
         }
         
         try:
@@ -64,82 +81,137 @@ class ArticleParser:
                 result["status"] = "FAIL-HTTP"
                 result["error_code"] = str(resp.status_code)
                 return result
-                
-            soup = BeautifulSoup(resp.text, 'lxml')
-            
-            # Store raw HTML for Probe usage (hidden field)
-            result["_raw_html"] = resp.text
-
-            # Strategy 1: JSON-LD (Preferred)
-            json_ld = soup.find('script', type='application/ld+json')
-            if json_ld:
-                try:
-                    data = json.loads(json_ld.string)
-                    # Handle list of objects or single object
-                    if isinstance(data, list):
-                        data = data[0]
-                    
-                    if '@type' in data and 'NewsArticle' in data['@type']:
-                        result['title'] = data.get('headline')
-                        result['published_at'] = data.get('datePublished')
-                        result['updated_at'] = data.get('dateModified')
-                        result['section'] = data.get('articleSection')
-                        if data.get('author'):
-                            result['reporter'] = data['author'].get('name') if isinstance(data['author'], dict) else None
-                except Exception:
-                    pass # Fallback to selectors
-            
-            # Extract common metadata
-            # Title
-            if not result['title']:
-                title_tag = soup.find('h2', id='title_area') or soup.find('title')
-                if title_tag:
-                    result["title"] = title_tag.get_text(strip=True)
-                
-            # Published At (many patterns, trying most common)
-            # data-date-time attribute in span
-            if not result['published_at']:
-                date_span = soup.select_one('span[data-date-time]')
-                if date_span:
-                    result["published_at"] = date_span['data-date-time']
-                else:
-                # Fallback to meta tag
-                    meta_date = soup.find('meta', property='article:published_time')
-                    if meta_date:
-                        result['published_at'] = meta_date['content']
-
-            # Updated At
-            if not result['updated_at']:
-                updated_span = soup.select_one('span.media_end_head_info_datestamp_time._MODIFY_DATE_TIME')
-                if updated_span and updated_span.has_attr('data-date-time'):
-                    result['updated_at'] = updated_span['data-date-time']
-
-            # Press
-            press_img = soup.select_one('a.media_end_head_top_logo img')
-            if press_img:
-                result['press'] = press_img.get('title') or press_img.get('alt')
-                
-            # Reporter
-            # Common selector: .media_end_head_journalist_name
-            if not result['reporter']:
-                reporter_tag = soup.select_one('.media_end_head_journalist_name')
-                if reporter_tag:
-                    result['reporter'] = reporter_tag.get_text(strip=True)
-
-            # Body Content
-            # Standard Naver News body id: #dic_area
-            body_div = soup.select_one('#dic_area')
-            if body_div:
-                # Remove captions/photos
-                for useless in body_div.select('.end_photo_org, .img_desc, script, style'):
-                    useless.decompose()
-                result['body'] = body_div.get_text(separator='\n', strip=True)
-                result['body_length'] = len(result['body'])
+
+            page = resp.text
+
+            if self.probe is not None:
+                # The probe scans only the bounded inline-script region of the page.
+                result["probe_params"] = self.probe.discover_parameters(url, page)
+
+            if not include_body:
+                # Head, JSON-LD and the header block all precede the article body.
+                marker = _BODY_START_RE.search(page)
+                if marker:
+                    page = page[: marker.start()]
+
+            tree = lxml_html.document_fromstring(page)
+            self._extract_metadata(tree, result)
+            if include_body:
+                self._extract_body(tree, result)
 
             result["status"] = "CRAWL-OK"
             return result
             
+        except CircuitOpenError as e:
+            result["status"] = "FAIL-HTTP"
+            result["error_code"] = "CIRCUIT_OPEN"
+            result["error_message"] = str(e)
+            return result
         except Exception as e:
             logger.error(f"Article parse failed {url}: {e}")
             result["error_message"] = str(e)
             return result
+
+    def _extract_metadata(self, tree, result: Dict[str, Any]) -> None:
+        # Strategy 1: JSON-LD (Preferred)
+        json_ld = _first(tree.xpath('//script[@type="application/ld+json"]'))
+        if json_ld is not None and json_ld.text:
+            try:
+                data = json.loads(json_ld.text)
+                # Handle list of objects or single object
+                if isinstance(data, list):
+                    data = data[0]
+
+                if '@type' in data and 'NewsArticle' in data['@type']:
+                    result['title'] = data.get('headline')
+                    result['published_at'] = data.get('datePublished')
+                    result['updated_at'] = data.get('dateModified')
+                    result['section'] = data.get('articleSection')
+                    if data.get('author'):
+                        result['reporter'] = data['author'].get('name') if isinstance(data['author'], dict) else None
+            except Exception:
+                pass # Fallback to selectors
+
+        # Title
+        if not result['title']:
+            title_tag = _first(tree.xpath('//h2[@id="title_area"]'))
+            if title_tag is None:
+                title_tag = _first(tree.xpath('//title'))
+            if title_tag is not None:
+                result["title"] = _stripped_text(title_tag)
+
+        # Published At: data-date-time attribute in span, else meta tag
+        if not result['published_at']:
+            date_attr = _first(tree.xpath('//span[@data-date-time]/@data-date-time'))
+            if date_attr is None:
+                date_attr = _first(tree.xpath('//meta[@property="article:published_time"]/@content'))
+            if date_attr is not None:
+                result["published_at"] = str(date_attr)
+
+        # Updated At
+        if not result['updated_at']:
+            updated = _first(
+                tree.xpath(
+                    f'//span[{_has_class("media_end_head_info_datestamp_time")}]'
+                    f'[{_has_class("_MODIFY_DATE_TIME")}]/@data-date-time'
+                )
+            )
+            if updated is not None:
+                result['updated_at'] = str(updated)
+
+        # Press
+        press_img = _first(tree.xpath(f'//a[{_has_class("media_end_head_top_logo")}]//img'))
+        if press_img is not None:
+            result['press'] = press_img.get('title') or press_img.get('alt')
+
+        # Reporter
+        if not result['reporter']:
+            reporter_tag = _first(tree.xpath(f'//*[{_has_class("media_end_head_journalist_name")}]'))
+            if reporter_tag is not None:
+                result['reporter'] = _stripped_text(reporter_tag)
+
+    def _extract_body(self, tree, result: Dict[str, Any]) -> None:
+        # Standard Naver News body id: #dic_area
+        body_div = _first(tree.xpath('//*[@id="dic_area"]'))
+        if body_div is None:
+            return
+        # Skip captions/photos/scripts while walking the text nodes
+        noise = set(body_div.xpath(_BODY_NOISE_XPATH))
+        result['body'] = _join_stripped(_iter_text(body_div, noise), separator='\n')
+        result['body_length'] = len(result['body'])
+
+
+def _has_class(name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+_BODY_START_RE = re.compile(r"""<[a-zA-Z]+[^>]*\sid=["']dic_area["']""")
+_BODY_NOISE_XPATH = (
+    f'.//*[{_has_class("end_photo_org")} or {_has_class("img_desc")}]'
+    ' | .//script | .//style'
+)
+
+
+def _first(nodes: List[Any]) -> Any:
+    return nodes[0] if nodes else None
+
+
+def _stripped_text(element, separator: str = "") -> str:
+    """Equivalent of BeautifulSoup get_text(separator, strip=True)."""
+    return _join_stripped(element.itertext(), separator)
+
+
+def _join_stripped(chunks: Iterable[Optional[str]], separator: str) -> str:
+    return separator.join(chunk.strip() for chunk in chunks if chunk and chunk.strip())
+
+
+def _iter_text(element, skip: Set[Any]) -> Iterator[Optional[str]]:
+    """
+    Yield text nodes under element, omitting skipped subtrees but keeping their tails
+    as separate chunks (the same strings BeautifulSoup keeps after decompose()).
+    """
+    yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child not in skip:
+            yield from _iter_text(child, skip)
+        yield child.tail
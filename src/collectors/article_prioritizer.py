@@ -0,0 +1,164 @@
+import heapq
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..common.errors import AppError
+from ..ops.probe import EndpointProbe
+from ..ops.volume import VolumeTracker
+from .comment_fetcher import CommentFetcher
+from .comment_parser import CommentParser
+from .comment_stats import CommentStatsService
+
+logger = logging.getLogger(__name__)
+
+
+class IVolumeEstimator(ABC):
+    """Predicts how many comments an article from the search feed carries."""
+
+    @abstractmethod
+    def estimate(self, item: Dict[str, Any]) -> Optional[int]:
+        pass
+
+
+class HistoryVolumeEstimator(IVolumeEstimator):
+    """
+    Uses comment volumes recorded for the same article in earlier runs. No HTTP.
+    """
+
+    def __init__(self, history: Dict[Tuple[str, str], int]):
+        self.history = history
+
+    def estimate(self, item: Dict[str, Any]) -> Optional[int]:
+        return self.history.get((item.get("oid"), item.get("aid")))
+
+
+class StatsTotalEstimator(IVolumeEstimator):
+    """
+    One request to the comment statistics endpoint, which reports the article total.
+    """
+
+    def __init__(self, stats_service: CommentStatsService, probe: EndpointProbe):
+        self.stats_service = stats_service
+        self.probe = probe
+
+    def estimate(self, item: Dict[str, Any]) -> Optional[int]:
+        params = self.probe.get_candidate_configs(item.get("url", ""))[0]
+        try:
+            stats = self.stats_service.fetch_stats(item["oid"], item["aid"], params, purpose="stats_estimate")
+        except AppError as exc:
+            logger.debug("Stats estimate failed for %s/%s: %s", item.get("oid"), item.get("aid"), exc)
+            return None
+        return stats.get("total_comments") if stats else None
+
+
+class CountProbeEstimator(IVolumeEstimator):
+    """
+    Fetches comment page 1 and reads the reported total from it.
+    The raw page is attached to the item as "count_probe".
+    """
+
+    def __init__(self, fetcher: CommentFetcher, parser: CommentParser, probe: EndpointProbe):
+        self.fetcher = fetcher
+        self.parser = parser
+        self.probe = probe
+
+    def estimate(self, item: Dict[str, Any]) -> Optional[int]:
+        params = self.probe.get_candidate_configs(item.get("url", ""))[0]
+        try:
+            raw_body = self.fetcher.fetch(
+                oid=item["oid"],
+                aid=item["aid"],
+                page=1,
+                params=params,
+                scope="comment",
+                parent_comment_no=None,
+                purpose="count_probe",
+            )
+            # Kept on the item so the low-volume gate can reuse it as page 1.
+            item["count_probe"] = {"params": params, "raw": raw_body}
+            return self.parser.extract_total_count(self.parser.parse_jsonp(raw_body))
+        except AppError as exc:
+            logger.debug("Count probe failed for %s/%s: %s", item.get("oid"), item.get("aid"), exc)
+            return None
+
+
+class ArticlePrioritizer:
+    """
+    Reorders the search feed so articles with the most expected comments are
+    crawled first.
+
+    Estimators are tried in order (cheapest first) until one answers; articles
+    nobody can estimate are scored at the tracker's current mean (0 before any
+    article has been crawled). The number of articles scored ahead of the crawl
+    follows the VolumeTracker estimate of how many articles are still needed to
+    reach target_comments.
+    """
+
+    def __init__(
+        self,
+        estimators: Sequence[IVolumeEstimator],
+        volume_tracker: VolumeTracker,
+        target_comments: int,
+        min_lookahead: int = 5,
+        max_lookahead: int = 50,
+    ):
+        self.estimators = list(estimators)
+        self.volume_tracker = volume_tracker
+        self.target_comments = target_comments
+        self.min_lookahead = max(1, min_lookahead)
+        self.max_lookahead = max(self.min_lookahead, max_lookahead)
+        self._estimates: Dict[Tuple[Any, Any], Optional[int]] = {}
+
+    def estimate(self, item: Dict[str, Any]) -> Optional[int]:
+        """
+        Chained estimate for one article; memoized so each estimator is asked at most once.
+        """
+        key = (item.get("oid"), item.get("aid"))
+        if key in self._estimates:
+            return self._estimates[key]
+        value = None
+        if item.get("oid") and item.get("aid"):
+            for estimator in self.estimators:
+                value = estimator.estimate(item)
+                if value is not None:
+                    break
+        self._estimates[key] = value
+        return value
+
+    def lookahead(self, collected_comments: int) -> int:
+        remaining = self.volume_tracker.estimate_remaining_articles(self.target_comments, collected_comments)
+        if remaining is None:
+            return self.min_lookahead
+        # Score about twice what is still needed so the best half can be picked.
+        return max(self.min_lookahead, min(self.max_lookahead, 2 * remaining))
+
+    def prioritize(
+        self,
+        feed: Iterable[Dict[str, Any]],
+        collected_comments: Callable[[], int],
+    ) -> Iterator[Dict[str, Any]]:
+        source = iter(feed)
+        order = itertools.count()
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        exhausted = False
+
+        while True:
+            window = self.lookahead(collected_comments())
+            while not exhausted and len(heap) < window:
+                item = next(source, None)
+                if item is None:
+                    exhausted = True
+                    break
+                estimate = self.estimate(item)
+                item["expected_comments"] = estimate
+                heapq.heappush(heap, (-self._score(estimate), next(order), item))
+            if not heap:
+                return
+            yield heapq.heappop(heap)[2]
+
+    def _score(self, estimate: Optional[int]) -> float:
+        if estimate is not None:
+            return float(estimate)
+        return self.volume_tracker.current_trimmed_mean()
@@ -1,21 +1,39 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from ..config import AppConfig
 from .comment_fetcher import CommentFetcher
 from .comment_parser import CommentParser, JSONPParseError, SchemaMismatchError
 from .comment_stats import CommentStatsService
+from .page_processor import IPageProcessor, InlinePageProcessor, ParsedPage
 from ..storage.repository import CommentRepository
 from ..common.errors import AppError, Severity, ErrorKind
+from ..ops.circuit_breaker import CircuitOpenError
 from ..ops.structural import StructuralDetector, StructuralError, FailureKind
 from ..ops.run_events import RunEventLogger
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class ArticleBudget:
+    """
+    Per-article crawl limits. should_stop receives the comments written so far for
+    the article and is checked between pages and between reply threads.
+    """
+
+    max_comment_pages: int
+    max_reply_pages: int
+    should_stop: Optional[Callable[[int], bool]] = None
+
+    def exhausted(self, written: int) -> bool:
+        return bool(self.should_stop and self.should_stop(written))
+
+
 class CommentCollector:
-    MAX_COMMENT_PAGES = 400
-    MAX_REPLY_PAGES = 200
 
     def __init__(
         self,
@@ -27,10 +45,15 @@ class CommentCollector:
         structural_detector: Optional[StructuralDetector] = None,
         event_logger: Optional[RunEventLogger] = None,
         stats_service: Optional[CommentStatsService] = None,
+        page_processor: Optional[IPageProcessor] = None,
     ):
         self.config = config
         self.fetcher = fetcher
         self.parser = parser
+        # Parse/validate/hash stage; a process pool can take it off this thread.
+        self.page_processor = page_processor or InlinePageProcessor(parser)
+        # Pages whose rows are still being built, persisted oldest first.
+        self._in_flight: Deque[Tuple[ParsedPage, str, str]] = deque()
         self.repository = repository
         self.snapshot_at = snapshot_at
         self.structural_detector = structural_detector or StructuralDetector(threshold=10)
@@ -44,34 +67,46 @@ class CommentCollector:
         aid: str,
         endpoint_params: Dict[str, str],
         source_url: Optional[str] = None,
+        first_page: Optional[str] = None,
+        budget: Optional[ArticleBudget] = None,
     ) -> int:
         """
         Collects comments + replies for an article and persists them to SQLite.
         Returns number of (top-level + reply) comments stored.
+        first_page is an already-fetched raw page 1 for the same params; it replaces that request.
+        An article cut short by its budget is stored with status PARTIAL instead of SUCCESS.
         """
         logger.info("Collecting comments for %s/%s", oid, aid)
         if self.repository.is_article_completed(oid, aid):
             logger.info("Article %s/%s already SUCCESS, skipping.", oid, aid)
             return 0
 
+        budget = budget or self.budget_for()
         self.structural_detector.record_success()
         total_written = 0
         max_reported_total = 0
+        interrupted: Optional[str] = None
         try:
             page = 1
             seen_cursors: Set[str] = set()
-            while page <= self.MAX_COMMENT_PAGES:
+            while page <= budget.max_comment_pages:
+                if page > 1 and budget.exhausted(total_written):
+                    interrupted = "BUDGET_STOP"
+                    break
                 try:
-                    raw_body = self.fetcher.fetch(
-                        oid=oid,
-                        aid=aid,
-                        page=page,
-                        params=endpoint_params,
-                        scope="comment",
-                        parent_comment_no=None,
-                    )
-                    payload = self.parser.parse_jsonp(raw_body)
-                    self.parser.validate_schema(payload)
+                    if page == 1 and first_page is not None:
+                        raw_body = first_page
+                        self.fetcher.archive_page(oid, aid, 1, endpoint_params, raw_body)
+                    else:
+                        raw_body = self.fetcher.fetch(
+                            oid=oid,
+                            aid=aid,
+                            page=page,
+                            params=endpoint_params,
+                            scope="comment",
+                            parent_comment_no=None,
+                        )
+                    parsed = self.page_processor.process(raw_body, 0, None, self.snapshot_at)
                 except JSONPParseError as err:
                     context = self._structural_context(
                         oid, aid, endpoint_params, source_url, "comment", page
@@ -86,10 +121,8 @@ class CommentCollector:
                     raise
 
                 self.structural_detector.record_success()
-                comments = self.parser.extract_comments(payload)
-                self._validate_comment_payload(
-                    comments,
-                    payload,
+                self._validate_page(
+                    parsed,
                     oid,
                     aid,
                     endpoint_params,
@@ -97,25 +130,30 @@ class CommentCollector:
                     scope="comment",
                     page=page,
                 )
-                reported_total = self.parser.extract_total_count(payload)
-                if reported_total:
-                    max_reported_total = max(max_reported_total, reported_total)
+                if parsed.reported_total:
+                    max_reported_total = max(max_reported_total, parsed.reported_total)
 
-                if not comments:
+                if not parsed.comment_count:
                     break
 
-                records = [self.parser.to_record(c, 0, None, self.snapshot_at) for c in comments]
-                written = self.repository.persist_comments(records, oid, aid)
+                written = self._persist_page(parsed, oid, aid)
                 total_written += written
 
-                for comment in comments:
-                    reply_total = comment.get("replyCount", comment.get("childCount", 0))
-                    if reply_total and int(reply_total) > 0:
-                        total_written += self._collect_replies(
-                            oid, aid, comment, endpoint_params, source_url
-                        )
+                for parent_no, _ in parsed.reply_threads:
+                    if budget.exhausted(total_written):
+                        interrupted = "BUDGET_STOP"
+                        break
+                    written, truncated = self._collect_replies(
+                        oid, aid, parent_no, endpoint_params, source_url, budget, total_written
+                    )
+                    total_written += written
+                    if truncated:
+                        interrupted = truncated
+                        break
+                if interrupted:
+                    break
 
-                cursor = self.parser.extract_cursor(payload)
+                cursor = parsed.cursor
                 if cursor:
                     if cursor in seen_cursors:
                         logger.warning("Cursor repeat detected for %s/%s. Stopping pagination.", oid, aid)
@@ -125,13 +163,29 @@ class CommentCollector:
                 if not cursor:
                     break
                 page += 1
+            else:
+                # Only caps tightened below the configured maximum leave the article incomplete.
+                if budget.max_comment_pages < self.config.collection.page_budget.max_comment_pages:
+                    interrupted = "PAGE_CAP"
 
-            self.repository.set_article_status(oid, aid, status="SUCCESS")
+            self._flush_pages()
+            if interrupted:
+                logger.info("Stopped %s/%s early (%s) after %d comments", oid, aid, interrupted, total_written)
+                self.repository.set_article_status(
+                    oid,
+                    aid,
+                    status="PARTIAL",
+                    error_code=interrupted,
+                    error_message=f"Crawl budget reached after {total_written} comments.",
+                )
+            else:
+                self.repository.set_article_status(oid, aid, status="SUCCESS")
             total_comments = max(total_written, max_reported_total)
             self._maybe_collect_stats(oid, aid, endpoint_params, total_comments)
             return total_written
 
         except AppError as err:
+            self._flush_after_error(oid, aid)
             # Map AppError to DB status
             status = "FAIL-UNKNOWN"
             if err.kind.name == "HTTP":
@@ -142,28 +196,82 @@ class CommentCollector:
             self.repository.set_article_status(oid, aid, status=status, error_message=str(err))
             raise
         except Exception as err:
+            self._flush_after_error(oid, aid)
             # Catch-all for unexpected errors
             self.repository.set_article_status(oid, aid, status="FAIL-HTTP", error_message=f"Unexpected: {err}")
             raise
 
+    def budget_for(
+        self,
+        remaining_comments: Optional[int] = None,
+        should_stop: Optional[Callable[[int], bool]] = None,
+    ) -> ArticleBudget:
+        """
+        Page caps for one article. With page_budget.adaptive, caps shrink to the pages
+        needed for remaining_comments (plus slack) so a nearly met target does not walk
+        hundreds of pages of one thread.
+        """
+        cfg = self.config.collection.page_budget
+        comment_pages, reply_pages = cfg.max_comment_pages, cfg.max_reply_pages
+        if cfg.adaptive and remaining_comments is not None:
+            needed = math.ceil(max(0, remaining_comments) / max(1, cfg.page_size)) + cfg.slack_pages
+            comment_pages = min(comment_pages, max(1, needed))
+            reply_pages = min(reply_pages, max(1, needed))
+        return ArticleBudget(comment_pages, reply_pages, should_stop)
+
     # Internal helpers -----------------------------------------------------------
+    def _persist_page(self, parsed: ParsedPage, oid: str, aid: str) -> int:
+        """
+        Persist a page's rows, or queue it while a worker process builds them. Returns
+        the rows the page yields; waits for the oldest page once max_in_flight are pending.
+        """
+        if parsed.pending is None and not self._in_flight:
+            return self.repository.persist_rows(parsed.rows, oid, aid)
+        self._in_flight.append((parsed, oid, aid))
+        while len(self._in_flight) > self.page_processor.max_in_flight:
+            pending, pending_oid, pending_aid = self._in_flight.popleft()
+            self.repository.persist_rows(self.page_processor.rows(pending), pending_oid, pending_aid)
+        return parsed.row_count
+
+    def _flush_pages(self) -> None:
+        try:
+            while self._in_flight:
+                pending, oid, aid = self._in_flight.popleft()
+                self.repository.persist_rows(self.page_processor.rows(pending), oid, aid)
+        finally:
+            self._in_flight.clear()
+
+    def _flush_after_error(self, oid: str, aid: str) -> None:
+        # Pages fetched before the failure are kept, as they were when persisted inline.
+        try:
+            self._flush_pages()
+        except Exception as exc:
+            logger.warning("Dropped pending comment pages for %s/%s: %s", oid, aid, exc)
+
     def _collect_replies(
         self,
         oid: str,
         aid: str,
-        parent_comment: Dict[str, Any],
+        parent_no: str,
         endpoint_params: Dict[str, str],
         source_url: Optional[str],
-    ) -> int:
-        parent_no = str(parent_comment.get("commentNo"))
+        budget: ArticleBudget,
+        written_before: int = 0,
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Returns (replies written, truncation reason). The reason is BUDGET_STOP or PAGE_CAP
+        when the thread was cut short by the budget, None when it was read to the end.
+        """
         if not parent_no:
-            return 0
+            return 0, None
 
         total_written = 0
         page = 1
         seen_cursors: Set[str] = set()
 
-        while page <= self.MAX_REPLY_PAGES:
+        while page <= budget.max_reply_pages:
+            if page > 1 and budget.exhausted(written_before + total_written):
+                return total_written, "BUDGET_STOP"
             try:
                 raw_body = self.fetcher.fetch(
                     oid=oid,
@@ -173,8 +281,7 @@ class CommentCollector:
                     scope="reply",
                     parent_comment_no=parent_no,
                 )
-                payload = self.parser.parse_jsonp(raw_body)
-                self.parser.validate_schema(payload)
+                parsed = self.page_processor.process(raw_body, 1, parent_no, self.snapshot_at)
             except JSONPParseError as err:
                 context = self._structural_context(
                     oid, aid, endpoint_params, source_url, "reply", page, parent_no
@@ -189,10 +296,8 @@ class CommentCollector:
                 raise
 
             self.structural_detector.record_success()
-            comments = self.parser.extract_comments(payload)
-            self._validate_comment_payload(
-                comments,
-                payload,
+            self._validate_page(
+                parsed,
                 oid,
                 aid,
                 endpoint_params,
@@ -201,13 +306,12 @@ class CommentCollector:
                 page=page,
                 parent_no=parent_no,
             )
-            if not comments:
+            if not parsed.comment_count:
                 break
 
-            records = [self.parser.to_record(c, 1, parent_no, self.snapshot_at) for c in comments]
-            total_written += self.repository.persist_comments(records, oid, aid)
+            total_written += self._persist_page(parsed, oid, aid)
 
-            cursor = self.parser.extract_cursor(payload)
+            cursor = parsed.cursor
             if cursor:
                 if cursor in seen_cursors:
                     logger.warning("Reply cursor repeat for parent %s. Stopping reply pagination.", parent_no)
@@ -217,8 +321,11 @@ class CommentCollector:
             if not cursor:
                 break
             page += 1
+        else:
+            if budget.max_reply_pages < self.config.collection.page_budget.max_reply_pages:
+                return total_written, "PAGE_CAP"
 
-        return total_written
+        return total_written, None
 
     def _maybe_collect_stats(
         self,
@@ -237,6 +344,9 @@ class CommentCollector:
 
         try:
             stats = self.stats_service.fetch_stats(oid, aid, endpoint_params)
+        except CircuitOpenError as err:
+            logger.debug("Skipped stats for %s/%s: %s", oid, aid, err)
+            return
         except AppError as err:
             logger.warning("Failed to fetch stats for %s/%s: %s", oid, aid, err)
             return
@@ -281,10 +391,9 @@ class CommentCollector:
             context["params"] = json.dumps(params, ensure_ascii=False)
         return context
 
-    def _validate_comment_payload(
+    def _validate_page(
         self,
-        comments: List[Dict[str, Any]],
-        payload: Dict[str, Any],
+        parsed: ParsedPage,
         oid: str,
         aid: str,
         params: Dict[str, str],
@@ -293,20 +402,17 @@ class CommentCollector:
         page: int,
         parent_no: Optional[str] = None,
     ) -> None:
-        result_block = payload.get("result")
-        if not isinstance(result_block, dict):
+        if not parsed.has_result_block:
             context = self._structural_context(oid, aid, params, source_url, scope, page, parent_no)
             reason = "Result block missing in comment payload"
             self._raise_structural(reason, context)
 
-        for idx, comment in enumerate(comments):
-            required = ["commentNo", "contents", "regTime"]
-            missing = [field for field in required if not comment.get(field)]
-            if missing:
-                context = self._structural_context(oid, aid, params, source_url, scope, page, parent_no)
-                context["comment_index"] = str(idx)
-                reason = f"Missing fields on comment: {','.join(missing)}"
-                self._raise_structural(reason, context)
+        if parsed.missing_fields is not None:
+            idx, missing = parsed.missing_fields
+            context = self._structural_context(oid, aid, params, source_url, scope, page, parent_no)
+            context["comment_index"] = str(idx)
+            reason = f"Missing fields on comment: {','.join(missing)}"
+            self._raise_structural(reason, context)
 
     def _raise_structural(self, reason: str, context: Dict[str, str]) -> None:
         try:
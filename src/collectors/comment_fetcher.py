@@ -1,4 +1,5 @@
 import logging
+import time
 import requests
 from typing import Dict, Any, Optional
 from ..config import AppConfig
@@ -6,6 +7,7 @@ from ..ops.rate_limiter import RateLimiter
 from ..ops.throttle import AutoThrottler
 from ..ops.evidence import EvidenceCollector
 from ..interfaces import IHttpClient
+from ..storage.response_archive import ResponseArchive
 from ..common.errors import AppError, Severity, ErrorKind
 
 logger = logging.getLogger(__name__)
@@ -19,13 +21,15 @@ class CommentFetcher:
         rate_limiter: RateLimiter,
         throttler: AutoThrottler,
         evidence: EvidenceCollector,
-        config: AppConfig
+        config: AppConfig,
+        archive: Optional[ResponseArchive] = None,
     ):
         self.http_client = http_client
         self.rate_limiter = rate_limiter
         self.throttler = throttler
         self.evidence = evidence
         self.config = config
+        self.archive = archive
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
             "Referer": "https://n.news.naver.com/",
@@ -40,12 +44,14 @@ class CommentFetcher:
         page: int,
         params: Dict[str, str],
         scope: str,
-        parent_comment_no: Optional[str]
+        parent_comment_no: Optional[str],
+        purpose: str = "crawl",
     ) -> str:
         query = self._build_query_params(oid, aid, page, params, scope, parent_comment_no)
         
         self.rate_limiter.wait()
         try:
+            started = time.monotonic()
             # Using http_client.request assuming it behaves like requests.Session.request
             response = self.http_client.request(
                 "GET",
@@ -57,6 +63,19 @@ class CommentFetcher:
                     self.config.collection.timeout.read,
                 ),
             )
+            latency = time.monotonic() - started
+        except requests.Timeout as exc:
+            # Reported apart from other network failures so timeout retries can be counted.
+            self.evidence.log_failed_request(
+                method="GET",
+                url=self.API_URL,
+                status_code=0,
+                error_type="TIMEOUT",
+                headers=self.headers,
+                context={"scope": scope, "oid": oid, "aid": aid, "page": page, "params": query},
+                response_body=None
+            )
+            raise AppError(f"Request timed out: {exc}", Severity.RETRY, ErrorKind.HTTP, original_exception=exc)
         except requests.RequestException as exc:
             self.evidence.log_failed_request(
                 method="GET",
@@ -69,7 +88,7 @@ class CommentFetcher:
             )
             raise AppError(f"Network request failed: {exc}", Severity.RETRY, ErrorKind.HTTP, original_exception=exc)
 
-        self.throttler.observe(response.status_code)
+        self.throttler.observe(response.status_code, latency=latency)
 
         if response.status_code >= 400:
             self.evidence.log_failed_request(
@@ -86,8 +105,22 @@ class CommentFetcher:
             
             raise AppError(f"HTTP {response.status_code}", Severity.RETRY, ErrorKind.HTTP)
 
+        if self.archive is not None:
+            self.archive.record(
+                scope, oid, aid, page, query, response.text,
+                status_code=response.status_code, parent=parent_comment_no, purpose=purpose,
+            )
         return response.text
 
+    def archive_page(self, oid: str, aid: str, page: int, params: Dict[str, str], body: str) -> None:
+        """
+        Archive a comment page the crawl used without fetching it, such as the volume
+        gate's page 1, so the archive holds every page the crawl consumed.
+        """
+        if self.archive is not None:
+            query = self._build_query_params(oid, aid, page, params, "comment", None)
+            self.archive.record("comment", oid, aid, page, query, body)
+
     def fetch_page(
         self,
         oid: str,
@@ -1,16 +1,26 @@
 import json
 import re
+import time
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from pydantic import BaseModel, ValidationError
 from ..config import AppConfig
 from ..common.errors import AppError, Severity, ErrorKind
 from ..privacy.hashing import PrivacyHasher
 
+try:  # Optional: vectorized epoch conversion
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is not a hard dependency
+    np = None
+
 logger = logging.getLogger(__name__)
 
+_ISO_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+_MIN_EPOCH_SECONDS = 946684800  # 2000-01-01T00:00:00Z, older values are treated as anomalies
+_FUTURE_TOLERANCE_SECONDS = 86400
+
 # --- Pydantic Models for Design by Contract ---
 class NaverComment(BaseModel):
     commentNo: str
@@ -27,6 +37,26 @@ class NaverCommentResponse(BaseModel):
     result: NaverCommentListResult
 # ----------------------------------------------
 
+class CommentRow(NamedTuple):
+    """
+    Insert-ready comment row. Field order matches the column list used by
+    CommentRepository.persist_rows so rows can be handed to executemany as-is.
+    """
+    comment_no: str
+    parent_comment_no: Optional[str]
+    depth: int
+    contents: Optional[str]
+    author_hash: Optional[str]
+    author_raw: Optional[str]
+    reg_time: Optional[str]
+    crawl_at: str
+    snapshot_at: str
+    sympathy_count: int
+    antipathy_count: int
+    reply_count: int
+    is_deleted: int
+    is_blind: int
+
 class JSONPParseError(AppError):
     def __init__(self, message: str):
         super().__init__(message, Severity.WARN, ErrorKind.PARSE)
@@ -40,6 +70,10 @@ class CommentParser:
         self.config = config
         self.hasher = hasher
         self.tz = ZoneInfo("Asia/Seoul")
+        # Asia/Seoul has no DST, so a fixed offset is exact and avoids per-value zone lookups.
+        self.fixed_tz = timezone(datetime.now(self.tz).utcoffset())
+        self._offset_suffix = datetime.now(self.fixed_tz).isoformat()[-6:]
+        self.timestamp_anomalies = 0
 
     def parse_jsonp(self, body: str) -> Dict[str, Any]:
         text = body.strip()
@@ -123,15 +157,105 @@ class CommentParser:
             "is_blind": 1 if comment.get("isBlind") else 0,
         }
 
-    def _normalize_time(self, value: Optional[str]) -> Optional[str]:
-        if not value: return None
-        try:
+    def page_to_rows(
+        self,
+        comments: List[Dict[str, Any]],
+        depth: int,
+        parent: Optional[str],
+        snapshot_at: str,
+    ) -> List[CommentRow]:
+        """
+        Convert one page of raw comments into insert-ready rows in a single pass.
+        crawl_at is stamped once per page; author_raw is only read when PII is allowed.
+        """
+        if not comments:
+            return []
+
+        crawl_at = datetime.now(self.tz).isoformat()
+        hash_identifier = self.hasher.hash_identifier
+        allow_pii = self.config.privacy.allow_pii
+        reg_times, anomalies = self.normalize_times([comment.get("regTime") for comment in comments])
+        self.timestamp_anomalies += anomalies
+
+        rows: List[CommentRow] = []
+        append = rows.append
+        for comment, reg_time in zip(comments, reg_times):
+            get = comment.get
+            append(
+                CommentRow(
+                    str(get("commentNo")),
+                    parent,
+                    depth,
+                    get("contents"),
+                    hash_identifier(get("userId") or get("profileUserId")),
+                    get("userName") if allow_pii else None,
+                    reg_time,
+                    crawl_at,
+                    snapshot_at,
+                    int(get("sympathyCount", 0) or 0),
+                    int(get("antipathyCount", 0) or 0),
+                    int(get("replyCount", get("childCount", 0)) or 0),
+                    1 if get("isDeleted") else 0,
+                    1 if get("isBlind") else 0,
+                )
+            )
+        return rows
+
+    def normalize_times(self, values: Sequence[Optional[str]]) -> Tuple[List[Optional[str]], int]:
+        """
+        Normalize a page of regTime values in one batch.
+        Epoch strings (seconds or milliseconds) become ISO-8601 in the fixed KST offset;
+        ISO strings pass through unchanged. Returns (normalized, anomaly_count) where an
+        anomaly is a missing, unrecognized or out-of-range timestamp. Out-of-range epochs
+        are kept as the raw string rather than converted, since they may not fit a datetime.
+        """
+        normalized: List[Optional[str]] = [None] * len(values)
+        anomalies = 0
+        epoch_index: List[int] = []
+        epoch_micros: List[int] = []
+        upper_bound = (time.time() + _FUTURE_TOLERANCE_SECONDS) * 1_000_000
+        lower_bound = _MIN_EPOCH_SECONDS * 1_000_000
+
+        for idx, value in enumerate(values):
+            if not value:
+                anomalies += 1
+                continue
+            if not isinstance(value, str):
+                value = str(value)
             if value.isdigit():
-                timestamp = int(value)
-                if len(value) > 10: timestamp = timestamp / 1000
-                dt = datetime.fromtimestamp(timestamp, tz=self.tz)
-                return dt.isoformat()
-        except Exception:
-            pass
-        # Simplified for brevity, assume ISO or similar if not epoch
-        return value
+                micros = int(value) * (1000 if len(value) > 10 else 1_000_000)
+                if not lower_bound <= micros <= upper_bound:
+                    anomalies += 1
+                    normalized[idx] = value
+                    continue
+                epoch_index.append(idx)
+                epoch_micros.append(micros)
+                continue
+            if not _ISO_TIMESTAMP_RE.match(value):
+                anomalies += 1
+            normalized[idx] = value
+
+        if epoch_micros:
+            for idx, iso in zip(epoch_index, self._format_epoch_micros(epoch_micros)):
+                normalized[idx] = iso
+        return normalized, anomalies
+
+    def _format_epoch_micros(self, micros: List[int]) -> List[str]:
+        offset_us = int(self.fixed_tz.utcoffset(None).total_seconds()) * 1_000_000
+        suffix = self._offset_suffix
+        if np is not None:
+            local = (np.asarray(micros, dtype="int64") + offset_us).astype("datetime64[us]")
+            texts = np.datetime_as_string(local, unit="us").tolist()
+        else:
+            tz = self.fixed_tz
+            texts = []
+            for us in micros:
+                local = datetime.fromtimestamp(us // 1_000_000, tz=tz).replace(microsecond=us % 1_000_000)
+                texts.append(local.replace(tzinfo=None).isoformat(timespec="microseconds"))
+        # datetime.isoformat omits a zero microsecond component; keep that output shape.
+        return [(text[:-7] if text.endswith(".000000") else text) + suffix for text in texts]
+
+    def _normalize_time(self, value: Optional[str]) -> Optional[str]:
+        normalized, anomalies = self.normalize_times([value])
+        self.timestamp_anomalies += anomalies
+        return normalized[0]
@@ -1,10 +1,11 @@
 import logging
 from typing import Any, Callable, Dict, Optional
 
-from ..common.errors import AppError, ErrorKind, Severity
+from ..common.errors import AppError, ErrorKind, Severity, is_timeout
 from ..config import CommentStatsConfig
 from ..interfaces import IHttpClient
 from ..ops.evidence import EvidenceCollector
+from ..storage.response_archive import ResponseArchive
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +22,13 @@ class CommentStatsService:
         evidence: EvidenceCollector,
         config: CommentStatsConfig,
         parse_jsonp: Callable[[str], Dict[str, Any]],
+        archive: Optional[ResponseArchive] = None,
     ):
         self.http_client = http_client
         self.evidence = evidence
         self.config = config
         self.parse_jsonp = parse_jsonp
+        self.archive = archive
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
             "Referer": "https://n.news.naver.com/",
@@ -33,7 +36,9 @@ class CommentStatsService:
         }
         self.url = config.stats_endpoint
 
-    def fetch_stats(self, oid: str, aid: str, endpoint_params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    def fetch_stats(
+        self, oid: str, aid: str, endpoint_params: Dict[str, str], purpose: str = "crawl"
+    ) -> Optional[Dict[str, Any]]:
         if not self.config.enabled:
             return None
 
@@ -46,12 +51,15 @@ class CommentStatsService:
                 params=query,
                 timeout=10,
             )
+        except AppError:
+            # Raised before any request was sent (e.g. an open circuit); nothing to record.
+            raise
         except Exception as exc:  # broad to capture network failures without requests dependency
             self.evidence.log_failed_request(
                 method="GET",
                 url=self.url,
                 status_code=0,
-                error_type="REQUEST_EXCEPTION",
+                error_type="TIMEOUT" if is_timeout(exc) else "REQUEST_EXCEPTION",
                 headers=self.headers,
                 context={"oid": oid, "aid": aid, "params": query, "scope": "comment_stats"},
                 response_body=None,
@@ -71,9 +79,14 @@ class CommentStatsService:
             )
             raise AppError(f"Stats HTTP {response.status_code}", Severity.WARN, ErrorKind.HTTP)
 
+        if self.archive is not None:
+            self.archive.record(
+                "comment_stats", oid, aid, 1, query, response.text,
+                status_code=response.status_code, purpose=purpose,
+            )
         payload = self.parse_jsonp(response.text)
         try:
-            return self._normalize(payload)
+            return self.normalize(payload)
         except Exception as exc:
             raise AppError(f"Invalid stats payload: {exc}", Severity.WARN, ErrorKind.PARSE, original_exception=exc)
 
@@ -90,9 +103,13 @@ class CommentStatsService:
                 query[optional] = params[optional]
         return query
 
-    def _normalize(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def normalize(cls, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Stats record from a parsed stats payload; also used when reparsing archived bodies.
+        """
         result = payload.get("result") or {}
-        total = self._coerce_int(
+        total = cls._coerce_int(
             result.get("commentCount")
             or result.get("realCommentCount")
             or (result.get("count") or {}).get("comment")
@@ -102,7 +119,7 @@ class CommentStatsService:
         gender_map = {"male": 0.0, "female": 0.0}
         for entry in result.get("commentByGender", []):
             gender = (entry.get("gender") or "").upper()
-            ratio = self._coerce_float(entry.get("ratio"))
+            ratio = cls._coerce_float(entry.get("ratio"))
             if gender == "M":
                 gender_map["male"] = ratio
             elif gender == "F":
@@ -112,7 +129,7 @@ class CommentStatsService:
         for entry in result.get("commentByAge", []):
             age_key = str(entry.get("age"))
             if age_key in age_map:
-                age_map[age_key] = self._coerce_float(entry.get("ratio"))
+                age_map[age_key] = cls._coerce_float(entry.get("ratio"))
 
         return {
             "total_comments": total,
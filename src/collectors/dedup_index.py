@@ -0,0 +1,125 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+AID_BITS = 40
+OID_LIMIT = 1 << (64 - AID_BITS)
+MASK_BITS = 64
+
+
+class DedupIndex:
+    """
+    Compact record of the articles a search has already emitted, and which
+    keywords matched each one.
+
+    Articles are stored as integer-packed (oid, aid) keys with a keyword bitmask;
+    item payloads are not kept. New keys go to a small dict that is periodically
+    merged into parallel sorted arrays of keys and masks, so memory grows by about
+    16 bytes per article. Articles without numeric ids fall back to a URL dict.
+
+    Not thread-safe; callers serialize access.
+    """
+
+    MERGE_THRESHOLD = 4096
+
+    def __init__(self):
+        self._keys = array("Q")
+        self._masks = array("Q")
+        self._pending: Dict[int, int] = {}
+        self._by_url: Dict[str, int] = {}
+        self._keyword_bits: Dict[str, int] = {}
+        self._keyword_names: List[str] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, oid: Optional[str], aid: Optional[str], url: str, keyword: str) -> bool:
+        """
+        Record that keyword matched the article. Returns True the first time the article is seen.
+        """
+        bit = self._keyword_bit(keyword)
+        key = self.pack(oid, aid)
+        if key is None:
+            fallback = f"{oid}:{aid}" if oid and aid else url
+            seen = fallback in self._by_url
+            self._by_url[fallback] = self._by_url.get(fallback, 0) | bit
+            if not seen:
+                self._count += 1
+            return not seen
+
+        index = self._find(key)
+        if index is not None and bit < (1 << MASK_BITS):
+            self._masks[index] |= bit
+            return False
+        if index is not None:
+            # Keywords past the 64th do not fit the array masks; keep them alongside.
+            self._pending[key] = self._pending.get(key, 0) | bit
+            return False
+        if key in self._pending:
+            self._pending[key] |= bit
+            return False
+
+        self._pending[key] = bit
+        self._count += 1
+        if len(self._pending) >= self.MERGE_THRESHOLD:
+            self._merge()
+        return True
+
+    def keywords_for(self, oid: Optional[str], aid: Optional[str], url: str = "") -> List[str]:
+        key = self.pack(oid, aid)
+        if key is None:
+            mask = self._by_url.get(f"{oid}:{aid}" if oid and aid else url, 0)
+        else:
+            index = self._find(key)
+            mask = self._pending.get(key, 0)
+            if index is not None:
+                mask |= self._masks[index]
+        return [name for position, name in enumerate(self._keyword_names) if mask >> position & 1]
+
+    @staticmethod
+    def pack(oid: Optional[str], aid: Optional[str]) -> Optional[int]:
+        """
+        Pack numeric (oid, aid) into one 64-bit key. Naver ids are fixed-width digit
+        strings, so dropping their leading zeros does not merge distinct articles.
+        """
+        if not oid or not aid or not oid.isdigit() or not aid.isdigit():
+            return None
+        oid_value, aid_value = int(oid), int(aid)
+        if oid_value >= OID_LIMIT or aid_value >> AID_BITS:
+            return None
+        return oid_value << AID_BITS | aid_value
+
+    def _keyword_bit(self, keyword: str) -> int:
+        bit = self._keyword_bits.get(keyword)
+        if bit is None:
+            bit = 1 << len(self._keyword_names)
+            self._keyword_bits[keyword] = bit
+            self._keyword_names.append(keyword)
+        return bit
+
+    def _find(self, key: int) -> Optional[int]:
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return None
+
+    def _merge(self) -> None:
+        low = (1 << MASK_BITS) - 1
+        pending = self._pending
+        new_keys = sorted(key for key in pending if self._find(key) is None)
+        if new_keys:
+            old_keys, old_masks = self._keys, self._masks
+            keys, masks = array("Q"), array("Q")
+            cursor = 0
+            for key in new_keys:
+                split = bisect_left(old_keys, key, cursor)
+                keys.extend(old_keys[cursor:split])
+                masks.extend(old_masks[cursor:split])
+                keys.append(key)
+                masks.append(pending[key] & low)
+                cursor = split
+            keys.extend(old_keys[cursor:])
+            masks.extend(old_masks[cursor:])
+            self._keys, self._masks = keys, masks
+        self._pending = {key: mask & ~low for key, mask in pending.items() if mask >> MASK_BITS}
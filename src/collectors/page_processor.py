@@ -0,0 +1,195 @@
+import logging
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import AppConfig
+from ..privacy.factory import hasher_from_salt
+from .comment_parser import CommentParser, CommentRow
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COMMENT_FIELDS = ("commentNo", "contents", "regTime")
+
+
+@dataclass
+class ParsedPage:
+    """
+    Everything the collector needs from one raw comment page, without the payload itself.
+    """
+
+    rows: List[CommentRow] = field(default_factory=list)
+    # (commentNo, reply total) for comments that have replies, in page order.
+    reply_threads: List[Tuple[str, int]] = field(default_factory=list)
+    cursor: Optional[str] = None
+    reported_total: int = 0
+    comment_count: int = 0
+    has_result_block: bool = True
+    # (index, missing field names) of the first comment lacking a required field.
+    missing_fields: Optional[Tuple[int, List[str]]] = None
+    # Rows still being built in a worker process: (rows, timestamp anomalies).
+    pending: Optional["Future[Tuple[List[CommentRow], int]]"] = None
+
+    @property
+    def row_count(self) -> int:
+        """Rows the page yields, known before pending rows are built."""
+        if self.pending is not None:
+            return self.comment_count
+        return len(self.rows)
+
+
+def scan_page(parser: CommentParser, raw_body: str) -> Tuple[ParsedPage, List[Dict[str, Any]]]:
+    """
+    Parse and validate one page and read what pagination needs (cursor, totals,
+    reply threads), without building rows. Returns the page and its raw comments.
+    Raises JSONPParseError / SchemaMismatchError like the parser does.
+    """
+    payload = parser.parse_jsonp(raw_body)
+    parser.validate_schema(payload)
+    comments = parser.extract_comments(payload)
+
+    missing_fields = None
+    for index, comment in enumerate(comments):
+        missing = [name for name in REQUIRED_COMMENT_FIELDS if not comment.get(name)]
+        if missing:
+            missing_fields = (index, missing)
+            break
+
+    reply_threads = []
+    for comment in comments:
+        reply_total = comment.get("replyCount", comment.get("childCount", 0))
+        if reply_total and int(reply_total) > 0:
+            reply_threads.append((str(comment.get("commentNo")), int(reply_total)))
+
+    page = ParsedPage(
+        reply_threads=reply_threads,
+        cursor=parser.extract_cursor(payload),
+        reported_total=parser.extract_total_count(payload),
+        comment_count=len(comments),
+        has_result_block=isinstance(payload.get("result"), dict),
+        missing_fields=missing_fields,
+    )
+    return page, comments
+
+
+def process_page(
+    parser: CommentParser,
+    raw_body: str,
+    depth: int,
+    parent: Optional[str],
+    snapshot_at: str,
+) -> ParsedPage:
+    """
+    Parse, validate, hash and normalize one page: all of the per-page CPU work.
+    Raises JSONPParseError / SchemaMismatchError like the parser does.
+    """
+    page, comments = scan_page(parser, raw_body)
+    if comments and page.missing_fields is None:
+        page.rows = parser.page_to_rows(comments, depth, parent, snapshot_at)
+    return page
+
+
+class IPageProcessor(ABC):
+    """Turns raw comment pages into insert-ready rows."""
+
+    # Pages whose rows may still be building before the caller must wait for one.
+    max_in_flight = 0
+
+    @abstractmethod
+    def process(self, raw_body: str, depth: int, parent: Optional[str], snapshot_at: str) -> ParsedPage:
+        pass
+
+    def rows(self, page: ParsedPage) -> List[CommentRow]:
+        """
+        The page's rows, waiting for them if they are still being built.
+        """
+        return page.rows
+
+    def close(self) -> None:
+        pass
+
+
+class InlinePageProcessor(IPageProcessor):
+    """Processes pages on the calling thread with the collector's own parser."""
+
+    def __init__(self, parser: CommentParser):
+        self.parser = parser
+
+    def process(self, raw_body: str, depth: int, parent: Optional[str], snapshot_at: str) -> ParsedPage:
+        return process_page(self.parser, raw_body, depth, parent, snapshot_at)
+
+
+# Worker-process state, set once per worker by _init_worker.
+_worker_parser: Optional[CommentParser] = None
+
+
+def _init_worker(config: AppConfig, salt: str) -> None:
+    global _worker_parser
+    _worker_parser = CommentParser(config, hasher_from_salt(config.privacy, salt))
+
+
+def _rows_in_worker(raw_body: str, depth: int, parent: Optional[str], snapshot_at: str) -> Tuple[List[CommentRow], int]:
+    parser = _worker_parser
+    before = parser.timestamp_anomalies
+    # The calling process already validated this body; only the rows are built here.
+    comments = parser.extract_comments(parser.parse_jsonp(raw_body))
+    rows = parser.page_to_rows(comments, depth, parent, snapshot_at)
+    return rows, parser.timestamp_anomalies - before
+
+
+class ProcessPoolPageProcessor(IPageProcessor):
+    """
+    Builds comment rows (hashing and timestamp normalization) in a process pool.
+
+    process() parses and validates the page in the calling process, so the cursor,
+    totals and reply threads the crawl needs next are available at once, and submits
+    row building to the pool. The collector keeps up to max_in_flight pages pending
+    and persists them in order as they finish, so several workers stay busy while
+    the crawl thread fetches.
+
+    Each worker builds its own CommentParser and hasher once, from the run config and
+    salt, so hashes match the inline path. Timestamp anomalies counted in the workers
+    are added back to the collector's parser when the rows are collected.
+
+    Workers are spawned, not forked: they start lazily on the first page, when search
+    lookahead, archive writer and lease heartbeat threads may hold locks a fork would copy.
+    """
+
+    def __init__(self, config: AppConfig, salt: str, parser: CommentParser, workers: int = 0):
+        self.parser = parser
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = self.workers * 2
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config, salt),
+        )
+        logger.info("Comment page processing offloaded to %d worker process(es).", self.workers)
+
+    def process(self, raw_body: str, depth: int, parent: Optional[str], snapshot_at: str) -> ParsedPage:
+        page, comments = scan_page(self.parser, raw_body)
+        if comments and page.missing_fields is None:
+            page.pending = self._pool.submit(_rows_in_worker, raw_body, depth, parent, snapshot_at)
+        return page
+
+    def rows(self, page: ParsedPage) -> List[CommentRow]:
+        if page.pending is None:
+            return page.rows
+        rows, anomalies = page.pending.result()
+        page.rows, page.pending = rows, None
+        self.parser.timestamp_anomalies += anomalies
+        return rows
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def build_page_processor(config: AppConfig, salt: str, parser: CommentParser) -> IPageProcessor:
+    settings = config.collection.page_processing
+    if settings.mode == "process_pool":
+        return ProcessPoolPageProcessor(config, salt, parser, workers=settings.workers)
+    return InlinePageProcessor(parser)
@@ -0,0 +1,233 @@
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..common.errors import AppError
+from ..config import AppConfig
+from ..privacy.factory import hasher_from_salt
+from ..storage.db import Database
+from ..storage.repository import UPSERT_COMMENT_SQL, UPSERT_COMMENT_STATS_SQL, comment_stats_params
+from ..storage.response_archive import INDEX_FILENAME, read_member
+from .comment_parser import CommentParser, CommentRow
+from .comment_stats import CommentStatsService
+from .page_processor import process_page
+
+logger = logging.getLogger(__name__)
+
+# One task per gzip member of the archive.
+Member = Tuple[str, int]
+
+
+@dataclass
+class MemberResult:
+    # (oid, aid, rows) per archived comment or reply page.
+    pages: List[Tuple[str, str, List[CommentRow]]] = field(default_factory=list)
+    # (oid, aid, stats record, fetched_at) per archived stats body.
+    stats: List[Tuple[str, str, Dict[str, Any], Optional[str]]] = field(default_factory=list)
+    errors: int = 0
+    anomalies: int = 0
+
+
+@dataclass
+class ReparseSummary:
+    members: int = 0
+    pages: int = 0
+    comments: int = 0
+    stats: int = 0
+    errors: int = 0
+    anomalies: int = 0
+
+
+def reparse_member(parser: CommentParser, segment: str, offset: int, snapshot_at: str) -> MemberResult:
+    """
+    Run the crawl-time parse/validate/hash path over every record of one archive member.
+    Pages that fail to parse are counted, not raised, so one bad body does not stop a rebuild.
+    Gate and estimator lookups are skipped: the crawl never stored them as comments.
+    """
+    result = MemberResult()
+    before = parser.timestamp_anomalies
+    for record in read_member(Path(segment), offset):
+        if record.get("status_code", 200) >= 400 or record.get("purpose", "crawl") != "crawl":
+            continue
+        oid, aid, scope = record["oid"], record["aid"], record["scope"]
+        try:
+            if scope == "comment_stats":
+                stats = CommentStatsService.normalize(parser.parse_jsonp(record["body"]))
+                result.stats.append((oid, aid, stats, record.get("fetched_at")))
+                continue
+            depth = 1 if scope == "reply" else 0
+            page = process_page(parser, record["body"], depth, record.get("parent"), snapshot_at)
+        except AppError as exc:
+            result.errors += 1
+            logger.debug("Unparseable %s page %s/%s p%s: %s", scope, oid, aid, record.get("page"), exc)
+            continue
+        if page.missing_fields is not None:
+            result.errors += 1
+            continue
+        result.pages.append((oid, aid, page.rows))
+    result.anomalies = parser.timestamp_anomalies - before
+    return result
+
+
+# Worker-process state, set once per worker by _init_worker.
+_worker_parser: Optional[CommentParser] = None
+_worker_snapshot_at: str = ""
+
+
+def _init_worker(config: AppConfig, salt: str, snapshot_at: str) -> None:
+    global _worker_parser, _worker_snapshot_at
+    _worker_parser = CommentParser(config, hasher_from_salt(config.privacy, salt))
+    _worker_snapshot_at = snapshot_at
+
+
+def _reparse_in_worker(member: Member) -> MemberResult:
+    return reparse_member(_worker_parser, member[0], member[1], _worker_snapshot_at)
+
+
+class ArchiveReparser:
+    """
+    Rebuilds one run's comments and stats from its ResponseArchive, with no network.
+
+    Archive members are parsed in a process pool (each worker builds its own parser
+    and hasher from the config and salt, as ProcessPoolPageProcessor does) and the
+    results are bulk-loaded into a fresh DB opened with the bulk SQLite profile, on a
+    single connection that commits every commit_every members.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        salt: str,
+        run_id: str,
+        snapshot_at: str,
+        workers: int = 0,
+        commit_every: int = 50,
+    ):
+        self.config = config
+        self.salt = salt
+        self.run_id = run_id
+        self.snapshot_at = snapshot_at
+        self.workers = workers or os.cpu_count() or 1
+        self.commit_every = max(1, commit_every)
+
+    def run(self, archive_dir: Path, target_path: str, source: Optional[Database] = None) -> ReparseSummary:
+        if Path(target_path).exists():
+            raise FileExistsError(f"Reparse target {target_path} already exists; pick a fresh path.")
+        target = Database(target_path, bulk=True)
+        target.init_schema()
+        members = list_members(Path(archive_dir))
+        logger.info("Reparsing %d archive member(s) from %s with %d worker(s)", len(members), archive_dir, self.workers)
+
+        summary = ReparseSummary()
+        conn = target.get_connection()
+        try:
+            self._start_run(conn, source)
+            for result in self._results(members):
+                self._load(conn, result, summary)
+                if summary.members % self.commit_every == 0:
+                    conn.commit()
+            self._finish_run(conn, archive_dir, summary)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        logger.info("Reparse finished: %s", summary)
+        return summary
+
+    def _results(self, members: List[Member]) -> Iterator[MemberResult]:
+        if self.workers == 1:
+            parser = CommentParser(self.config, hasher_from_salt(self.config.privacy, self.salt))
+            for segment, offset in members:
+                yield reparse_member(parser, segment, offset, self.snapshot_at)
+            return
+        with Pool(self.workers, initializer=_init_worker, initargs=(self.config, self.salt, self.snapshot_at)) as pool:
+            # imap keeps the members' index order, so a page fetched twice ends with its later body.
+            yield from pool.imap(_reparse_in_worker, members, chunksize=4)
+
+    def _load(self, conn: sqlite3.Connection, result: MemberResult, summary: ReparseSummary) -> None:
+        articles = {(oid, aid) for oid, aid, _ in result.pages} | {(oid, aid) for oid, aid, _, _ in result.stats}
+        conn.executemany(
+            "INSERT OR IGNORE INTO articles (run_id, oid, aid, status) VALUES (?, ?, ?, 'SUCCESS')",
+            [(self.run_id, oid, aid) for oid, aid in articles],
+        )
+        run_id = self.run_id
+        for oid, aid, rows in result.pages:
+            # The parser only fills author_raw when PII is allowed.
+            prefix = (run_id, oid, aid)
+            conn.executemany(UPSERT_COMMENT_SQL, [prefix + row for row in rows])
+            summary.comments += len(rows)
+        conn.executemany(
+            UPSERT_COMMENT_STATS_SQL,
+            [
+                comment_stats_params(run_id, oid, aid, stats, self.snapshot_at, fetched_at)
+                for oid, aid, stats, fetched_at in result.stats
+            ],
+        )
+        summary.members += 1
+        summary.pages += len(result.pages)
+        summary.stats += len(result.stats)
+        summary.errors += result.errors
+        summary.anomalies += result.anomalies
+
+    def _start_run(self, conn: sqlite3.Connection, source: Optional[Database]) -> None:
+        """
+        Copy the run row and article metadata from the source DB when there is one.
+        """
+        if source is not None and source.db_path.exists():
+            conn.execute("ATTACH DATABASE ? AS source", (str(source.db_path),))
+            conn.execute("INSERT OR IGNORE INTO main.runs SELECT * FROM source.runs WHERE run_id = ?", (self.run_id,))
+            conn.execute(
+                "INSERT OR IGNORE INTO main.articles SELECT * FROM source.articles WHERE run_id = ?",
+                (self.run_id,),
+            )
+            conn.commit()
+            conn.execute("DETACH DATABASE source")
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO runs (run_id, snapshot_at, start_at, timezone)
+            VALUES (?, ?, ?, ?)
+            """,
+            (self.run_id, self.snapshot_at, self.snapshot_at, self.config.snapshot.timezone),
+        )
+
+    def _finish_run(self, conn: sqlite3.Connection, archive_dir: Path, summary: ReparseSummary) -> None:
+        articles = conn.execute("SELECT COUNT(*) FROM articles WHERE run_id = ?", (self.run_id,)).fetchone()[0]
+        comments = conn.execute("SELECT COUNT(*) FROM comments WHERE run_id = ?", (self.run_id,)).fetchone()[0]
+        conn.execute(
+            """
+            UPDATE runs
+            SET total_articles = ?, total_comments = ?,
+                notes = COALESCE(notes || ' | ', '') || ?
+            WHERE run_id = ?
+            """,
+            (articles, comments, f"reparsed_from={archive_dir} errors={summary.errors}", self.run_id),
+        )
+
+
+def list_members(archive_dir: Path) -> List[Member]:
+    """
+    (segment path, member offset) for every indexed member, in the order members were
+    indexed. Segment names sort by process id, not by time, when several workers
+    archived into one directory.
+    """
+    index_path = Path(archive_dir) / INDEX_FILENAME
+    if not index_path.exists():
+        raise FileNotFoundError(f"No response archive index at {index_path}")
+    conn = Database(str(index_path), wal_mode=False).get_connection()
+    try:
+        rows = conn.execute(
+            """
+            SELECT segment, member_offset FROM archive_index
+            GROUP BY segment, member_offset
+            ORDER BY MIN(rowid)
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(str(Path(archive_dir) / row["segment"]), row["member_offset"]) for row in rows]
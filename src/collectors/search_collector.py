@@ -1,22 +1,49 @@
+import math
 import time
 import logging
 import re
-from typing import Dict, Any, Generator, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Any, Generator, List, Optional
 from urllib.parse import urlparse, parse_qs
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from ..config import SearchConfig
+from .dedup_index import DedupIndex
+from .search_planner import DateSlice, parse_date_range, plan_date_slices
+from src.storage.search_cache import SearchCache, SearchCacheKey
 from src.interfaces import IHttpClient
 from src.http.client import RequestsHttpClient
 
 logger = logging.getLogger(__name__)
 
+# One result link per list item: the first a.news_tit under each ul.list_news > li.
+_RESULT_LINKS_XPATH = etree.XPath(
+    '//ul[contains(concat(" ", normalize-space(@class), " "), " list_news ")]/li'
+    '/descendant::a[contains(concat(" ", normalize-space(@class), " "), " news_tit ")][1]'
+)
+
 class SearchCollector:
-    def __init__(self, config: SearchConfig, http_client: IHttpClient):
+    OPENAPI_PAGE_SIZE = 100 # Max allowed by Naver
+    OPENAPI_MAX_START = 1000 # Naver limits start to 1000
+    FALLBACK_MAX_START = 4000
+    FALLBACK_PAGE_SIZE = 10
+
+    def __init__(self, config: SearchConfig, http_client: IHttpClient, cache: Optional[SearchCache] = None):
         self.config = config
+        self.cache = cache
+        self._date_window = parse_date_range(config.date_range)
         self.base_url = "https://openapi.naver.com/v1/search/news.json"
         self.fallback_url = "https://search.naver.com/search.naver"
-        # Keep track of deduplicated articles so repeated keywords don't emit duplicates
-        self._dedup_index: Dict[str, Dict[str, Any]] = {}
+        # Keep track of deduplicated articles so repeated keywords don't emit duplicates.
+        # Only ids and keyword membership are kept; item payloads stay with the consumer.
+        self._dedup_index = DedupIndex()
+        self._dedup_lock = threading.Lock()
+        # Shared by every keyword searched through this collector, so concurrent
+        # keywords stay within one search-host request budget.
+        self._host_slots = threading.BoundedSemaphore(max(1, config.max_concurrent))
         self.http_client = http_client
         
     def extract_oid_aid(self, url: str) -> Dict[str, str]:
@@ -45,159 +72,281 @@ class SearchCollector:
             return f"https://n.news.naver.com/mnews/article/{ids['oid']}/{ids['aid']}"
         return url
 
-    def _make_dedup_key(self, oid: Optional[str], aid: Optional[str], url: str) -> str:
-        """
-        Choose dedup key using (oid, aid) when available, else normalized URL.
-        """
-        if oid and aid:
-            return f"{oid}:{aid}"
-        return self.normalize_url(url)
-
     def _register_article(self, entry: Dict[str, Any], keyword: str) -> bool:
         """
         Returns True if the article is new and should be yielded.
-        Updates matched_keywords if the article was already seen.
+        Records the keyword match either way; see matched_keywords.
+        Safe to call from concurrent keyword searches.
         """
-        dedup_key = self._make_dedup_key(entry.get("oid"), entry.get("aid"), entry.get("url", ""))
-        existing = self._dedup_index.get(dedup_key)
-        if existing:
-            if keyword not in existing["matched_keywords"]:
-                existing["matched_keywords"].append(keyword)
-            return False
+        url = entry.get("url", "")
+        with self._dedup_lock:
+            return self._dedup_index.add(entry.get("oid"), entry.get("aid"), self.normalize_url(url), keyword)
 
-        entry["matched_keywords"] = [keyword]
-        self._dedup_index[dedup_key] = entry
-        return True
+    def matched_keywords(self, oid: Optional[str], aid: Optional[str], url: str = "") -> List[str]:
+        """
+        Keywords whose searches returned the article so far, in first-seen keyword order.
+        """
+        with self._dedup_lock:
+            return self._dedup_index.keywords_for(oid, aid, self.normalize_url(url) if url else "")
 
     def search_keyword(self, keyword: str) -> Generator[Dict[str, Any], None, None]:
         """
         Search for articles using Naver OpenAPI.
         Yields normalized article dictionaries.
+        OpenAPI result pages are fetched concurrently; once the API's 1,000-result window
+        is exhausted the date-sliced HTML search tops the keyword up to its limit.
         """
         if not self.config.use_openapi or not self.config.client_id or not self.config.client_secret:
             logger.info("OpenAPI disabled or not configured. Using HTML fallback.")
             yield from self._search_fallback(keyword)
             return
 
+        max_limit = self.config.max_articles_per_keyword
+        total_yielded = 0
+        try:
+            for normalized_item in self._search_openapi(keyword):
+                yield normalized_item
+                total_yielded += 1
+                if total_yielded >= max_limit:
+                    return
+        except Exception as e:
+            logger.error(f"OpenAPI search failed for '{keyword}': {e}. Switching to fallback.")
+
+        if total_yielded < max_limit:
+            yield from self._search_fallback(
+                keyword,
+                start_rank=total_yielded + 1,
+                limit=max_limit - total_yielded,
+            )
+
+    def _search_openapi(self, keyword: str) -> Generator[Dict[str, Any], None, None]:
+        """
+        Walk OpenAPI result pages in windows of up to search.max_concurrent parallel requests.
+        Page offsets are deterministic, so each window is fetched at once and consumed in order.
+        """
         headers = {
             "X-Naver-Client-Id": self.config.client_id,
             "X-Naver-Client-Secret": self.config.client_secret
         }
-        
-        display = 100 # Max allowed by Naver
-        start = 1
-        total_yielded = 0
         max_limit = self.config.max_articles_per_keyword
+        display = min(self.OPENAPI_PAGE_SIZE, max_limit)
+        starts = list(range(1, self.OPENAPI_MAX_START + 1, display))
+        window_size = max(1, self.config.max_concurrent)
+        total_yielded = 0
         global_rank = 1
-        
-        while total_yielded < max_limit:
-            params = {
-                "query": keyword,
-                "display": min(display, max_limit - total_yielded),
-                "start": start,
-                "sort": "sim" if self.config.sort == "rel" else "date"
-            }
-            
-            try:
-                resp = self.http_client.request(
-                    "GET",
-                    self.base_url,
-                    headers=headers,
-                    params=params,
-                    timeout=10,
+
+        with ThreadPoolExecutor(max_workers=window_size) as pool:
+            while starts and total_yielded < max_limit:
+                take = min(window_size, math.ceil((max_limit - total_yielded) / display))
+                window, starts = starts[:take], starts[take:]
+                pages = pool.map(
+                    lambda start: self._fetch_openapi_page(keyword, start, display, headers),
+                    window,
                 )
-                resp.raise_for_status()
-                data = resp.json()
-                
-                items = data.get('items', [])
-                if not items:
-                    logger.info(f"No more items for keyword '{keyword}' at start={start}")
-                    break
-                    
-                for item in items:
-                    raw_url = item.get('originallink') or item.get('link', '')
-                    url = self.normalize_url(raw_url)
-                    ids = self.extract_oid_aid(url)
-                    
-                    normalized_item = {
-                        "search_rank": global_rank,
-                        "keyword": keyword,
-                        "url": url,
-                        "title": item.get('title', ''),
-                        "published_at": item.get('pubDate', ''),
-                        "description": item.get('description', ''),
-                        "oid": ids.get('oid'),
-                        "aid": ids.get('aid')
-                    }
-                    
-                    if self._register_article(normalized_item, keyword):
-                        yield normalized_item
-                        total_yielded += 1
-                        global_rank += 1
-                    else:
-                        logger.debug(f"Duplicate article skipped during OpenAPI search: {url}")
-                    
-                start += len(items)
-                if start > 1000: # Naver limits start to 1000
-                    logger.info("Reached Naver OpenAPI pagination limit (1000).")
-                    # Fallback to HTML search for deeper results if needed
-                    yield from self._search_fallback(keyword, start_page=(start // 10) + 1, start_rank=global_rank)
-                    break
-                    
-                time.sleep(0.1) # Polite delay
-                
-            except Exception as e:
-                logger.error(f"OpenAPI search failed for '{keyword}': {e}. Switching to fallback.")
-                yield from self._search_fallback(keyword, start_page=(start // 10) + 1, start_rank=global_rank)
-                break
+                for start, items in zip(window, pages):
+                    if not items:
+                        logger.info(f"No more items for keyword '{keyword}' at start={start}")
+                        return
+                    for item in items:
+                        raw_url = item.get('originallink') or item.get('link', '')
+                        url = self.normalize_url(raw_url)
+                        ids = self.extract_oid_aid(url)
+                        published_at = item.get('pubDate', '')
+                        if not self._within_date_range(published_at):
+                            continue
+
+                        normalized_item = {
+                            "search_rank": global_rank,
+                            "keyword": keyword,
+                            "url": url,
+                            "title": item.get('title', ''),
+                            "published_at": published_at,
+                            "description": item.get('description', ''),
+                            "oid": ids.get('oid'),
+                            "aid": ids.get('aid')
+                        }
+
+                        if self._register_article(normalized_item, keyword):
+                            yield normalized_item
+                            total_yielded += 1
+                            global_rank += 1
+                            if total_yielded >= max_limit:
+                                return
+                        else:
+                            logger.debug(f"Duplicate article skipped during OpenAPI search: {url}")
+
+        logger.info("Reached Naver OpenAPI pagination limit (%d).", self.OPENAPI_MAX_START)
+
+    def _fetch_openapi_page(self, keyword: str, start: int, display: int, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        # OpenAPI has no date filter and new articles shift its pages, so these never count as closed.
+        key = SearchCacheKey(
+            keyword,
+            self.config.sort,
+            "openapi",
+            self._date_window.start.isoformat(),
+            self._date_window.end.isoformat(),
+            start,
+            display,
+        )
+        return self._cached_page(
+            key,
+            closed=False,
+            fetch=lambda: self._request_openapi_page(keyword, start, display, headers),
+        )
 
-    def _search_fallback(self, keyword: str, start_page: int = 1, start_rank: int = 1) -> Generator[Dict[str, Any], None, None]:
+    def _request_openapi_page(self, keyword: str, start: int, display: int, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        params = {
+            "query": keyword,
+            "display": display,
+            "start": start,
+            "sort": "sim" if self.config.sort == "rel" else "date"
+        }
+        with self._host_slots:
+            resp = self.http_client.request(
+                "GET",
+                self.base_url,
+                headers=headers,
+                params=params,
+                timeout=10,
+            )
+            resp.raise_for_status()
+            time.sleep(0.1) # Polite delay
+        return resp.json().get('items', [])
+
+    def _cached_page(
+        self,
+        key: SearchCacheKey,
+        closed: bool,
+        fetch: Callable[[], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Serve a result page from the cross-run cache, fetching and storing it on a miss.
+        Failed fetches raise before anything is stored. Empty pages are not stored either:
+        a block or captcha page parses as empty and would otherwise hide a closed slice for good.
+        """
+        if self.cache is None:
+            return fetch()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        items = fetch()
+        if items:
+            self.cache.put(key, items, closed=closed)
+        return items
+
+    def _within_date_range(self, published_at: str) -> bool:
         """
-        Fallback: Scrape Naver Search HTML.
+        OpenAPI has no date filter, so results are checked against search.date_range here.
+        Unparseable dates are kept.
+        """
+        if not published_at:
+            return True
+        try:
+            published = parsedate_to_datetime(published_at).date()
+        except (TypeError, ValueError, IndexError):
+            return True
+        return self._date_window.contains(published)
+
+    def _search_fallback(
+        self,
+        keyword: str,
+        start_page: int = 1,
+        start_rank: int = 1,
+        limit: Optional[int] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Fallback: Scrape Naver Search HTML, one date slice at a time.
+        Slices that still hit the HTML result cap are split in half and searched again.
         """
         logger.info(f"Starting HTML fallback search for '{keyword}' from page {start_page}")
-        
-        page = start_page
+
+        pending = deque(plan_date_slices(self.config.date_range, self.config.slice_days))
         current_rank = start_rank
-        
-        while True:
-            # Naver search 'start' param is 1-based index (1, 11, 21...)
-            start_index = (page - 1) * 10 + 1
-            if start_index > 4000: # Practical limit for HTML scraping
-                break
-                
-            params = {
-                "where": "news",
-                "query": keyword,
-                "start": start_index,
-                "sort": "0" if self.config.sort == "rel" else "1"
-            }
-            
-            try:
-                resp = self.http_client.request(
-                    "GET",
-                    self.fallback_url,
-                    params=params,
-                    headers={"User-Agent": "Mozilla/5.0"},
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, 'lxml')
-                
-                articles = soup.select('ul.list_news > li')
-                if not articles:
+        remaining = limit
+        first_page = start_page
+
+        while pending:
+            date_slice = pending.popleft()
+            walk = self._search_fallback_slice(keyword, date_slice, first_page, current_rank)
+            first_page = 1
+            hit_cap = False
+            while True:
+                try:
+                    normalized_item = next(walk)
+                except StopIteration as stop:
+                    hit_cap = bool(stop.value)
                     break
-                    
-                for li in articles:
-                    link = li.select_one('a.news_tit')
-                    if link:
-                        url = link['href']
+                yield normalized_item
+                current_rank += 1
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        walk.close()
+                        return
+
+            if hit_cap and date_slice.days > 1:
+                logger.info("Slice %s..%s hit the result cap; splitting.", date_slice.start, date_slice.end)
+                pending.extendleft(reversed(date_slice.split()))
+
+    def _search_fallback_slice(
+        self,
+        keyword: str,
+        date_slice: DateSlice,
+        start_page: int,
+        start_rank: int,
+    ) -> Generator[Dict[str, Any], None, bool]:
+        """
+        Walk HTML result pages for one date slice.
+        Pages are fetched in windows of parallel requests and consumed in order; the walk
+        ends at the first empty or failed page. Windows start at one page and double up to
+        search.max_concurrent while pages keep coming back full, so short slices are not
+        over-fetched, and pages of a window that have not been requested yet when the
+        walk ends are cancelled.
+        Returns True if the walk stopped at the result cap rather than running out of results.
+        """
+        page = start_page
+        current_rank = start_rank
+        max_window = max(1, self.config.max_concurrent)
+        window_size = 1
+        stop = threading.Event()
+
+        def fetch(start: int) -> List[Dict[str, str]]:
+            if stop.is_set():
+                return []
+            return self._fetch_fallback_page(keyword, start, date_slice)
+
+        with ThreadPoolExecutor(max_workers=max_window) as pool:
+            while True:
+                # Naver search 'start' param is 1-based index (1, 11, 21...)
+                starts = [
+                    (page + offset - 1) * self.FALLBACK_PAGE_SIZE + 1
+                    for offset in range(window_size)
+                ]
+                starts = [start for start in starts if start <= self.FALLBACK_MAX_START] # Practical limit for HTML scraping
+                if not starts:
+                    return True
+
+                futures = [pool.submit(fetch, start) for start in starts]
+                for start_index, future in zip(starts, futures):
+                    try:
+                        entries = future.result()
+                    except Exception as e:
+                        logger.error(f"Fallback search failed at start={start_index}: {e}")
+                        entries = None
+                    if not entries:
+                        stop.set()
+                        for pending in futures:
+                            pending.cancel()
+                        return False
+
+                    for entry in entries:
+                        url = entry["url"]
                         ids = self.extract_oid_aid(url)
                         normalized_item = {
                             "search_rank": current_rank,
                             "keyword": keyword,
                             "url": self.normalize_url(url),
-                            "title": link.get_text(strip=True),
+                            "title": entry["title"],
                             "published_at": "", # Hard to parse reliably from list view
                             "oid": ids.get('oid'),
                             "aid": ids.get('aid')
@@ -207,9 +356,64 @@ class SearchCollector:
                             current_rank += 1
                         else:
                             logger.debug(f"Duplicate article skipped during fallback search: {url}")
-                
-                page += 1
-                time.sleep(0.5) # Higher delay for scraping
-            except Exception as e:
-                logger.error(f"Fallback search failed: {e}")
-                break
+
+                page += len(starts)
+                window_size = min(max_window, window_size * 2)
+
+    def _fetch_fallback_page(self, keyword: str, start_index: int, date_slice: DateSlice) -> List[Dict[str, str]]:
+        key = SearchCacheKey(
+            keyword,
+            self.config.sort,
+            "html",
+            date_slice.start.isoformat(),
+            date_slice.end.isoformat(),
+            start_index,
+            self.FALLBACK_PAGE_SIZE,
+        )
+        return self._cached_page(
+            key,
+            closed=date_slice.end < date.today(),
+            fetch=lambda: self._request_fallback_page(keyword, start_index, date_slice),
+        )
+
+    def _request_fallback_page(self, keyword: str, start_index: int, date_slice: DateSlice) -> List[Dict[str, str]]:
+        """
+        Fetch one HTML result page and reduce it to its article links.
+        """
+        params = self._fallback_params(keyword, start_index, date_slice)
+        with self._host_slots:
+            resp = self.http_client.request(
+                "GET",
+                self.fallback_url,
+                params=params,
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=10,
+            )
+            resp.raise_for_status()
+            time.sleep(0.5) # Higher delay for scraping
+        return self._parse_fallback_links(resp.text)
+
+    @staticmethod
+    def _parse_fallback_links(page_html: str) -> List[Dict[str, str]]:
+        if not page_html or not page_html.strip():
+            return []
+        tree = lxml_html.document_fromstring(page_html)
+        return [
+            {"url": link.get("href"), "title": link.text_content().strip()}
+            for link in _RESULT_LINKS_XPATH(tree)
+            if link.get("href")
+        ]
+
+    def _fallback_params(self, keyword: str, start_index: int, date_slice: DateSlice) -> Dict[str, Any]:
+        date_from = date_slice.start.strftime("%Y%m%d")
+        date_to = date_slice.end.strftime("%Y%m%d")
+        return {
+            "where": "news",
+            "query": keyword,
+            "start": start_index,
+            "sort": "0" if self.config.sort == "rel" else "1",
+            "pd": "3",
+            "ds": date_slice.start.strftime("%Y.%m.%d"),
+            "de": date_slice.end.strftime("%Y.%m.%d"),
+            "nso": f"so:{'r' if self.config.sort == 'rel' else 'dd'},p:from{date_from}to{date_to},a:all",
+        }
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Tuple
+
+from ..config import DateRangeConfig
+
+
+@dataclass(frozen=True)
+class DateSlice:
+    """
+    Inclusive calendar-day window used to keep each search query under the
+    per-query result cap.
+    """
+
+    start: date
+    end: date
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    def contains(self, day: date) -> bool:
+        return self.start <= day <= self.end
+
+    def split(self) -> Tuple["DateSlice", "DateSlice"]:
+        if self.days < 2:
+            raise ValueError("Cannot split a single-day slice.")
+        mid = self.start + timedelta(days=self.days // 2 - 1)
+        return DateSlice(self.start, mid), DateSlice(mid + timedelta(days=1), self.end)
+
+
+def parse_date_range(date_range: DateRangeConfig) -> DateSlice:
+    start = date.fromisoformat(date_range.start)
+    end = date.fromisoformat(date_range.end)
+    if end < start:
+        raise ValueError(f"search.date_range end {end} is before start {start}")
+    return DateSlice(start, end)
+
+
+def plan_date_slices(date_range: DateRangeConfig, slice_days: int) -> List[DateSlice]:
+    """
+    Split the configured date range into consecutive slices of at most slice_days days.
+    """
+    if slice_days < 1:
+        raise ValueError("search.slice_days must be >= 1")
+    full = parse_date_range(date_range)
+    slices: List[DateSlice] = []
+    cursor = full.start
+    while cursor <= full.end:
+        end = min(full.end, cursor + timedelta(days=slice_days - 1))
+        slices.append(DateSlice(cursor, end))
+        cursor = end + timedelta(days=1)
+    return slices
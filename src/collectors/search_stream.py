@@ -0,0 +1,155 @@
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from .search_collector import SearchCollector
+
+logger = logging.getLogger(__name__)
+
+INTERLEAVE_POLICIES = ("round_robin", "rank_first", "volume_first")
+
+VolumeEstimator = Callable[[Dict[str, Any]], Optional[float]]
+
+
+class SearchStream:
+    """
+    Runs SearchCollector.search_keyword for every keyword on its own thread and
+    yields one deduplicated, interleaved stream of articles.
+
+    Each keyword buffers at most `lookahead` articles ahead of the consumer, so
+    searching overlaps crawling without running arbitrarily far ahead.
+
+    Policies:
+    - round_robin: rotate across keywords, skipping ones with nothing buffered yet.
+    - rank_first: lowest search_rank among the keywords' next articles.
+    - volume_first: highest estimated comment volume among the next articles.
+    """
+
+    def __init__(
+        self,
+        searcher: SearchCollector,
+        keywords: List[str],
+        policy: str = "round_robin",
+        lookahead: int = 20,
+        volume_estimator: Optional[VolumeEstimator] = None,
+    ):
+        if policy not in INTERLEAVE_POLICIES:
+            raise ValueError(f"Unsupported interleave policy: {policy}")
+        if policy == "volume_first" and volume_estimator is None:
+            logger.warning("volume_first interleaving needs a volume estimator; using rank_first.")
+            policy = "rank_first"
+
+        self.searcher = searcher
+        self.keywords = list(dict.fromkeys(keywords))
+        self.policy = policy
+        self.lookahead = max(1, lookahead)
+        self.volume_estimator = volume_estimator
+
+        self._buffers: Dict[str, Deque[Dict[str, Any]]] = {kw: deque() for kw in self.keywords}
+        self._finished: Dict[str, bool] = {kw: False for kw in self.keywords}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._threads: List[threading.Thread] = []
+        self._rotation = 0
+
+    # Public API -----------------------------------------------------------------
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._start()
+        try:
+            while True:
+                item = self._next_item()
+                if item is None:
+                    return
+                yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    # Producer side --------------------------------------------------------------
+    def _start(self) -> None:
+        if self._threads:
+            return
+        for keyword in self.keywords:
+            thread = threading.Thread(
+                target=self._produce,
+                args=(keyword,),
+                name=f"search-{keyword}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _produce(self, keyword: str) -> None:
+        logger.info("== Searching Keyword: %s ==", keyword)
+        results = self.searcher.search_keyword(keyword)
+        try:
+            for item in results:
+                with self._cond:
+                    while len(self._buffers[keyword]) >= self.lookahead and not self._stopped:
+                        self._cond.wait()
+                    if self._stopped:
+                        return
+                    self._buffers[keyword].append(item)
+                    self._cond.notify_all()
+        except Exception as exc:
+            logger.error("Search for '%s' failed: %s", keyword, exc)
+        finally:
+            close = getattr(results, "close", None)
+            if callable(close):
+                close()
+            with self._cond:
+                self._finished[keyword] = True
+                self._cond.notify_all()
+
+    # Consumer side --------------------------------------------------------------
+    def _next_item(self) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            while True:
+                if self._stopped:
+                    return None
+                keyword = self._select_keyword()
+                if keyword is not None:
+                    item = self._buffers[keyword].popleft()
+                    self._cond.notify_all()
+                    return item
+                if all(self._finished[kw] and not self._buffers[kw] for kw in self.keywords):
+                    return None
+                self._cond.wait()
+
+    def _select_keyword(self) -> Optional[str]:
+        if self.policy == "round_robin":
+            count = len(self.keywords)
+            for offset in range(count):
+                keyword = self.keywords[(self._rotation + offset) % count]
+                if self._buffers[keyword]:
+                    self._rotation = (self._rotation + offset + 1) % count
+                    return keyword
+            return None
+
+        # rank_first / volume_first compare heads, so wait until every live keyword has one.
+        heads = []
+        for keyword in self.keywords:
+            buffer = self._buffers[keyword]
+            if buffer:
+                heads.append((keyword, buffer[0]))
+            elif not self._finished[keyword]:
+                return None
+        if not heads:
+            return None
+
+        if self.policy == "rank_first":
+            return min(heads, key=lambda head: head[1].get("search_rank") or 0)[0]
+        return max(heads, key=lambda head: self._estimate(head[1]))[0]
+
+    def _estimate(self, item: Dict[str, Any]) -> float:
+        try:
+            value = self.volume_estimator(item)
+        except Exception as exc:
+            logger.debug("Volume estimator failed for %s: %s", item.get("url"), exc)
+            return -1.0
+        return float(value) if value is not None else -1.0
@@ -38,3 +38,15 @@ class AppError(Exception):
     def __str__(self) -> str:
         base = super().__str__()
         return f"[{self.severity.name}/{self.kind.name}] {base}"
+
+
+def is_timeout(exc: Optional[BaseException]) -> bool:
+    """
+    True for connect/read timeouts, raised directly or wrapped in an AppError.
+    Matched by name so this module stays free of the requests dependency.
+    """
+    if isinstance(exc, AppError):
+        exc = exc.original_exception
+    if exc is None:
+        return False
+    return isinstance(exc, TimeoutError) or any(cls.__name__.endswith("Timeout") for cls in type(exc).__mro__)
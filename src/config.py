@@ -21,18 +21,39 @@ class SearchConfig(BaseModel):
     use_openapi: bool = True
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
+    max_concurrent: int = 4
+    slice_days: int = 7
+    interleave: Literal["round_robin", "rank_first", "volume_first"] = "round_robin"
+    lookahead: int = 20
+    cache_enabled: bool = True
+    cache_ttl_hours: float = 24.0
 
 class VolumeStrategyConfig(BaseModel):
     target_comments: int = 50000
     min_acceptable_comments: int = 30000
     max_total_articles: int = 2000
-    estimator: str = "trimmed_mean_p20_p80"
+    estimator: Literal["trimmed_mean_p20_p80", "median", "mean"] = "trimmed_mean_p20_p80"
+    stop_strategies: List[Literal["fixed_target", "time_budget", "rate_eta", "diminishing_returns"]] = [
+        "fixed_target"
+    ]
+    time_budget_seconds: Optional[float] = None
+    diminishing_window: int = 20
+    diminishing_min_yield: float = 5.0
+    prioritize: bool = False
+    priority_estimators: List[Literal["history", "stats", "count_probe"]] = ["history"]
+    priority_min_lookahead: int = 5
+    priority_max_lookahead: int = 50
 
 class RateLimitConfig(BaseModel):
     baseline_min_delay: float = 1.0
     min_delay: float = 1.0
     max_delay: float = 3.0
     max_concurrent: int = 1
+    shared_backend: Literal["none", "sqlite"] = "none"
+    shared_db_path: str = "./data/rate_budget.db"
+    shared_key: str = "naver-comment-api"
+    shared_rate_per_second: float = 0.5
+    shared_burst: float = 1.0
 
 class RetryConfig(BaseModel):
     max_attempts: int = 3
@@ -41,6 +62,12 @@ class RetryConfig(BaseModel):
 class TimeoutConfig(BaseModel):
     connect: float = 10.0
     read: float = 30.0
+    adaptive: bool = False
+    adaptive_percentile: float = 0.99
+    adaptive_multiplier: float = 2.0
+    adaptive_min_read: float = 2.0
+    adaptive_max_read: float = 30.0
+    adaptive_min_samples: int = 30
 
 class AutoThrottleConfig(BaseModel):
     window: int = 50
@@ -50,26 +77,85 @@ class AutoThrottleConfig(BaseModel):
     ratio_429_recovery_threshold: float = 0.01
     min_delay_step_down: float = 0.2
     stop_on_403: bool = True
+    mode: Literal["step", "aimd"] = "step"
+    aimd_increase_step: float = 0.05
+    aimd_decrease_factor: float = 2.0
+    aimd_success_window: int = 20
+    aimd_jitter: float = 0.5
+    floor_delay: float = 0.0
+    ceiling_delay: float = 30.0
+    latency_tolerance: float = 2.0
 
 class CommentStatsConfig(BaseModel):
     enabled: bool = True
     min_comments: int = 100
     stats_endpoint: str = "https://apis.naver.com/commentBox/cbox/web_naver_statistics_jsonp.json"
 
+class PageBudgetConfig(BaseModel):
+    max_comment_pages: int = 400
+    max_reply_pages: int = 200
+    adaptive: bool = True
+    page_size: int = 20
+    slack_pages: int = 2
+
+class VolumeGateConfig(BaseModel):
+    min_comments_to_crawl: int = 0
+    source: Literal["page1", "stats"] = "page1"
+
+class BreakerConfig(BaseModel):
+    failure_threshold: int = 5
+    cooldown_seconds: float = 60.0
+    half_open_max_calls: int = 1
+
+class CircuitBreakerConfig(BaseModel):
+    enabled: bool = True
+    default: BreakerConfig = BreakerConfig()
+    endpoints: Dict[str, BreakerConfig] = {}
+
+    def for_endpoint(self, endpoint: str) -> BreakerConfig:
+        return self.endpoints.get(endpoint, self.default)
+
+class QueueConfig(BaseModel):
+    lease_seconds: float = 300.0
+    max_attempts: int = 3
+    poll_interval: float = 2.0
+    batch_size: int = 50
+
+class PageProcessingConfig(BaseModel):
+    mode: Literal["inline", "process_pool"] = "inline"
+    workers: int = 0
+
 class CollectionConfig(BaseModel):
     rate_limit: RateLimitConfig
     retry: RetryConfig
     timeout: TimeoutConfig
     auto_throttle: AutoThrottleConfig
     comment_stats: CommentStatsConfig = CommentStatsConfig()
+    volume_gate: VolumeGateConfig = VolumeGateConfig()
+    page_budget: PageBudgetConfig = PageBudgetConfig()
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    queue: QueueConfig = QueueConfig()
+    page_processing: PageProcessingConfig = PageProcessingConfig()
+
+class ArchiveConfig(BaseModel):
+    enabled: bool = False
+    root_dir: str = "./data/archive"
+    segment_mb: int = 64
+    compress_level: int = 6
+    batch_records: int = 200
+    flush_interval: float = 2.0
+    queue_size: int = 1000
 
 class StorageConfig(BaseModel):
     db_path: str = "./data/nact_data.db"
     wal_mode: bool = True
+    shard_per_worker: bool = False
+    archive: ArchiveConfig = ArchiveConfig()
 
 class PrivacyConfig(BaseModel):
     allow_pii: bool = False
-    hash_algorithm: str = "sha256"
+    hash_algorithm: Literal["sha256", "blake2b"] = "sha256"
+    hash_cache_size: int = 65536
     mode: Literal["ephemeral", "longitudinal"] = "ephemeral"
     fixed_salt: Optional[str] = None
 
@@ -91,6 +177,13 @@ class PrivacyConfig(BaseModel):
             raise ValueError("privacy.fixed_salt is required when privacy.mode='longitudinal'.")
         return values
 
+    @root_validator
+    def _validate_hash_algorithm(cls, values):
+        # Longitudinal hashes must stay comparable with earlier runs, which were HMAC-SHA256.
+        if values.get("mode") == "longitudinal" and values.get("hash_algorithm", "sha256") != "sha256":
+            raise ValueError("privacy.hash_algorithm must be 'sha256' when privacy.mode='longitudinal'.")
+        return values
+
 class AppConfig(BaseModel):
     snapshot: SnapshotConfig
     search: SearchConfig
@@ -1,6 +1,11 @@
+import time
+from typing import Dict, Optional
+
 import requests
 
 from src.interfaces import IHttpClient
+from src.ops.circuit_breaker import CircuitBreaker
+from src.ops.latency import LatencyTracker
 
 
 class RequestsHttpClient(IHttpClient):
@@ -13,3 +18,86 @@ class RequestsHttpClient(IHttpClient):
 
     def request(self, method: str, url: str, **kwargs):
         return self.session.request(method=method, url=url, **kwargs)
+
+
+class CircuitBreakingHttpClient(IHttpClient):
+    """
+    Routes every request through the circuit breaker of its endpoint.
+
+    `routes` maps URL prefixes to their own breakers (first match wins); other URLs
+    use `breaker`. Network errors, 403, 429 and 5xx responses count as failures and
+    any other response as a success. While a circuit is open the request is not
+    sent and CircuitOpenError is raised instead.
+    """
+
+    FAILURE_STATUSES = frozenset({403, 429})
+
+    def __init__(
+        self,
+        inner: IHttpClient,
+        breaker: CircuitBreaker,
+        routes: Optional[Dict[str, CircuitBreaker]] = None,
+    ):
+        self.inner = inner
+        self.breaker = breaker
+        self.routes = dict(routes or {})
+
+    def request(self, method: str, url: str, **kwargs):
+        breaker = self._breaker_for(url)
+        breaker.before_call()
+        try:
+            response = self.inner.request(method, url, **kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+        status = getattr(response, "status_code", 200)
+        if status >= 500 or status in self.FAILURE_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def _breaker_for(self, url: str) -> CircuitBreaker:
+        for prefix, breaker in self.routes.items():
+            if url.startswith(prefix):
+                return breaker
+        return self.breaker
+
+
+class LatencyTrackingHttpClient(IHttpClient):
+    """
+    Times every request for its endpoint and applies the endpoint's adaptive read timeout.
+
+    `routes` maps URL prefixes to other endpoint names (first match wins).
+    Timed-out requests are recorded as timeouts before the exception propagates.
+    """
+
+    def __init__(
+        self,
+        inner: IHttpClient,
+        tracker: LatencyTracker,
+        endpoint: str,
+        routes: Optional[Dict[str, str]] = None,
+    ):
+        self.inner = inner
+        self.tracker = tracker
+        self.endpoint = endpoint
+        self.routes = dict(routes or {})
+
+    def request(self, method: str, url: str, **kwargs):
+        endpoint = self._endpoint_for(url)
+        kwargs["timeout"] = self.tracker.timeout_for(endpoint, kwargs.get("timeout"))
+        started = time.monotonic()
+        try:
+            response = self.inner.request(method, url, **kwargs)
+        except requests.Timeout:
+            self.tracker.record_timeout(endpoint, time.monotonic() - started)
+            raise
+        self.tracker.observe(endpoint, time.monotonic() - started)
+        return response
+
+    def _endpoint_for(self, url: str) -> str:
+        for prefix, endpoint in self.routes.items():
+            if url.startswith(prefix):
+                return endpoint
+        return self.endpoint
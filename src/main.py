@@ -1,17 +1,20 @@
 import argparse
 import json
 import logging
+import os
+import socket
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
 
 # Add src to path to allow imports if running directly
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.common.errors import AppError, Severity
-from src.config import load_config, get_default_config_path
+from src.common.errors import AppError, Severity, is_timeout
+from src.config import AppConfig, load_config, get_default_config_path
 from src.ops.logger import setup_logger
 from src.ops.run_events import RunEventLogger
 from src.ops.run_metrics import compute_tier_outcome, compute_health_score
@@ -21,6 +24,10 @@ from src.privacy.factory import build_privacy_hasher
 from src.storage.db import Database
 
 
+# Longest uninterrupted sleep while waiting out an open comment API circuit.
+COOLDOWN_POLL_SECONDS = 1.0
+
+
 @dataclass
 class RuntimeContext:
     config: "AppConfig"
@@ -34,6 +41,7 @@ class RuntimeContext:
 class RunLoopStats:
     total_articles: int = 0
     total_comments: int = 0
+    timeout_retries: int = 0
 
 
 @dataclass
@@ -57,6 +65,34 @@ def parse_args(argv=None):
         help="Path to an existing SQLite DB to resume from.",
     )
 
+    parser.add_argument(
+        "--mode",
+        choices=["single", "plan", "work", "merge", "reparse"],
+        default="single",
+        help="single: search and crawl in this process. plan: fill the run's crawl queue. "
+        "work: crawl articles leased from the queue of --run-id. "
+        "merge: copy worker shard DBs into the main DB. "
+        "reparse: rebuild --run-id from its response archive into a fresh DB.",
+    )
+
+    parser.add_argument(
+        "--run-id",
+        type=str,
+        help="Run ID to create (plan) or join (work). Defaults to a timestamp.",
+    )
+
+    parser.add_argument(
+        "--worker-id",
+        type=str,
+        help="Lease owner name in work mode. Defaults to <hostname>-<pid>.",
+    )
+
+    parser.add_argument(
+        "--reparse-to",
+        type=str,
+        help="New SQLite DB for reparse mode. Defaults to <db>.reparse-<run-id>.db.",
+    )
+
     return parser.parse_args(argv)
 
 
@@ -71,7 +107,12 @@ def bootstrap_runtime(args) -> RuntimeContext:
         temp_logger.error("Failed to load configuration: %s", exc)
         raise
 
-    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    mode = getattr(args, "mode", "single")
+    run_id = getattr(args, "run_id", None)
+    if mode in ("work", "reparse") and not run_id:
+        temp_logger.error("--mode %s needs the --run-id of an existing run.", mode)
+        raise ValueError(f"Missing --run-id for {mode} mode.")
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
     logger = setup_logger(run_id)
     logger.info("Starting Run ID: %s", run_id)
 
@@ -98,7 +139,7 @@ def bootstrap_runtime(args) -> RuntimeContext:
 
 def run_collection_loop(
     config,
-    searcher,
+    article_feed: Iterable[Dict[str, Any]],
     parser,
     probe,
     collector,
@@ -107,113 +148,226 @@ def run_collection_loop(
     volume_tracker: VolumeTracker,
     event_logger: RunEventLogger,
     stats: RunLoopStats,
+    volume_gate=None,
+    comment_breaker=None,
 ) -> RunLoopResult:
     logger = logging.getLogger("nact-mvp")
     stop_reason: Optional[str] = None
-    stop_triggered = False
+    started = time.monotonic()
+
+    def budget_stop() -> Optional[str]:
+        # Side-effect-free, so it can run for articles decide() never sees.
+        if not stop_strategy:
+            return None
+        decision = stop_strategy.check(stats.total_comments, time.monotonic() - started)
+        return decision.reason if decision.should_stop else None
 
-    for keyword in config.search.keywords:
-        if stop_triggered:
+    for item in article_feed:
+        stop_reason = budget_stop()
+        if stop_reason:
+            logger.info("Volume strategy triggered stop (%s) at %d comments", stop_reason, stats.total_comments)
             break
-        logger.info("== Processing Keyword: %s ==", keyword)
 
-        for item in searcher.search_keyword(keyword):
-            url = item.get("url")
-            oid = item.get("oid")
-            aid = item.get("aid")
-            title = item.get("title")
+        url = item.get("url")
+        oid = item.get("oid")
+        aid = item.get("aid")
+        title = item.get("title")
 
-            if not oid or not aid:
-                logger.warning("Skipping article without OID/AID: %s", url)
-                continue
+        if not oid or not aid:
+            logger.warning("Skipping article without OID/AID: %s", url)
+            continue
 
-            stats.total_articles += 1
-            logger.info("Processing (%d) %s/%s: %s", stats.total_articles, oid, aid, title)
+        stats.total_articles += 1
+        logger.info(
+            "Processing (%d) [%s] %s/%s: %s", stats.total_articles, item.get("keyword"), oid, aid, title
+        )
 
-            if repository.is_article_completed(oid, aid):
-                logger.info("Skipping completed article: %s/%s", oid, aid)
-                continue
+        if repository.is_article_completed(oid, aid):
+            logger.info("Skipping completed article: %s/%s", oid, aid)
+            continue
+
+        if comment_breaker:
+            # Every article needs the comment API; wait out its cool-down instead of failing articles,
+            # in short steps so the stop budget still ends the run on time.
+            cooldown = comment_breaker.retry_after()
+            if cooldown > 0:
+                logger.warning("Comment API circuit open; pausing %.1fs before %s/%s", cooldown, oid, aid)
+                deadline = time.monotonic() + cooldown
+                stop_reason = budget_stop()
+                while not stop_reason and time.monotonic() < deadline:
+                    time.sleep(max(0.0, min(COOLDOWN_POLL_SECONDS, deadline - time.monotonic())))
+                    stop_reason = budget_stop()
+                if stop_reason:
+                    logger.info("Volume strategy triggered stop (%s) during a cool-down", stop_reason)
+                    break
 
-            metadata = parser.fetch_and_parse(url)
-            if metadata.get("status") != "CRAWL-OK":
-                logger.warning(
-                    "Metadata parse flagged %s/%s: %s",
+        gate_result = None
+        if volume_gate:
+            gate_result = volume_gate.check(item)
+            if not gate_result.passed:
+                logger.info("Skipping low-volume article %s/%s (%s comments)", oid, aid, gate_result.total)
+                repository.set_article_status(
                     oid,
                     aid,
-                    metadata.get("error_code") or metadata.get("error_message"),
+                    status="SKIP-LOWVOL",
+                    error_code="LOW_VOLUME",
+                    error_message=f"Reported {gate_result.total} comments, below min_comments_to_crawl.",
+                )
+                event_logger.log(
+                    "ARTICLE_SKIPPED_LOWVOL",
+                    "Reported comment total below min_comments_to_crawl",
+                    {"oid": oid, "aid": aid, "total": str(gate_result.total)},
                 )
+                continue
 
-            raw_html = metadata.get("_raw_html", "")
-            candidates = list(probe.get_candidate_configs(url, raw_html))
+        metadata = parser.fetch_and_parse(url)
+        if metadata.get("status") != "CRAWL-OK":
+            logger.warning(
+                "Metadata parse flagged %s/%s: %s",
+                oid,
+                aid,
+                metadata.get("error_code") or metadata.get("error_message"),
+            )
+
+        candidates = list(probe.get_candidate_configs(url, discovered=metadata.get("probe_params")))
+
+        if not candidates:
+            repository.set_article_status(
+                oid,
+                aid,
+                status="FAIL-NOCAND",
+                error_code="NO_CANDIDATE",
+                error_message="Probe did not emit any comment API candidates.",
+            )
+            event_logger.log(
+                "CANDIDATE_MISSING",
+                "Probe produced zero candidates",
+                {"oid": oid, "aid": aid, "url": url or ""},
+            )
+            continue
+
+        target_comments = config.volume_strategy.target_comments
+        budget = collector.budget_for(
+            remaining_comments=target_comments - stats.total_comments if target_comments else None,
+            should_stop=(
+                lambda written: stop_strategy.should_interrupt(
+                    stats.total_comments + written, time.monotonic() - started
+                )
+            )
+            if stop_strategy
+            else None,
+        )
 
-            if not candidates:
-                repository.set_article_status(
+        success = False
+        for attempt, params in enumerate(candidates, start=1):
+            ctx_payload = {
+                "oid": oid,
+                "aid": aid,
+                "attempt": str(attempt),
+                "params": json.dumps(params, ensure_ascii=False),
+            }
+
+            try:
+                first_page = gate_result.reusable_page(params) if gate_result else None
+                count = collector.collect_article(
                     oid,
                     aid,
-                    status="FAIL-NOCAND",
-                    error_code="NO_CANDIDATE",
-                    error_message="Probe did not emit any comment API candidates.",
+                    params,
+                    source_url=url,
+                    first_page=first_page,
+                    budget=budget,
                 )
-                event_logger.log(
-                    "CANDIDATE_MISSING",
-                    "Probe produced zero candidates",
-                    {"oid": oid, "aid": aid, "url": url or ""},
+                stats.total_comments += count
+                volume_tracker.add_count(count)
+                success = True
+                break
+            except StructuralError:
+                raise
+            except AppError as exc:
+                event_type = "CANDIDATE_RETRY" if exc.severity == Severity.RETRY else "CANDIDATE_FAIL"
+                if is_timeout(exc):
+                    event_type = "CANDIDATE_TIMEOUT"
+                    stats.timeout_retries += 1
+                event_logger.log(event_type, str(exc), ctx_payload)
+                if exc.severity == Severity.RETRY:
+                    continue
+                break
+            except Exception as exc:
+                event_logger.log("CANDIDATE_EXCEPTION", str(exc), ctx_payload)
+                raise
+
+        if not success:
+            logger.error("All probe candidates failed for %s/%s", oid, aid)
+
+        if stop_strategy:
+            decision = stop_strategy.decide(stats.total_comments, time.monotonic() - started)
+            if decision.eta_seconds is not None:
+                logger.info("ETA to target_comments: %.0fs", decision.eta_seconds)
+            if decision.should_stop:
+                stop_reason = decision.reason or "TARGET_REACHED"
+                logger.info(
+                    "Volume strategy triggered stop (%s) at %d comments",
+                    stop_reason,
+                    stats.total_comments,
                 )
-                continue
-
-            success = False
-            for attempt, params in enumerate(candidates, start=1):
-                ctx_payload = {
-                    "oid": oid,
-                    "aid": aid,
-                    "attempt": str(attempt),
-                    "params": json.dumps(params, ensure_ascii=False),
-                }
-
-                try:
-                    count = collector.collect_article(oid, aid, params, source_url=url)
-                    stats.total_comments += count
-                    volume_tracker.add_count(count)
-                    success = True
-                    break
-                except StructuralError:
-                    raise
-                except AppError as exc:
-                    event_type = "CANDIDATE_RETRY" if exc.severity == Severity.RETRY else "CANDIDATE_FAIL"
-                    event_logger.log(event_type, str(exc), ctx_payload)
-                    if exc.severity == Severity.RETRY:
-                        continue
-                    break
-                except Exception as exc:
-                    event_logger.log("CANDIDATE_EXCEPTION", str(exc), ctx_payload)
-                    raise
-
-            if not success:
-                logger.error("All probe candidates failed for %s/%s", oid, aid)
-
-            if stop_strategy and not stop_triggered:
-                decision = stop_strategy.decide(stats.total_comments, 0.0)
-                if decision.should_stop:
-                    stop_reason = decision.reason or "TARGET_REACHED"
-                    logger.info(
-                        "Volume strategy triggered stop (%s) at %d comments",
-                        stop_reason,
-                        stats.total_comments,
-                    )
-                    stop_triggered = True
-                    break
+                break
 
-            remaining_capacity = max(0, config.volume_strategy.max_total_articles - stats.total_articles)
-            if volume_tracker.should_expand(
-                target_comments=config.volume_strategy.target_comments,
-                collected_comments=stats.total_comments,
-                remaining_capacity=remaining_capacity,
-            ):
-                logger.warning("Volume tracker suggests expanding search scope to meet targets.")
+        remaining_capacity = max(0, config.volume_strategy.max_total_articles - stats.total_articles)
+        if volume_tracker.should_expand(
+            target_comments=config.volume_strategy.target_comments,
+            collected_comments=stats.total_comments,
+            remaining_capacity=remaining_capacity,
+        ):
+            logger.warning("Volume tracker suggests expanding search scope to meet targets.")
 
     return RunLoopResult(stop_reason=stop_reason)
 
 
+HASH_SALT_ENV = "NACT_HASH_SALT"
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def run_plan(queue, article_feed: Iterable[Dict[str, Any]], batch_size: int) -> int:
+    """
+    Fill the crawl queue from the search feed and mark planning finished.
+    Re-running the planner for the same run only adds articles not queued yet.
+    """
+    logger = logging.getLogger("nact-mvp")
+    queue.start_planning()
+    added = queue.fill(article_feed, batch_size=batch_size)
+    queue.finish_planning()
+    logger.info("Queued %d article(s) for run %s: %s", added, queue.run_id, queue.counts())
+    return added
+
+
+def run_reparse(args, config: AppConfig, db: Database, run_id: str, snapshot_at: str, hash_salt: Optional[str]):
+    """
+    Rebuild a run from its response archive, offline, into a fresh DB.
+    """
+    from src.collectors.reparse import ArchiveReparser
+    from src.storage.run_repository import RunRepository
+
+    logger = logging.getLogger("nact-mvp")
+    if config.privacy.mode == "ephemeral" and not hash_salt:
+        logger.warning("No %s set; author hashes will not match the original run.", HASH_SALT_ENV)
+    _, salt = build_privacy_hasher(config.privacy, run_id, ephemeral_salt=hash_salt)
+
+    source_run = RunRepository(db).get_run(run_id)
+    target = args.reparse_to or str(db.db_path.with_name(f"{db.db_path.stem}.reparse-{run_id}{db.db_path.suffix}"))
+    reparser = ArchiveReparser(
+        config,
+        salt,
+        run_id,
+        snapshot_at=source_run["snapshot_at"] if source_run else snapshot_at,
+        workers=config.collection.page_processing.workers,
+    )
+    summary = reparser.run(Path(config.storage.archive.root_dir) / run_id, target, source=db)
+    logger.info("Rebuilt run %s into %s: %s", run_id, target, summary)
+
+
 def main():
     args = parse_args()
 
@@ -226,47 +380,120 @@ def main():
     db = context.db
     run_id = context.run_id
     snapshot_at = context.snapshot_at
+    mode = args.mode
 
     logger = logging.getLogger("nact-mvp")
 
+    if mode == "merge":
+        from src.storage.shards import ShardMerger, discover_shards
+
+        shards = discover_shards(str(db.db_path))
+        copied = ShardMerger(db).merge(shards)
+        logger.info("Merged %d shard(s) into %s: %s", len(shards), db.db_path, copied)
+        return
+
+    hash_salt = os.environ.get(HASH_SALT_ENV)
+    if mode == "reparse":
+        run_reparse(args, config, db, run_id, snapshot_at, hash_salt)
+        return
+    if mode == "work" and config.privacy.mode == "ephemeral" and not hash_salt:
+        # Each process would otherwise draw its own salt and hash the same author differently.
+        logger.error("Set %s to one shared secret for every worker of an ephemeral-mode run.", HASH_SALT_ENV)
+        sys.exit(1)
+
     from src.collectors.article_parser import ArticleParser
+    from src.collectors.article_prioritizer import (
+        ArticlePrioritizer,
+        CountProbeEstimator,
+        HistoryVolumeEstimator,
+        StatsTotalEstimator,
+    )
     from src.collectors.comment_collector import CommentCollector
     from src.collectors.comment_fetcher import CommentFetcher
     from src.collectors.comment_parser import CommentParser
     from src.collectors.comment_stats import CommentStatsService
+    from src.collectors.page_processor import build_page_processor
     from src.collectors.search_collector import SearchCollector
-    from src.http.client import RequestsHttpClient
+    from src.collectors.search_stream import SearchStream
+    from src.collectors.volume_gate import LowVolumeGate
+    from src.http.client import CircuitBreakingHttpClient, LatencyTrackingHttpClient, RequestsHttpClient
+    from src.ops.circuit_breaker import CircuitBreakerRegistry
     from src.ops.evidence import EvidenceCollector
+    from src.ops.latency import LatencyTracker
     from src.ops.probe import EndpointProbe
     from src.ops.rate_limiter import RateLimiter
-    from src.ops.throttle import AutoThrottler
-    from src.ops.volume_strategy import FixedTargetStrategy
+    from src.ops.shared_budget import build_shared_budget
+    from src.ops.throttle import build_throttler
+    from src.ops.volume_strategy import build_stop_strategy
+    from src.storage.crawl_queue import CrawlQueue
     from src.storage.exporters import DataExporter
     from src.storage.repository import CommentRepository
     from src.storage.run_repository import RunRepository
+    from src.storage.response_archive import build_response_archive
+    from src.storage.search_cache import SearchCache
+    from src.storage.shards import ShardedDatabase, attachable_shards, discover_shards, open_shard
+
+    worker_id = (args.worker_id or default_worker_id()) if mode == "work" else None
+    sharded = worker_id is not None and config.storage.shard_per_worker
+    # Sharded workers write results to their own DB; the queue and run row stay in the main DB.
+    write_db = open_shard(db, worker_id, run_id, wal_mode=config.storage.wal_mode) if sharded else db
+
+    event_logger = RunEventLogger(write_db, run_id)
+
+    base_http_client = RequestsHttpClient()
+    breakers = None
+    if config.collection.circuit_breaker.enabled:
+        breakers = CircuitBreakerRegistry(config.collection.circuit_breaker, event_logger=event_logger)
+    latency = LatencyTracker(config.collection.timeout) if config.collection.timeout.adaptive else None
+
+    def endpoint_client(endpoint: str, routes: Optional[Dict[str, str]] = None):
+        # Per-endpoint timing and breakers, so a slow or failing endpoint does not hold up the others.
+        client = base_http_client
+        if latency is not None:
+            client = LatencyTrackingHttpClient(client, latency, endpoint, routes=routes)
+        if breakers is not None:
+            client = CircuitBreakingHttpClient(
+                client,
+                breakers.get(endpoint),
+                routes={prefix: breakers.get(name) for prefix, name in (routes or {}).items()},
+            )
+        return client
 
-    http_client = RequestsHttpClient()
     evidence = EvidenceCollector(run_id=run_id, logs_dir="logs")
-    searcher = SearchCollector(config.search, http_client)
-    parser = ArticleParser(http_client)
+    search_cache = None
+    if config.search.cache_enabled:
+        search_cache = SearchCache(db, ttl_seconds=config.search.cache_ttl_hours * 3600)
+        search_cache.purge_expired()
+    searcher = SearchCollector(
+        config.search,
+        endpoint_client("search", routes={"https://search.naver.com/": "search_html"}),
+        cache=search_cache,
+    )
     probe = EndpointProbe()
+    # Article bodies are not persisted; parse only head/header metadata.
+    parser = ArticleParser(endpoint_client("article_html"), extract_body=False, probe=probe)
 
-    hasher, _ = build_privacy_hasher(config.privacy, run_id)
+    hasher, salt = build_privacy_hasher(config.privacy, run_id, ephemeral_salt=hash_salt)
     comment_parser = CommentParser(config, hasher)
 
-    event_logger = RunEventLogger(db, run_id)
-
-    rate_limiter = RateLimiter(config.collection.rate_limit)
-    throttler = AutoThrottler(config.collection.auto_throttle, rate_limiter, db, run_id, event_logger=event_logger)
-    fetcher = CommentFetcher(http_client, rate_limiter, throttler, evidence, config)
+    rate_limiter = RateLimiter(
+        config.collection.rate_limit,
+        shared_budget=build_shared_budget(config.collection.rate_limit),
+    )
+    throttler = build_throttler(config.collection.auto_throttle, rate_limiter, db, run_id, event_logger=event_logger)
+    archive = build_response_archive(config.storage.archive, run_id)
+    fetcher = CommentFetcher(endpoint_client("comment_list"), rate_limiter, throttler, evidence, config, archive=archive)
 
-    repository = CommentRepository(db, run_id, store_author_raw=config.privacy.allow_pii)
+    repository = CommentRepository(write_db, run_id, store_author_raw=config.privacy.allow_pii)
     stats_service = CommentStatsService(
-        http_client=http_client,
+        http_client=endpoint_client("comment_stats"),
         evidence=evidence,
         config=config.collection.comment_stats,
         parse_jsonp=comment_parser.parse_jsonp,
+        archive=archive,
     )
+    # The pool workers rebuild the parser and hasher from the config and this run's salt.
+    page_processor = build_page_processor(config, salt, comment_parser)
     collector = CommentCollector(
         config,
         fetcher,
@@ -275,22 +502,106 @@ def main():
         snapshot_at,
         event_logger=event_logger,
         stats_service=stats_service,
+        page_processor=page_processor,
     )
-    volume_tracker = VolumeTracker()
-    run_repo = RunRepository(db)
-    run_repo.start_run(
-        run_id=run_id,
-        snapshot_at=snapshot_at,
-        tz_name=config.snapshot.timezone,
-        config_payload=config.model_dump(),
+    volume_tracker = VolumeTracker(estimator=config.volume_strategy.estimator)
+
+    volume_cfg = config.volume_strategy
+    estimator_factories = {
+        # Past runs live in the main DB even when this worker writes to a shard.
+        "history": lambda: HistoryVolumeEstimator(CommentRepository(db, run_id).load_volume_history()),
+        "stats": lambda: StatsTotalEstimator(stats_service, probe),
+        "count_probe": lambda: CountProbeEstimator(fetcher, comment_parser, probe),
+    }
+    estimators: Dict[str, Any] = {}
+
+    def estimator(name: str):
+        # Built on first use: history runs a full-table aggregate and only some runs need any.
+        if name not in estimators:
+            estimators[name] = estimator_factories[name]()
+        return estimators[name]
+
+    # Interleaving runs under the stream lock, so it only gets the offline history estimate.
+    article_feed = SearchStream(
+        searcher,
+        config.search.keywords,
+        policy=config.search.interleave,
+        lookahead=config.search.lookahead,
+        volume_estimator=(
+            (lambda item: estimator("history").estimate(item))
+            if config.search.interleave == "volume_first"
+            else None
+        ),
     )
+    run_repo = RunRepository(db)
+    queue = None
+    if mode != "single":
+        queue_cfg = config.collection.queue
+        queue = CrawlQueue(db, run_id, lease_seconds=queue_cfg.lease_seconds, max_attempts=queue_cfg.max_attempts)
 
-    stop_strategy = None
-    if config.volume_strategy.target_comments:
-        stop_strategy = FixedTargetStrategy(config.volume_strategy.target_comments)
+    if mode == "plan":
+        run_repo.start_run(
+            run_id=run_id,
+            snapshot_at=snapshot_at,
+            tz_name=config.snapshot.timezone,
+            config_payload=config.model_dump(),
+        )
+        try:
+            run_plan(queue, article_feed, config.collection.queue.batch_size)
+        finally:
+            article_feed.close()
+            page_processor.close()
+            if archive is not None:
+                archive.close()
+        logger.info("Start workers with: --mode work --run-id %s", run_id)
+        return
 
-    exporter = DataExporter(db)
     loop_stats = RunLoopStats()
+    crawl_feed: Iterable[Dict[str, Any]] = article_feed
+    queue_feed = None
+    if queue is not None:
+        if not queue.has_plan():
+            logger.error("Run %s has no crawl queue; run --mode plan first.", run_id)
+            sys.exit(1)
+        logger.info("Worker %s joining run %s", worker_id, run_id)
+        queue_feed = queue.claims(
+            worker_id,
+            poll_interval=config.collection.queue.poll_interval,
+            is_processed=repository.has_article_status if sharded else None,
+        )
+        crawl_feed = queue_feed
+    elif volume_cfg.prioritize:
+        prioritizer = ArticlePrioritizer(
+            [estimator(name) for name in volume_cfg.priority_estimators],
+            volume_tracker,
+            target_comments=volume_cfg.target_comments,
+            min_lookahead=volume_cfg.priority_min_lookahead,
+            max_lookahead=volume_cfg.priority_max_lookahead,
+        )
+        crawl_feed = prioritizer.prioritize(article_feed, lambda: loop_stats.total_comments)
+
+    volume_gate = None
+    if config.collection.volume_gate.min_comments_to_crawl > 0:
+        volume_gate = LowVolumeGate(
+            config.collection.volume_gate,
+            fetcher,
+            comment_parser,
+            probe,
+            stats_service=stats_service,
+        )
+
+    if queue is None:
+        run_repo.start_run(
+            run_id=run_id,
+            snapshot_at=snapshot_at,
+            tz_name=config.snapshot.timezone,
+            config_payload=config.model_dump(),
+        )
+        stop_strategy = build_stop_strategy(config.volume_strategy)
+    else:
+        # Volume targets are run-wide; a worker only sees its own share, so the queue bounds the work.
+        stop_strategy = None
+
     stop_reason: Optional[str] = None
     failure_reason: Optional[str] = None
     run_status = "FAILED"
@@ -298,7 +609,7 @@ def main():
     try:
         result = run_collection_loop(
             config,
-            searcher,
+            crawl_feed,
             parser,
             probe,
             collector,
@@ -307,6 +618,8 @@ def main():
             volume_tracker,
             event_logger,
             loop_stats,
+            volume_gate=volume_gate,
+            comment_breaker=breakers.get("comment_list") if breakers else None,
         )
         stop_reason = result.stop_reason
         run_status = "STOPPED" if stop_reason else "SUCCESS"
@@ -324,37 +637,85 @@ def main():
         run_status = "PARTIAL"
         logger.exception("Run terminated unexpectedly.")
     finally:
-        try:
-            exporter.export_run(run_id)
-        except Exception as exc:
-            logger.exception("Export failed: %s", exc)
-
-        volume_grade, tier_note = compute_tier_outcome(
-            total_comments=loop_stats.total_comments,
-            target_comments=config.volume_strategy.target_comments,
-            minimum_comments=config.volume_strategy.min_acceptable_comments,
-        )
-        health_score, needs_review = compute_health_score(
-            duplicate_rate=0.0,
-            timestamp_anomalies=0,
-            total_mismatch=volume_grade == "C",
-        )
-        notes_parts = [f"volume_grade={volume_grade}:{tier_note}"]
-        if stop_reason:
-            notes_parts.append(f"stop_reason={stop_reason}")
-        if failure_reason:
-            notes_parts.append(f"failure={failure_reason}")
-        notes = " | ".join(notes_parts)
-
-        run_repo.finalize_run(
-            run_id=run_id,
-            status=run_status,
-            notes=notes,
-            total_articles=loop_stats.total_articles,
-            total_comments=loop_stats.total_comments,
-            health_score=health_score,
-            health_flags="technical_review_needed" if needs_review else "",
-        )
+        article_feed.close()
+        if queue_feed is not None:
+            queue_feed.close()
+        page_processor.close()
+        if archive is not None:
+            archive.close()
+        if queue is not None:
+            # Reported before finalizing, so whichever worker finalizes last has seen every report.
+            queue.report(
+                worker_id,
+                run_status,
+                timestamp_anomalies=comment_parser.timestamp_anomalies,
+                stop_reason=stop_reason,
+                failure_reason=failure_reason,
+            )
+        # In work mode every worker that sees the queue drained rewrites the run row from all
+        # workers' reports, and only the first of them exports.
+        finalizes = queue is None or queue.is_drained()
+        closes_run = queue is None or queue.claim_finalize()
+        # Finalizing workers read every worker's shard through UNION views rather than merging.
+        shards = attachable_shards(db, discover_shards(str(db.db_path))) if finalizes and sharded else []
+        if closes_run:
+            try:
+                DataExporter(db, shards=shards).export_run(run_id)
+            except Exception as exc:
+                logger.exception("Export failed: %s", exc)
+
+        logger.info("Author hash cache: %s", hasher.cache_stats())
+        if loop_stats.timeout_retries:
+            logger.info("Comment requests retried after timeouts: %d", loop_stats.timeout_retries)
+        if latency is not None:
+            logger.info("Endpoint latency: %s", latency.snapshot())
+        if search_cache is not None:
+            logger.info("Search page cache: %s", search_cache.stats())
+
+        total_articles, total_comments = loop_stats.total_articles, loop_stats.total_comments
+        if queue is not None:
+            logger.info(
+                "Worker finished: %d article(s), %d comment(s); queue %s",
+                total_articles,
+                total_comments,
+                queue.counts(),
+            )
+            totals_db = ShardedDatabase(db, shards) if shards else db
+            total_articles, total_comments = RunRepository(totals_db).run_totals(run_id)
+
+        if finalizes:
+            final_status, anomalies = run_status, comment_parser.timestamp_anomalies
+            stop_reasons = [stop_reason] if stop_reason else []
+            failure_reasons = [failure_reason] if failure_reason else []
+            if queue is not None:
+                summary = queue.worker_summary()
+                final_status = summary["status"] or run_status
+                anomalies = summary["timestamp_anomalies"]
+                stop_reasons, failure_reasons = summary["stop_reasons"], summary["failure_reasons"]
+            volume_grade, tier_note = compute_tier_outcome(
+                total_comments=total_comments,
+                target_comments=config.volume_strategy.target_comments,
+                minimum_comments=config.volume_strategy.min_acceptable_comments,
+            )
+            health_score, needs_review = compute_health_score(
+                duplicate_rate=0.0,
+                timestamp_anomalies=anomalies,
+                total_mismatch=volume_grade == "C",
+            )
+            notes_parts = [f"volume_grade={volume_grade}:{tier_note}"]
+            notes_parts.extend(f"stop_reason={reason}" for reason in stop_reasons)
+            notes_parts.extend(f"failure={reason}" for reason in failure_reasons)
+            notes = " | ".join(notes_parts)
+
+            run_repo.finalize_run(
+                run_id=run_id,
+                status=final_status,
+                notes=notes,
+                total_articles=total_articles,
+                total_comments=total_comments,
+                health_score=health_score,
+                health_flags="technical_review_needed" if needs_review else "",
+            )
 
     if run_status == "FAILED":
         sys.exit(2)
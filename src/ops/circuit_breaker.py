@@ -0,0 +1,172 @@
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from ..common.errors import AppError, ErrorKind, Severity
+from ..config import BreakerConfig, CircuitBreakerConfig
+from .run_events import RunEventLogger
+
+logger = logging.getLogger(__name__)
+
+ENDPOINTS = ("comment_list", "comment_stats", "article_html", "search", "search_html")
+
+
+class CircuitState(Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(AppError):
+    """
+    Raised instead of sending a request while an endpoint's circuit is open.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for {endpoint}; retry in {retry_after:.1f}s",
+            Severity.WARN,
+            ErrorKind.HTTP,
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Three-state breaker for one endpoint.
+
+    - CLOSED: calls pass; failure_threshold consecutive failures open the circuit.
+    - OPEN: calls are refused with CircuitOpenError until cooldown_seconds have passed.
+    - HALF_OPEN: up to half_open_max_calls trial calls pass; one success closes
+      the circuit, one failure opens it again for another cooldown.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: BreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+        on_transition: Optional[Callable[[str, CircuitState, CircuitState], None]] = None,
+    ):
+        self.name = name
+        self.config = config
+        self._clock = clock
+        self._on_transition = on_transition
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def retry_after(self) -> float:
+        """
+        Seconds until the circuit lets a call through again (0 if it does now).
+        """
+        with self._lock:
+            self._refresh()
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.config.cooldown_seconds - self._clock())
+
+    def before_call(self) -> None:
+        """
+        Claim permission for one call or raise CircuitOpenError.
+        """
+        with self._lock:
+            self._refresh()
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.HALF_OPEN and self._trials < self.config.half_open_max_calls:
+                self._trials += 1
+                return
+            wait = max(0.0, self._opened_at + self.config.cooldown_seconds - self._clock())
+        raise CircuitOpenError(self.name, wait)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._state is not CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED and self._failures >= self.config.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(CircuitState.OPEN)
+
+    def _refresh(self) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.config.cooldown_seconds
+        ):
+            self._trials = 0
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state, self._state = self._state, new_state
+        if new_state is CircuitState.CLOSED:
+            self._failures = 0
+        if self._on_transition:
+            self._on_transition(self.name, old_state, new_state)
+
+
+class CircuitBreakerRegistry:
+    """
+    One breaker per endpoint name, created on first use from the config.
+    State changes are logged and recorded as run events.
+    """
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig,
+        event_logger: Optional[RunEventLogger] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config
+        self.event_logger = event_logger
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    endpoint,
+                    self.config.for_endpoint(endpoint),
+                    clock=self._clock,
+                    on_transition=self._log_transition,
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def snapshot(self) -> Dict[str, str]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state.value for breaker in breakers}
+
+    def _log_transition(self, endpoint: str, old: CircuitState, new: CircuitState) -> None:
+        msg = f"Circuit {endpoint}: {old.value} -> {new.value}"
+        if new is CircuitState.OPEN:
+            logger.warning(msg)
+        else:
+            logger.info(msg)
+        if self.event_logger:
+            self.event_logger.log(
+                f"CIRCUIT_{new.value}",
+                msg,
+                {"endpoint": endpoint, "from": old.value, "to": new.value},
+            )
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from ..collectors.search_collector import SearchCollector
 from ..collectors.article_parser import ArticleParser
 from ..collectors.comment_parser import CommentParser, JSONPParseError, SchemaMismatchError
+from ..http.client import RequestsHttpClient
 from ..ops.probe import EndpointProbe
 from ..ops.evidence import EvidenceCollector
 from ..common.errors import AppError, ErrorKind, Severity
@@ -26,8 +27,8 @@ class HealthCheck:
     ):
         self.config = config
         self.searcher = searcher or SearchCollector(config.search)
-        self.parser = parser or ArticleParser()
         self.probe = probe or EndpointProbe()
+        self.parser = parser or ArticleParser(RequestsHttpClient(), extract_body=False, probe=self.probe)
         self.comment_fetcher = comment_fetcher
         self.comment_parser = comment_parser
         self.evidence = evidence or EvidenceCollector(run_id="health_check")
@@ -74,8 +75,7 @@ class HealthCheck:
                 logger.error("Sample %s Failed: Metadata parse error", tried)
                 continue
 
-            raw_html = metadata.get("_raw_html", "")
-            candidate_params = self.probe.get_candidate_configs(url, raw_html)
+            candidate_params = self.probe.get_candidate_configs(url, discovered=self._discovered_params(url, metadata))
             sample_success = False
 
             for attempt, params in enumerate(candidate_params, start=1):
@@ -138,6 +138,25 @@ class HealthCheck:
         logger.critical("Pre-flight Health Check FAILED (%s/%s)", success_count, tried)
         return False
 
+    def _discovered_params(self, url: str, metadata: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Params the parser's probe discovered, or our own discovery when the parser runs none.
+        """
+        discovered = metadata.get("probe_params")
+        if discovered is not None or getattr(self.parser, "probe", None) is not None:
+            return discovered
+        http_client = getattr(self.parser, "http_client", None)
+        if http_client is None:
+            return None
+        try:
+            resp = http_client.request("GET", url, headers=getattr(self.parser, "headers", {}), timeout=10)
+        except Exception as exc:
+            logger.warning("Health Check: probe discovery fetch failed for %s: %s", url, exc)
+            return None
+        if resp.status_code != 200:
+            return None
+        return self.probe.discover_parameters(url, resp.text)
+
     def _fetch_comment_payload(self, oid: str, aid: str, params: Dict[str, str]) -> Any:
         fetch_page_attr = getattr(self.comment_fetcher, "fetch_page", None)
         if callable(fetch_page_attr):
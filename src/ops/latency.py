@@ -0,0 +1,123 @@
+import logging
+import math
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..config import TimeoutConfig
+
+logger = logging.getLogger(__name__)
+
+TimeoutValue = Union[float, Tuple[float, float]]
+
+
+class LatencyHistogram:
+    """
+    Streaming latency distribution over fixed log-spaced buckets.
+
+    Bucket i covers (MIN_SECONDS * GROWTH**(i-1), MIN_SECONDS * GROWTH**i], so any
+    percentile is reported within one bucket width (+20%) of the true value using
+    constant memory. observe() is O(1); percentile() walks the bucket array.
+    """
+
+    MIN_SECONDS = 0.001
+    MAX_SECONDS = 600.0
+    GROWTH = 1.2
+
+    def __init__(self):
+        size = int(math.ceil(math.log(self.MAX_SECONDS / self.MIN_SECONDS, self.GROWTH))) + 1
+        self._counts: List[int] = [0] * size
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self._counts[self._bucket(seconds)] += 1
+        self.count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the q-quantile (q in [0, 1]); None when empty.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self._upper_bound(index)
+        return self._upper_bound(len(self._counts) - 1)
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.MIN_SECONDS:
+            return 0
+        index = int(math.ceil(math.log(seconds / self.MIN_SECONDS, self.GROWTH)))
+        return min(index, len(self._counts) - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        return min(self.MAX_SECONDS, self.MIN_SECONDS * self.GROWTH ** index)
+
+
+class LatencyTracker:
+    """
+    Per-endpoint latency histograms and the read timeouts derived from them.
+
+    Once an endpoint has min_samples observations its read timeout becomes
+    adaptive_multiplier x the adaptive_percentile latency, clamped to
+    [adaptive_min_read, adaptive_max_read]. Until then the caller's timeout stands.
+    Requests that time out are counted separately and recorded at their elapsed
+    time, so a run of timeouts pushes the percentile (and the timeout) back up.
+    """
+
+    def __init__(self, config: TimeoutConfig):
+        self.config = config
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = self._histograms[endpoint] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def record_timeout(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            self._timeouts[endpoint] = self._timeouts.get(endpoint, 0) + 1
+        self.observe(endpoint, elapsed)
+
+    def read_timeout(self, endpoint: str) -> Optional[float]:
+        """
+        Adaptive read timeout for the endpoint, or None while it has too few samples.
+        """
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None or histogram.count < self.config.adaptive_min_samples:
+                return None
+            latency = histogram.percentile(self.config.adaptive_percentile)
+        read = latency * self.config.adaptive_multiplier
+        return min(self.config.adaptive_max_read, max(self.config.adaptive_min_read, read))
+
+    def timeout_for(self, endpoint: str, requested: Optional[TimeoutValue]) -> TimeoutValue:
+        """
+        Replace the read part of a requests-style timeout with the adaptive value.
+        """
+        read = self.read_timeout(endpoint)
+        if read is None:
+            return requested if requested is not None else (self.config.connect, self.config.read)
+        connect = requested[0] if isinstance(requested, tuple) else self.config.connect
+        return (connect, read)
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
+        with self._lock:
+            endpoints = list(self._histograms.items())
+            timeouts = dict(self._timeouts)
+        summary = {}
+        for endpoint, histogram in endpoints:
+            summary[endpoint] = {
+                "count": histogram.count,
+                "p50": histogram.percentile(0.50),
+                "p95": histogram.percentile(0.95),
+                "p99": histogram.percentile(0.99),
+                "timeouts": timeouts.get(endpoint, 0),
+            }
+        return summary
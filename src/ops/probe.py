@@ -1,9 +1,40 @@
 import logging
 import re
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# External scripts (src=...) and JSON-LD data blocks carry no probe params.
+_NON_INLINE_SCRIPT_RE = re.compile(r"\bsrc\s*=|application/ld\+json", re.IGNORECASE)
+MAX_SCRIPT_REGION_CHARS = 256 * 1024
+
+# One alternation for every key Naver embeds, e.g. `serviceName: "news"`, `var _cv = "news";`.
+# Longer names come first so `_templateId` / `templateId` are not split into `template`.
+_PARAM_SCAN_RE = re.compile(
+    r"(?P<name>serviceName|_templateId|templateId|template|_cv|pool)"
+    r"\s*(?P<op>[:=])\s*[\"'](?P<value>[^\"']+)[\"']"
+)
+# Output key -> pattern labels in priority order.
+_PARAM_SLOTS = {
+    "ticket": ("serviceName:", "_cv="),
+    "templateId": ("templateId:", "_templateId="),
+    "pool": ("pool",),
+    "cv": ("_cv=",),
+    "template": ("template:",),
+}
+# (matched name, operator) -> (key, label) slots it fills.
+_SLOT_TARGETS = {
+    ("serviceName", ":"): (("ticket", "serviceName:"),),
+    ("_cv", "="): (("ticket", "_cv="), ("cv", "_cv=")),
+    ("templateId", ":"): (("templateId", "templateId:"),),
+    ("_templateId", ":"): (("templateId", "templateId:"),),
+    ("_templateId", "="): (("templateId", "_templateId="),),
+    ("pool", ":"): (("pool", "pool"),),
+    ("pool", "="): (("pool", "pool"),),
+    ("template", ":"): (("template", "template:"),),
+}
+_TERMINAL_SLOTS = {(key, labels[0]) for key, labels in _PARAM_SLOTS.items()}
+
 class EndpointProbe:
     def __init__(self):
         self.known_configs = [
@@ -13,16 +44,23 @@ class EndpointProbe:
             {"ticket": "news", "templateId": "view_politics"},
         ]
 
-    def get_candidate_configs(self, url: str, article_html: str) -> List[Dict[str, str]]:
+    def get_candidate_configs(
+        self,
+        url: str,
+        article_html: str = "",
+        discovered: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, str]]:
         """
         Returns a list of configuration dictionaries to try, in order of priority:
         1. Auto-discovered parameters (if any)
         2. Known Config A
         3. Known Config B
+        Callers that already ran discovery (ArticleParser) pass `discovered` instead of HTML.
         """
         candidates = []
         
-        discovered = self.discover_parameters(url, article_html)
+        if discovered is None and article_html:
+            discovered = self.discover_parameters(url, article_html)
         if discovered:
             candidates.append(discovered)
             
@@ -30,59 +68,72 @@ class EndpointProbe:
         candidates.extend(self.known_configs)
         return candidates
 
+    def extract_script_region(self, article_html: str, max_chars: int = MAX_SCRIPT_REGION_CHARS) -> str:
+        """
+        Concatenate inline <script> bodies, capped at max_chars, so discovery never
+        needs to hold on to the full article page.
+        """
+        parts: List[str] = []
+        remaining = max_chars
+        for start, end in _iter_inline_scripts(article_html or ""):
+            if remaining <= 0:
+                break
+            chunk = article_html[start:min(end, start + remaining)]
+            if not chunk.strip():
+                continue
+            parts.append(chunk)
+            remaining -= len(chunk)
+        return "\n".join(parts)
+
     def discover_parameters(self, article_url: str, article_html: str) -> Optional[Dict[str, str]]:
         """
         Attempt to auto-discover parameters from HTML (ticket, templateId, objectId).
         Fallback to known configs if auto-discovery fails.
         """
-        # 1. Auto-discovery (Regex/DOM)
-        discovered = {} 
-        
-        if article_html:
-            # Pattern 1: var _cv = "news"; var _templateId = "view_politics";
-            # Note: Naver often uses `data-service-name` or JS vars.
-            
-            # Ticket (service name)
-            ticket_match = re.search(r'serviceName\s*:\s*["\']([^"\']+)["\']', article_html)
-            if not ticket_match:
-                ticket_match = re.search(r'_cv\s*=\s*["\']([^"\']+)["\']', article_html)
-            
-            if ticket_match:
-                discovered['ticket'] = ticket_match.group(1)
-            else:
-                discovered['ticket'] = 'news' # Default
+        discovered, sources = self.scan_parameters(article_html)
+        if discovered.get('ticket') and discovered.get('templateId'):
+            logger.debug(f"Probe discovered params: {discovered} (matched by {sources})")
+            return discovered
+        return None
 
-            # Template ID
-            # Look for `templateId = 'view_politics'` or similar
-            tmpl_match = re.search(r'templateId\s*:\s*["\']([^"\']+)["\']', article_html)
-            if not tmpl_match:
-                tmpl_match = re.search(r'_templateId\s*=\s*["\']([^"\']+)["\']', article_html)
-            
-            if tmpl_match:
-                discovered['templateId'] = tmpl_match.group(1)
+    def scan_parameters(self, article_html: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Single pass over the inline script region with one precompiled pattern.
+        Returns (params, sources) where sources names the pattern that produced each key.
+        Earlier patterns in _PARAM_SLOTS win, matching the old per-key regex priority;
+        scanning stops as soon as every top-priority slot has been filled.
+        """
+        if not article_html:
+            return {}, {}
 
-            # Pool (cbox5 usually, but sometimes different)
-            pool_match = re.search(r'pool\s*[:=]\s*["\']([^"\']+)["\']', article_html)
-            if pool_match:
-                discovered['pool'] = pool_match.group(1)
+        text = article_html
+        if "<script" in text:
+            text = self.extract_script_region(text)
 
-            # CV (Client Version or similar)
-            cv_match = re.search(r'_cv\s*=\s*["\']([^"\']+)["\']', article_html)
-            if cv_match:
-                discovered['cv'] = cv_match.group(1)
-                
-            # Template (sometimes distinct from templateId)
-            t_match = re.search(r'template\s*:\s*["\']([^"\']+)["\']', article_html)
-            if t_match:
-                discovered['template'] = t_match.group(1)
+        found: Dict[Tuple[str, str], str] = {}
+        for match in _PARAM_SCAN_RE.finditer(text):
+            slot = (match.group("name"), match.group("op"))
+            targets = _SLOT_TARGETS.get(slot)
+            if not targets:
+                continue
+            for target in targets:
+                found.setdefault(target, match.group("value"))
+            if _TERMINAL_SLOTS.issubset(found):
+                break
 
-            # ObjectId is usually constructed from oid,aid, but sometimes explicit
-            # We assume caller has oid,aid. If needed, we can extract `g_did` or `newsId` here.
-        
-        if discovered.get('ticket') and discovered.get('templateId'):
-            logger.debug(f"Probe discovered params: {discovered}")
-            return discovered
-        return None
+        discovered: Dict[str, str] = {}
+        sources: Dict[str, str] = {}
+        for key, candidates in _PARAM_SLOTS.items():
+            for label in candidates:
+                if (key, label) in found:
+                    discovered[key] = found[(key, label)]
+                    sources[key] = label
+                    break
+
+        if 'ticket' not in discovered:
+            discovered['ticket'] = 'news' # Default
+            sources['ticket'] = 'default'
+        return discovered, sources
 
     def deep_validate_response(self, json_data: Dict[str, Any]) -> bool:
         """
@@ -112,3 +163,25 @@ class EndpointProbe:
             return True
         except Exception:
             return False
+
+
+def _iter_inline_scripts(html: str) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) offsets of inline <script> bodies using str.find, which is
+    much cheaper than a lazy DOTALL regex over a page of article markup.
+    Naver serves lowercase tags, so the search is case-sensitive.
+    """
+    pos = 0
+    while True:
+        tag_start = html.find("<script", pos)
+        if tag_start < 0:
+            return
+        tag_end = html.find(">", tag_start)
+        if tag_end < 0:
+            return
+        body_end = html.find("</script", tag_end)
+        if body_end < 0:
+            body_end = len(html)
+        if not _NON_INLINE_SCRIPT_RE.search(html, tag_start, tag_end):
+            yield tag_end + 1, body_end
+        pos = body_end + 1
@@ -1,8 +1,10 @@
 import time
 import random
 import logging
+from typing import Optional
 import requests
 from ..config import RateLimitConfig
+from .shared_budget import SharedRateBudget
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +12,7 @@ class RateLimiter:
     """
     Manages request delays and provides a reusable session.
     """
-    def __init__(self, config: RateLimitConfig):
+    def __init__(self, config: RateLimitConfig, shared_budget: Optional[SharedRateBudget] = None):
         self.baseline_min = config.baseline_min_delay
         self.min_delay = config.min_delay
         self.max_delay = config.max_delay
@@ -20,11 +22,17 @@ class RateLimiter:
         if self.max_delay < self.min_delay:
             self.max_delay = self.min_delay + 1.0
 
+        # Optional host-wide token bucket shared with other crawler processes.
+        self.shared_budget = shared_budget
+
     def wait(self):
         """
-        Sleep for a random duration between min_delay and max_delay.
+        Sleep for a random duration between min_delay and max_delay, or until the
+        shared budget's reserved token is due if that is later.
         """
         delay = random.uniform(self.min_delay, self.max_delay)
+        if self.shared_budget is not None:
+            delay = max(delay, self.shared_budget.reserve())
         if delay > 0:
             time.sleep(delay)
 
@@ -38,5 +46,12 @@ class RateLimiter:
         spread = max(1.0, self.max_delay - self.baseline_min) 
         self.max_delay = self.min_delay + spread
         
+    def update_delay_range(self, min_delay: float, max_delay: float):
+        """
+        Set both delay bounds directly (adaptive throttling picks its own jitter).
+        """
+        self.min_delay = max(0.0, min_delay)
+        self.max_delay = max(self.min_delay, max_delay)
+
     def close(self):
         self.session.close()
\ No newline at end of file
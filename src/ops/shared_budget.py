@@ -0,0 +1,106 @@
+import logging
+import sqlite3
+import time
+from typing import Callable, Optional
+
+from ..config import RateLimitConfig
+from ..storage.db import Database
+
+logger = logging.getLogger(__name__)
+
+
+class SharedRateBudget:
+    """
+    Token bucket kept in a SQLite file that every crawler process on the host opens.
+
+    Each request reserves one token inside a BEGIN IMMEDIATE transaction, so the
+    processes are serialized by SQLite's write lock. When the bucket is empty the
+    token is still taken (the balance goes negative) and the caller is told how long
+    to wait for it, which queues processes in reservation order without polling.
+    The aggregate rate therefore stays at rate_per_second however many processes run.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        key: str,
+        rate_per_second: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive.")
+        self.db = db
+        self.key = key
+        self.rate = rate_per_second
+        self.burst = max(1.0, burst)
+        # Wall-clock time, since timestamps are compared across processes.
+        self._clock = clock
+        self._init_schema()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return the seconds until it is due (0 if available now).
+        """
+        conn = self.db.get_connection()
+        conn.isolation_level = None
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = self._clock()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_budget WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            if row is None:
+                tokens = self.burst
+            else:
+                tokens = min(self.burst, row["tokens"] + max(0.0, now - row["updated_at"]) * self.rate)
+            tokens -= 1.0
+            conn.execute(
+                """
+                INSERT INTO rate_budget (key, tokens, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at
+                """,
+                (self.key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return max(0.0, -tokens / self.rate)
+
+    def _init_schema(self) -> None:
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS rate_budget (
+                        key TEXT PRIMARY KEY,
+                        tokens REAL NOT NULL,
+                        updated_at REAL NOT NULL
+                    )
+                    """
+                )
+        finally:
+            conn.close()
+
+
+def build_shared_budget(config: RateLimitConfig) -> Optional[SharedRateBudget]:
+    if config.shared_backend != "sqlite":
+        return None
+    logger.info(
+        "Sharing a %.2f req/s budget '%s' via %s",
+        config.shared_rate_per_second,
+        config.shared_key,
+        config.shared_db_path,
+    )
+    return SharedRateBudget(
+        Database(config.shared_db_path, wal_mode=True),
+        key=config.shared_key,
+        rate_per_second=config.shared_rate_per_second,
+        burst=config.shared_burst,
+    )
@@ -10,6 +10,15 @@ from .run_events import RunEventLogger
 
 logger = logging.getLogger(__name__)
 
+
+def _push(window: deque, hit: bool) -> int:
+    """
+    Append to a bounded window and return the change in its hit count.
+    """
+    evicted = window[0] if len(window) == window.maxlen else False
+    window.append(hit)
+    return int(hit) - int(evicted)
+
 class AutoThrottler:
     """
     Monitors response status codes and adjusts RateLimiter delays.
@@ -31,16 +40,19 @@ class AutoThrottler:
         
         # Sliding window for 429 detection (True if 429, False otherwise)
         self.history = deque(maxlen=config.window)
+        self._history_hits = 0
         
         # Recovery window (longer history)
         self.recovery_history = deque(maxlen=config.recovery_window)
+        self._recovery_hits = 0
         
         self.is_stopped = False
         self.stop_reason = None
 
-    def observe(self, status_code: int):
+    def observe(self, status_code: int, latency: Optional[float] = None):
         """
         Feed a response status code to the throttler.
+        Latency is accepted for interface parity with AdaptiveThrottler and ignored here.
         """
         if self.is_stopped:
             return
@@ -50,28 +62,30 @@ class AutoThrottler:
             self._emergency_stop("Received 403 Forbidden")
             return
 
-        # 2. Record history
+        # 2. Record history (running hit counts instead of re-summing the windows)
         is_429 = (status_code == 429)
-        self.history.append(is_429)
-        self.recovery_history.append(is_429)
+        self._history_hits += _push(self.history, is_429)
+        self._recovery_hits += _push(self.recovery_history, is_429)
 
         # 3. Check Throttle Up (Window full)
         if len(self.history) == self.history.maxlen:
-            ratio_429 = sum(self.history) / len(self.history)
+            ratio_429 = self._history_hits / len(self.history)
             if ratio_429 > self.config.ratio_429_threshold:
                 self._throttle_up(ratio_429)
                 # Clear history to avoid rapid-fire step-ups
-                self.history.clear() 
+                self.history.clear()
+                self._history_hits = 0
                 return
 
         # 4. Check Recovery (Window full)
         if len(self.recovery_history) == self.recovery_history.maxlen:
-            ratio_429_rec = sum(self.recovery_history) / len(self.recovery_history)
+            ratio_429_rec = self._recovery_hits / len(self.recovery_history)
             if ratio_429_rec < self.config.ratio_429_recovery_threshold:
                 # Only recover if we are above baseline
                 if self.limiter.min_delay > self.limiter.baseline_min:
                     self._throttle_down(ratio_429_rec)
                     self.recovery_history.clear()
+                    self._recovery_hits = 0
 
     def _throttle_up(self, ratio: float):
         old_val = self.limiter.min_delay
@@ -113,3 +127,119 @@ class AutoThrottler:
             conn.close()
         except Exception as e:
             logger.error(f"Failed to log throttle event: {e}")
+
+
+
+class AdaptiveThrottler(AutoThrottler):
+    """
+    AIMD controller for the request delay.
+
+    - Congestion (429/5xx, or the windowed 429 ratio above ratio_429_threshold)
+      multiplies the delay by aimd_decrease_factor, at most once per `window` responses.
+    - Every aimd_success_window clean responses take aimd_increase_step off the delay,
+      down to floor_delay. rate_limit.baseline_min_delay is only the starting point, so
+      the delay settles at the fastest rate the server sustains.
+    - Rising latency holds the rate: while the fast latency EWMA is above
+      latency_tolerance x its recent minimum, increases are skipped. The minimum drifts
+      up towards the EWMA, so a lasting shift in server latency stops counting as congestion.
+
+    All windows are kept with running counters, so observe() is O(1).
+    """
+
+    LATENCY_ALPHA = 0.2
+    # Share of the gap to the EWMA the latency floor closes per response.
+    LATENCY_FLOOR_DECAY = 0.01
+
+    def __init__(
+        self,
+        config: AutoThrottleConfig,
+        limiter: RateLimiter,
+        db: Database,
+        run_id: str,
+        event_logger: Optional[RunEventLogger] = None,
+    ):
+        super().__init__(config, limiter, db, run_id, event_logger=event_logger)
+        self._since_decrease = config.window
+        self._clean_streak = 0
+        self._latency_ewma: Optional[float] = None
+        self._latency_floor: Optional[float] = None
+        self._apply(limiter.min_delay)
+
+    @property
+    def delay(self) -> float:
+        return self.limiter.min_delay
+
+    def observe(self, status_code: int, latency: Optional[float] = None):
+        if self.is_stopped:
+            return
+
+        if self.config.stop_on_403 and status_code == 403:
+            self._emergency_stop("Received 403 Forbidden")
+            return
+
+        congested = status_code == 429 or status_code >= 500
+        self._history_hits += _push(self.history, congested)
+        self._since_decrease += 1
+
+        if congested:
+            self._clean_streak = 0
+            self._maybe_decrease(f"HTTP {status_code}")
+            return
+
+        ratio = self._history_hits / len(self.history)
+        if len(self.history) == self.history.maxlen and ratio > self.config.ratio_429_threshold:
+            self._clean_streak = 0
+            self._maybe_decrease(f"error ratio {ratio:.2%}")
+            return
+
+        if latency is not None and self._latency_congested(latency):
+            self._clean_streak = 0
+            return
+
+        self._clean_streak += 1
+        if self._clean_streak >= self.config.aimd_success_window:
+            self._clean_streak = 0
+            self._increase()
+
+    def _latency_congested(self, latency: float) -> bool:
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += self.LATENCY_ALPHA * (latency - self._latency_ewma)
+        if self._latency_floor is None or self._latency_ewma < self._latency_floor:
+            self._latency_floor = self._latency_ewma
+        else:
+            self._latency_floor += self.LATENCY_FLOOR_DECAY * (self._latency_ewma - self._latency_floor)
+        return self._latency_ewma > self.config.latency_tolerance * self._latency_floor
+
+    def _maybe_decrease(self, reason: str):
+        if self._since_decrease < self.config.window:
+            return
+        self._since_decrease = 0
+        old_delay = self.delay
+        self._apply(max(old_delay * self.config.aimd_decrease_factor, old_delay + self.config.min_delay_step_up))
+        msg = f"Throttle UP ({reason}): delay {old_delay:.2f}s -> {self.delay:.2f}s"
+        logger.warning(msg)
+        self._log_event("THROTTLE_UP", msg)
+
+    def _increase(self):
+        old_delay = self.delay
+        self._apply(old_delay - self.config.aimd_increase_step)
+        if self.delay != old_delay:
+            logger.debug("Throttle DOWN: delay %.2fs -> %.2fs", old_delay, self.delay)
+
+    def _apply(self, delay: float):
+        delay = min(self.config.ceiling_delay, max(self.config.floor_delay, delay))
+        self.limiter.update_delay_range(delay, delay * (1.0 + self.config.aimd_jitter))
+
+
+def build_throttler(
+    config: AutoThrottleConfig,
+    limiter: RateLimiter,
+    db: Database,
+    run_id: str,
+    event_logger: Optional[RunEventLogger] = None,
+) -> AutoThrottler:
+    if config.mode == "aimd":
+        return AdaptiveThrottler(config, limiter, db, run_id, event_logger=event_logger)
+    return AutoThrottler(config, limiter, db, run_id, event_logger=event_logger)
@@ -1,35 +1,188 @@
 import math
-from typing import List, Optional
+from typing import Dict, Optional, Sequence, Tuple
+
+
+def trimmed_mean(values: Sequence[float]) -> float:
+    """
+    Mean of the P20-P80 band once there are at least five values; plain mean below that.
+    """
+    if not values:
+        return 0.0
+    sorted_values = sorted(values)
+    trim = max(1, int(len(sorted_values) * 0.2)) if len(sorted_values) >= 5 else 0
+    if trim and len(sorted_values) > 2 * trim:
+        trimmed = sorted_values[trim : len(sorted_values) - trim]
+    else:
+        trimmed = sorted_values
+    return sum(trimmed) / len(trimmed) if trimmed else 0.0
+
+
+class OrderStatistics:
+    """
+    Multiset of non-negative integers backed by Fenwick trees over the value range
+    (one for counts, one for sums). add(), rank queries and prefix sums are
+    O(log V) where V is the largest value seen; the range doubles on demand.
+    """
+
+    def __init__(self, initial_size: int = 1024):
+        self._size = 1
+        while self._size < initial_size:
+            self._size <<= 1
+        self._counts = [0] * (self._size + 1)
+        self._sums = [0] * (self._size + 1)
+        self._histogram: Dict[int, int] = {}
+        self._total = 0
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def add(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("OrderStatistics only holds non-negative values")
+        if value >= self._size:
+            self._grow(value)
+        self._histogram[value] = self._histogram.get(value, 0) + 1
+        self._n += 1
+        self._total += value
+        self._update(value, 1)
+
+    def kth(self, k: int) -> int:
+        """
+        Value at 0-based rank k in sorted order.
+        """
+        if not 0 <= k < self._n:
+            raise IndexError("rank out of range")
+        position = 0
+        remaining = k + 1
+        step = self._size
+        counts = self._counts
+        while step:
+            nxt = position + step
+            if nxt <= self._size and counts[nxt] < remaining:
+                position = nxt
+                remaining -= counts[nxt]
+            step >>= 1
+        # Tree index position + 1 is the first whose cumulative count exceeds k; it holds value `position`.
+        return position
+
+    def smallest_sum(self, r: int) -> int:
+        """
+        Sum of the r smallest values.
+        """
+        if r <= 0:
+            return 0
+        if r >= self._n:
+            return self._total
+        value = self.kth(r - 1)
+        below_count, below_sum = self._prefix(value)
+        return below_sum + (r - below_count) * value
+
+    def percentile(self, q: float) -> float:
+        """
+        Linear-interpolated percentile for q in [0, 1] (numpy's default method).
+        """
+        if not self._n:
+            return 0.0
+        position = min(max(q, 0.0), 1.0) * (self._n - 1)
+        lower = math.floor(position)
+        low_value = self.kth(lower)
+        if lower == position:
+            return float(low_value)
+        high_value = self.kth(lower + 1)
+        return low_value + (high_value - low_value) * (position - lower)
+
+    def trimmed_mean(self) -> float:
+        """
+        Same P20-P80 rule as trimmed_mean(), from rank sums instead of a sort.
+        """
+        n = self._n
+        if not n:
+            return 0.0
+        trim = max(1, int(n * 0.2)) if n >= 5 else 0
+        if not trim or n <= 2 * trim:
+            return self._total / n
+        return (self.smallest_sum(n - trim) - self.smallest_sum(trim)) / (n - 2 * trim)
+
+    def _update(self, value: int, count: int) -> None:
+        index = value + 1
+        counts, sums, size = self._counts, self._sums, self._size
+        while index <= size:
+            counts[index] += count
+            sums[index] += value * count
+            index += index & -index
+
+    def _prefix(self, value: int) -> Tuple[int, int]:
+        """
+        (count, sum) of values strictly below value.
+        """
+        index = min(value, self._size)
+        count = total = 0
+        counts, sums = self._counts, self._sums
+        while index > 0:
+            count += counts[index]
+            total += sums[index]
+            index -= index & -index
+        return count, total
+
+    def _grow(self, value: int) -> None:
+        size = self._size
+        while size <= value:
+            size <<= 1
+        self._size = size
+        self._counts = [0] * (size + 1)
+        self._sums = [0] * (size + 1)
+        for existing, count in self._histogram.items():
+            self._update(existing, count)
+
+
+VOLUME_ESTIMATORS = ("trimmed_mean_p20_p80", "median", "mean")
 
 
 class VolumeTracker:
     """
-    Tracks comment counts per article and advises when to expand the search pool
-    using a trimmed-mean estimator (P20-P80).
+    Tracks comment counts per article and advises when to expand the search pool.
+    The per-article yield estimate comes from the configured estimator
+    (P20-P80 trimmed mean by default); every query is O(log n).
     """
 
-    def __init__(self):
-        self._counts: List[int] = []
+    def __init__(self, estimator: str = "trimmed_mean_p20_p80"):
+        if estimator not in VOLUME_ESTIMATORS:
+            raise ValueError(f"Unsupported volume estimator: {estimator}")
+        self.estimator = estimator
+        self._stats = OrderStatistics()
 
     def add_count(self, count: int) -> None:
-        self._counts.append(max(0, count))
+        self._stats.add(max(0, count))
 
     def current_trimmed_mean(self) -> float:
-        if not self._counts:
-            return 0.0
-        sorted_counts = sorted(self._counts)
-        trim = max(1, int(len(sorted_counts) * 0.2)) if len(sorted_counts) >= 5 else 0
-        if trim and len(sorted_counts) > 2 * trim:
-            trimmed = sorted_counts[trim : len(sorted_counts) - trim]
-        else:
-            trimmed = sorted_counts
-        return sum(trimmed) / len(trimmed) if trimmed else 0.0
+        return self._stats.trimmed_mean()
+
+    def current_median(self) -> float:
+        return self._stats.percentile(0.5)
+
+    def current_mean(self) -> float:
+        return self._stats.total / len(self._stats) if len(self._stats) else 0.0
+
+    def percentile(self, q: float) -> float:
+        return self._stats.percentile(q)
+
+    def estimate_yield(self) -> float:
+        if self.estimator == "median":
+            return self.current_median()
+        if self.estimator == "mean":
+            return self.current_mean()
+        return self.current_trimmed_mean()
 
     def estimate_remaining_articles(self, target_comments: int, collected_comments: int) -> Optional[int]:
         remaining = max(0, target_comments - collected_comments)
         if remaining == 0:
             return 0
-        mean = self.current_trimmed_mean()
+        mean = self.estimate_yield()
         if mean <= 0:
             return None
         return math.ceil(remaining / mean)
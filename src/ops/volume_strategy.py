@@ -1,18 +1,47 @@
+import logging
+from collections import deque
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Deque, List, Optional, Sequence
+
+from ..config import VolumeStrategyConfig
+from .volume import trimmed_mean
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class VolumeDecision:
     should_stop: bool
     reason: Optional[str] = None
+    # Projected seconds until target_comments, for strategies that track a rate.
+    eta_seconds: Optional[float] = None
 
 class IVolumeStrategy(ABC):
+    # Reason reported when should_interrupt() ends the run.
+    interrupt_reason = "STOPPED"
+
     @abstractmethod
     def decide(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
         pass
 
+    def should_interrupt(self, current_volume: int, elapsed_seconds: float) -> bool:
+        """
+        Side-effect-free check used between pages of an article; decide() stays once per article.
+        """
+        return False
+
+    def check(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
+        """
+        should_interrupt() as a decision, for points decide() does not see: skipped
+        articles and cool-down waits.
+        """
+        if self.should_interrupt(current_volume, elapsed_seconds):
+            return VolumeDecision(should_stop=True, reason=self.interrupt_reason)
+        return VolumeDecision(should_stop=False)
+
 class FixedTargetStrategy(IVolumeStrategy):
+    interrupt_reason = "TARGET_REACHED"
+
     def __init__(self, target_comments: int):
         self.target_comments = target_comments
 
@@ -20,3 +49,138 @@ class FixedTargetStrategy(IVolumeStrategy):
         if current_volume >= self.target_comments:
             return VolumeDecision(should_stop=True, reason="TARGET_REACHED")
         return VolumeDecision(should_stop=False)
+
+    def should_interrupt(self, current_volume: int, elapsed_seconds: float) -> bool:
+        return current_volume >= self.target_comments
+
+class TimeBudgetStrategy(IVolumeStrategy):
+    """
+    Stops once the run has used its wall-clock budget.
+    """
+
+    interrupt_reason = "TIME_BUDGET"
+
+    def __init__(self, budget_seconds: float):
+        self.budget_seconds = budget_seconds
+
+    def decide(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
+        if elapsed_seconds >= self.budget_seconds:
+            return VolumeDecision(should_stop=True, reason="TIME_BUDGET")
+        return VolumeDecision(should_stop=False)
+
+    def should_interrupt(self, current_volume: int, elapsed_seconds: float) -> bool:
+        return elapsed_seconds >= self.budget_seconds
+
+class RateEtaStrategy(IVolumeStrategy):
+    """
+    Stops before an article that would not finish inside the time budget.
+
+    decide() is called once per crawled article, so the gaps between calls are
+    article durations; the next article is expected to take their trimmed mean.
+    The comments/sec rate also gives an ETA for target_comments, returned on every
+    decision and logged by the run loop; it is warned about once if it ends past the budget.
+    """
+
+    interrupt_reason = "TIME_BUDGET"
+
+    def __init__(self, budget_seconds: float, target_comments: int, window: int = 20):
+        self.budget_seconds = budget_seconds
+        self.target_comments = target_comments
+        self._durations: Deque[float] = deque(maxlen=max(1, window))
+        self._last_elapsed: Optional[float] = None
+        self.eta_seconds: Optional[float] = None
+        self._warned_overrun = False
+
+    def decide(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
+        if self._last_elapsed is not None:
+            self._durations.append(max(0.0, elapsed_seconds - self._last_elapsed))
+        self._last_elapsed = elapsed_seconds
+
+        if elapsed_seconds > 0 and current_volume > 0:
+            rate = current_volume / elapsed_seconds
+            self.eta_seconds = max(0, self.target_comments - current_volume) / rate
+            if elapsed_seconds + self.eta_seconds > self.budget_seconds and not self._warned_overrun:
+                self._warned_overrun = True
+                logger.warning(
+                    "At %.2f comments/s, target_comments=%d needs ~%.0fs more; the time budget ends in %.0fs.",
+                    rate,
+                    self.target_comments,
+                    self.eta_seconds,
+                    max(0.0, self.budget_seconds - elapsed_seconds),
+                )
+
+        if self._durations and elapsed_seconds + trimmed_mean(self._durations) > self.budget_seconds:
+            return VolumeDecision(should_stop=True, reason="ETA_OVERRUN", eta_seconds=self.eta_seconds)
+        return VolumeDecision(should_stop=False, eta_seconds=self.eta_seconds)
+
+    def should_interrupt(self, current_volume: int, elapsed_seconds: float) -> bool:
+        return elapsed_seconds >= self.budget_seconds
+
+class DiminishingReturnsStrategy(IVolumeStrategy):
+    """
+    Stops when the trimmed-mean yield of the last `window` articles drops below min_yield.
+    Per-article yields are the volume deltas between decide() calls.
+    """
+
+    def __init__(self, min_yield: float, window: int = 20):
+        self.min_yield = min_yield
+        self._yields: Deque[int] = deque(maxlen=max(1, window))
+        self._last_volume = 0
+
+    def decide(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
+        self._yields.append(max(0, current_volume - self._last_volume))
+        self._last_volume = current_volume
+        if len(self._yields) < self._yields.maxlen:
+            return VolumeDecision(should_stop=False)
+        if trimmed_mean(self._yields) < self.min_yield:
+            return VolumeDecision(should_stop=True, reason="DIMINISHING_RETURNS")
+        return VolumeDecision(should_stop=False)
+
+class CompositeStrategy(IVolumeStrategy):
+    """
+    Asks every strategy each time (they may keep per-call state); the first stop wins.
+    """
+
+    def __init__(self, strategies: Sequence[IVolumeStrategy]):
+        self.strategies = list(strategies)
+
+    def decide(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
+        decisions = [strategy.decide(current_volume, elapsed_seconds) for strategy in self.strategies]
+        etas = [decision.eta_seconds for decision in decisions if decision.eta_seconds is not None]
+        for decision in decisions:
+            if decision.should_stop:
+                return decision
+        return VolumeDecision(should_stop=False, eta_seconds=etas[0] if etas else None)
+
+    def should_interrupt(self, current_volume: int, elapsed_seconds: float) -> bool:
+        return any(strategy.should_interrupt(current_volume, elapsed_seconds) for strategy in self.strategies)
+
+    def check(self, current_volume: int, elapsed_seconds: float) -> VolumeDecision:
+        for strategy in self.strategies:
+            decision = strategy.check(current_volume, elapsed_seconds)
+            if decision.should_stop:
+                return decision
+        return VolumeDecision(should_stop=False)
+
+def build_stop_strategy(config: VolumeStrategyConfig) -> Optional[IVolumeStrategy]:
+    """
+    Build the stop strategies listed in volume_strategy.stop_strategies.
+    Time-based strategies are skipped when no time_budget_seconds is configured.
+    """
+    strategies: List[IVolumeStrategy] = []
+    for name in config.stop_strategies:
+        if name == "fixed_target" and config.target_comments:
+            strategies.append(FixedTargetStrategy(config.target_comments))
+        elif name == "time_budget" and config.time_budget_seconds:
+            strategies.append(TimeBudgetStrategy(config.time_budget_seconds))
+        elif name == "rate_eta" and config.time_budget_seconds:
+            strategies.append(RateEtaStrategy(config.time_budget_seconds, config.target_comments))
+        elif name == "diminishing_returns":
+            strategies.append(
+                DiminishingReturnsStrategy(config.diminishing_min_yield, window=config.diminishing_window)
+            )
+    if not strategies:
+        return None
+    if len(strategies) == 1:
+        return strategies[0]
+    return CompositeStrategy(strategies)
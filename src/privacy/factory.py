@@ -1,17 +1,22 @@
 import secrets
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..config import PrivacyConfig
 from .hashing import PrivacyHasher
 
 
-def build_privacy_hasher(config: PrivacyConfig, run_id: str) -> Tuple[PrivacyHasher, str]:
+def build_privacy_hasher(
+    config: PrivacyConfig,
+    run_id: str,
+    ephemeral_salt: Optional[str] = None,
+) -> Tuple[PrivacyHasher, str]:
     """
     Create a PrivacyHasher according to the configured mode.
     Returns the hasher and the salt that was used (not persisted).
+    ephemeral_salt lets the processes of one queue-mode run share a run salt.
     """
     if config.mode == "ephemeral":
-        salt = secrets.token_hex(32)
+        salt = ephemeral_salt or secrets.token_hex(32)
     elif config.mode == "longitudinal":
         if not config.fixed_salt:
             raise ValueError("privacy.fixed_salt must be provided when privacy.mode='longitudinal'.")
@@ -22,4 +27,12 @@ def build_privacy_hasher(config: PrivacyConfig, run_id: str) -> Tuple[PrivacyHas
     # Use run_id as entropy fallback if salt somehow empty (should not happen).
     if not salt:
         salt = f"{run_id}-{secrets.token_hex(16)}"
-    return PrivacyHasher(salt), salt
+    return hasher_from_salt(config, salt), salt
+
+
+def hasher_from_salt(config: PrivacyConfig, salt: str) -> PrivacyHasher:
+    """
+    The run's hasher for a known salt. Worker processes and reparse rebuild it with
+    this, so every path hashes with the same algorithm.
+    """
+    return PrivacyHasher(salt, algorithm=config.hash_algorithm, cache_size=config.hash_cache_size)
@@ -1,22 +1,76 @@
 import hashlib
 import hmac
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+SUPPORTED_ALGORITHMS = ("sha256", "blake2b")
+
 
 class PrivacyHasher:
-    def __init__(self, salt: str):
+    """
+    Keyed hashing of author identifiers.
+
+    Results are memoized in a bounded LRU that lives inside this instance, so the
+    memo is scoped to the run salt and never outlives the hasher.
+    """
+
+    def __init__(self, salt: str, algorithm: str = "sha256", cache_size: int = 65536):
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
         self.salt = salt.encode('utf-8')
+        self.algorithm = algorithm
+        self.cache_size = max(0, cache_size)
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        if algorithm == "blake2b":
+            # BLAKE2b keyed mode accepts keys up to 64 bytes.
+            key = self.salt if len(self.salt) <= 64 else hashlib.sha256(self.salt).digest()
+            self._digest = lambda data: hashlib.blake2b(data, key=key, digest_size=32).hexdigest()
+        else:
+            self._digest = lambda data: hmac.new(self.salt, data, hashlib.sha256).hexdigest()
 
     def hash_identifier(self, identifier: Optional[str]) -> Optional[str]:
         """
-        Return SHA-256 HMAC of identifier using run salt.
+        Return keyed hash (HMAC-SHA256 by default) of identifier using run salt.
         Safe against rainbow tables.
         Returns None if input is None/Empty.
         """
         if not identifier:
             return None
-            
-        return hmac.new(
-            self.salt, 
-            identifier.encode('utf-8'), 
-            hashlib.sha256
-        ).hexdigest()
+
+        cache = self._cache
+        cached = cache.get(identifier)
+        if cached is not None:
+            cache.move_to_end(identifier)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        value = self._digest(identifier.encode('utf-8'))
+        if self.cache_size:
+            cache[identifier] = value
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return value
+
+    def hash_many(self, identifiers: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """
+        Hash a batch of identifiers, preserving order. Empty values map to None.
+        """
+        hash_identifier = self.hash_identifier
+        return [hash_identifier(identifier) for identifier in identifiers]
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    def cache_stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "hit_rate": round(self.hit_rate, 4),
+        }
@@ -0,0 +1,368 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from .db import Database
+
+logger = logging.getLogger(__name__)
+
+QUEUE_STATES = ("QUEUED", "LEASED", "DONE", "FAILED")
+
+# Worker run statuses from best to worst; the run takes the worst one reported.
+WORKER_STATUSES = ("SUCCESS", "STOPPED", "PARTIAL", "FAILED")
+
+
+class CrawlQueue:
+    """
+    Article work queue for one run, shared by a planner process and worker processes
+    through the run's SQLite DB (WAL mode lets readers proceed while one process writes).
+
+    The planner fills the queue from the search feed; workers claim one article at a
+    time under a lease. A lease is kept alive by a heartbeat while its worker runs and
+    expires if the worker dies, after which the article is claimed again, up to
+    max_attempts claims before it is marked FAILED.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        run_id: str,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db = db
+        self.run_id = run_id
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        # Wall-clock time, since lease expiry is compared across processes.
+        self._clock = clock
+
+    # Planner -------------------------------------------------------------------
+    def start_planning(self) -> None:
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO crawl_plans (run_id, started_at) VALUES (?, ?)",
+                    (self.run_id, self._now_iso()),
+                )
+        finally:
+            conn.close()
+
+    def fill(self, feed: Iterable[Dict[str, Any]], batch_size: int = 50) -> int:
+        """
+        Enqueue articles from the feed, committing every batch_size items so workers
+        can start before the search finishes. Articles already queued are ignored.
+        """
+        added = 0
+        batch = []
+        for item in feed:
+            if not item.get("oid") or not item.get("aid"):
+                logger.warning("Not queueing article without OID/AID: %s", item.get("url"))
+                continue
+            batch.append(item)
+            if len(batch) >= batch_size:
+                added += self._enqueue(batch)
+                batch = []
+        if batch:
+            added += self._enqueue(batch)
+        return added
+
+    def finish_planning(self) -> None:
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE crawl_plans SET finished_at = ? WHERE run_id = ?",
+                    (self._now_iso(), self.run_id),
+                )
+        finally:
+            conn.close()
+
+    def has_plan(self) -> bool:
+        return self._plan_row() is not None
+
+    # Workers -------------------------------------------------------------------
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Lease the oldest queued article to worker_id, requeueing expired leases first.
+        """
+        conn = self.db.get_connection()
+        conn.isolation_level = None
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = self._clock()
+            expired = conn.execute(
+                """
+                UPDATE crawl_queue
+                SET state = CASE WHEN attempts >= ? THEN 'FAILED' ELSE 'QUEUED' END,
+                    worker_id = NULL,
+                    lease_expires_at = NULL
+                WHERE run_id = ? AND state = 'LEASED' AND lease_expires_at < ?
+                """,
+                (self.max_attempts, self.run_id, now),
+            ).rowcount
+            if expired:
+                logger.warning("Reclaimed %d expired lease(s) in run %s", expired, self.run_id)
+
+            row = conn.execute(
+                """
+                SELECT oid, aid, payload FROM crawl_queue
+                WHERE run_id = ? AND state = 'QUEUED'
+                ORDER BY rowid
+                LIMIT 1
+                """,
+                (self.run_id,),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    """
+                    UPDATE crawl_queue
+                    SET state = 'LEASED', worker_id = ?, lease_expires_at = ?, attempts = attempts + 1
+                    WHERE run_id = ? AND oid = ? AND aid = ?
+                    """,
+                    (worker_id, now + self.lease_seconds, self.run_id, row["oid"], row["aid"]),
+                )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return json.loads(row["payload"]) if row is not None else None
+
+    def renew(self, worker_id: str) -> int:
+        """
+        Extend every lease held by worker_id; returns how many were extended.
+        """
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                return conn.execute(
+                    """
+                    UPDATE crawl_queue SET lease_expires_at = ?
+                    WHERE run_id = ? AND worker_id = ? AND state = 'LEASED'
+                    """,
+                    (self._clock() + self.lease_seconds, self.run_id, worker_id),
+                ).rowcount
+        finally:
+            conn.close()
+
+    def complete(self, oid: str, aid: str, worker_id: str) -> None:
+        self._finish(oid, aid, worker_id, "'DONE'")
+
+    def release(self, oid: str, aid: str, worker_id: str, processed: Optional[bool] = None) -> None:
+        """
+        Give a lease back early. The article counts as done once it has a status row
+        for the run; otherwise it is queued again for another worker. Workers writing
+        to a shard DB pass processed themselves, since the row is not in this DB.
+        """
+        if processed is not None:
+            self._finish(oid, aid, worker_id, "'DONE'" if processed else "'QUEUED'")
+            return
+        self._finish(
+            oid,
+            aid,
+            worker_id,
+            """CASE WHEN EXISTS (
+                SELECT 1 FROM articles a
+                WHERE a.run_id = crawl_queue.run_id AND a.oid = crawl_queue.oid AND a.aid = crawl_queue.aid
+                  AND a.status != 'PENDING'
+            ) THEN 'DONE' ELSE 'QUEUED' END""",
+        )
+
+    def claims(
+        self,
+        worker_id: str,
+        poll_interval: float = 2.0,
+        is_processed: Optional[Callable[[str, str], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Feed of leased articles for run_collection_loop. Asking for the next article
+        completes the previous one; closing the feed releases the one in hand, using
+        is_processed(oid, aid) when given to decide whether it is done.
+        Ends once planning has finished and no article is queued or leased.
+        """
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(worker_id, stop),
+            name=f"lease-heartbeat-{worker_id}",
+            daemon=True,
+        )
+        heartbeat.start()
+        current: Optional[Dict[str, Any]] = None
+        try:
+            while True:
+                item = self.claim(worker_id)
+                if item is None:
+                    if self.is_drained():
+                        return
+                    time.sleep(poll_interval)
+                    continue
+                current = item
+                yield item
+                self.complete(item["oid"], item["aid"], worker_id)
+                current = None
+        finally:
+            stop.set()
+            if current is not None:
+                processed = is_processed(current["oid"], current["aid"]) if is_processed else None
+                self.release(current["oid"], current["aid"], worker_id, processed=processed)
+
+    # Progress ------------------------------------------------------------------
+    def counts(self) -> Dict[str, int]:
+        conn = self.db.get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT state, COUNT(*) AS n FROM crawl_queue WHERE run_id = ? GROUP BY state",
+                (self.run_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+        counts = {state: 0 for state in QUEUE_STATES}
+        counts.update({row["state"]: row["n"] for row in rows})
+        return counts
+
+    def is_drained(self) -> bool:
+        plan = self._plan_row()
+        if plan is None or plan["finished_at"] is None:
+            return False
+        counts = self.counts()
+        return counts["QUEUED"] == 0 and counts["LEASED"] == 0
+
+    def claim_finalize(self) -> bool:
+        """
+        True for exactly one caller once the queue is drained; that process closes the run.
+        """
+        if not self.is_drained():
+            return False
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                return conn.execute(
+                    "UPDATE crawl_plans SET finalized_at = ? WHERE run_id = ? AND finalized_at IS NULL",
+                    (self._now_iso(), self.run_id),
+                ).rowcount == 1
+        finally:
+            conn.close()
+
+    def report(
+        self,
+        worker_id: str,
+        status: str,
+        timestamp_anomalies: int = 0,
+        stop_reason: Optional[str] = None,
+        failure_reason: Optional[str] = None,
+    ) -> None:
+        """
+        Record how a worker's share of the run ended. A worker id that reports again
+        (a restarted worker) replaces its status and adds to its anomaly count.
+        """
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO crawl_workers (
+                        run_id, worker_id, status, timestamp_anomalies, stop_reason, failure_reason, reported_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(run_id, worker_id) DO UPDATE SET
+                        status = excluded.status,
+                        timestamp_anomalies = crawl_workers.timestamp_anomalies + excluded.timestamp_anomalies,
+                        stop_reason = excluded.stop_reason,
+                        failure_reason = excluded.failure_reason,
+                        reported_at = excluded.reported_at
+                    """,
+                    (self.run_id, worker_id, status, timestamp_anomalies, stop_reason, failure_reason, self._now_iso()),
+                )
+        finally:
+            conn.close()
+
+    def worker_summary(self) -> Dict[str, Any]:
+        """
+        Every worker's report folded into one: the worst status, the summed anomaly
+        count and the distinct stop and failure reasons.
+        """
+        conn = self.db.get_connection()
+        try:
+            rows = conn.execute(
+                """
+                SELECT status, timestamp_anomalies, stop_reason, failure_reason
+                FROM crawl_workers WHERE run_id = ? ORDER BY worker_id
+                """,
+                (self.run_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+        ranks = [WORKER_STATUSES.index(row["status"]) for row in rows if row["status"] in WORKER_STATUSES]
+        return {
+            "workers": len(rows),
+            "status": WORKER_STATUSES[max(ranks)] if ranks else None,
+            "timestamp_anomalies": sum(row["timestamp_anomalies"] for row in rows),
+            "stop_reasons": sorted({row["stop_reason"] for row in rows if row["stop_reason"]}),
+            "failure_reasons": sorted({row["failure_reason"] for row in rows if row["failure_reason"]}),
+        }
+
+    # Internals -----------------------------------------------------------------
+    def _enqueue(self, items: Iterable[Dict[str, Any]]) -> int:
+        now = self._now_iso()
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO crawl_queue (run_id, oid, aid, payload, enqueued_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (self.run_id, item["oid"], item["aid"], json.dumps(item, ensure_ascii=False), now)
+                        for item in items
+                    ],
+                )
+                return conn.total_changes - before
+        finally:
+            conn.close()
+
+    def _finish(self, oid: str, aid: str, worker_id: str, state_sql: str) -> None:
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    f"""
+                    UPDATE crawl_queue
+                    SET state = {state_sql}, worker_id = NULL, lease_expires_at = NULL, finished_at = ?
+                    WHERE run_id = ? AND oid = ? AND aid = ? AND worker_id = ? AND state = 'LEASED'
+                    """,
+                    (self._now_iso(), self.run_id, oid, aid, worker_id),
+                )
+        finally:
+            conn.close()
+
+    def _heartbeat(self, worker_id: str, stop: threading.Event) -> None:
+        while not stop.wait(self.lease_seconds / 3):
+            try:
+                self.renew(worker_id)
+            except sqlite3.Error as exc:
+                logger.warning("Lease heartbeat failed for %s: %s", worker_id, exc)
+
+    def _plan_row(self) -> Optional[sqlite3.Row]:
+        conn = self.db.get_connection()
+        try:
+            return conn.execute(
+                "SELECT finished_at, finalized_at FROM crawl_plans WHERE run_id = ?",
+                (self.run_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _now_iso() -> str:
+        return datetime.now(timezone.utc).isoformat()
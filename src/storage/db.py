@@ -6,10 +6,21 @@ from typing import Optional, Generator
 
 logger = logging.getLogger(__name__)
 
+# Bulk-load profile for rebuilding a DB from scratch: no fsync, an in-memory rollback
+# journal and a large page cache. A crash can corrupt the file, so only use it for
+# databases that can be rebuilt.
+BULK_PRAGMAS = (
+    "PRAGMA synchronous = OFF;",
+    "PRAGMA journal_mode = MEMORY;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -262144;",
+)
+
 class Database:
-    def __init__(self, db_path: str, wal_mode: bool = True):
+    def __init__(self, db_path: str, wal_mode: bool = True, bulk: bool = False):
         self.db_path = Path(db_path)
-        self.wal_mode = wal_mode
+        self.wal_mode = wal_mode and not bulk
+        self.bulk = bulk
         self._ensure_db_dir()
 
     def _ensure_db_dir(self):
@@ -25,6 +36,10 @@ class Database:
         
         if self.wal_mode:
             conn.execute("PRAGMA journal_mode = WAL;")
+
+        if self.bulk:
+            for pragma in BULK_PRAGMAS:
+                conn.execute(pragma)
             
         return conn
 
@@ -134,6 +149,68 @@ class Database:
                         FOREIGN KEY (run_id, oid, aid) REFERENCES articles(run_id, oid, aid)
                     );
                 """)
+
+                # 6. Search Cache Table (cross-run; not scoped to a run_id)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS search_cache (
+                        keyword TEXT NOT NULL,
+                        sort TEXT NOT NULL,
+                        source TEXT NOT NULL,
+                        slice_start TEXT NOT NULL,
+                        slice_end TEXT NOT NULL,
+                        page INTEGER NOT NULL,
+                        page_size INTEGER NOT NULL,
+                        payload TEXT NOT NULL,
+                        fetched_at TEXT NOT NULL,
+                        expires_at TEXT,
+                        PRIMARY KEY (keyword, sort, source, slice_start, slice_end, page, page_size)
+                    );
+                """)
+
+                # 7. Crawl Queue (queue mode: one planner fills it, worker processes lease from it)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_plans (
+                        run_id TEXT PRIMARY KEY,
+                        started_at TEXT NOT NULL,
+                        finished_at TEXT,
+                        finalized_at TEXT,
+                        FOREIGN KEY (run_id) REFERENCES runs(run_id)
+                    );
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_queue (
+                        run_id TEXT NOT NULL,
+                        oid TEXT NOT NULL,
+                        aid TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        state TEXT NOT NULL DEFAULT 'QUEUED'
+                            CHECK(state IN ('QUEUED', 'LEASED', 'DONE', 'FAILED')),
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        worker_id TEXT,
+                        lease_expires_at REAL,
+                        enqueued_at TEXT NOT NULL,
+                        finished_at TEXT,
+                        PRIMARY KEY (run_id, oid, aid),
+                        FOREIGN KEY (run_id) REFERENCES runs(run_id)
+                    );
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_crawl_queue_state ON crawl_queue (run_id, state, lease_expires_at);"
+                )
+                # Per-worker outcome, aggregated into the run row when the queue is drained.
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_workers (
+                        run_id TEXT NOT NULL,
+                        worker_id TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        timestamp_anomalies INTEGER NOT NULL DEFAULT 0,
+                        stop_reason TEXT,
+                        failure_reason TEXT,
+                        reported_at TEXT NOT NULL,
+                        PRIMARY KEY (run_id, worker_id),
+                        FOREIGN KEY (run_id) REFERENCES runs(run_id)
+                    );
+                """)
                 
             logger.info(f"Database schema initialized at {self.db_path}")
         except sqlite3.Error as e:
@@ -1,13 +1,16 @@
 import csv
 import logging
 from pathlib import Path
+from typing import Optional, Sequence
 from .db import Database
+from .shards import ShardedDatabase
 
 logger = logging.getLogger(__name__)
 
 class DataExporter:
-    def __init__(self, db: Database, export_dir: str = "exports"):
-        self.db = db
+    def __init__(self, db: Database, export_dir: str = "exports", shards: Optional[Sequence[Path]] = None):
+        # With worker shards, read through UNION views over the main DB and the shards instead of merging.
+        self.db = ShardedDatabase(db, shards) if shards else db
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
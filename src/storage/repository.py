@@ -1,11 +1,83 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from .db import Database
 
 logger = logging.getLogger(__name__)
 
+UPSERT_COMMENT_SQL = """
+    INSERT INTO comments (
+        run_id, oid, aid, comment_no, parent_comment_no, depth, contents,
+        author_hash, author_raw, reg_time, crawl_at, snapshot_at,
+        sympathy_count, antipathy_count, reply_count, is_deleted, is_blind
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(run_id, comment_no) DO UPDATE SET
+        contents = excluded.contents,
+        reply_count = excluded.reply_count,
+        sympathy_count = excluded.sympathy_count,
+        antipathy_count = excluded.antipathy_count,
+        is_deleted = excluded.is_deleted,
+        is_blind = excluded.is_blind
+    ;
+"""
+
+UPSERT_COMMENT_STATS_SQL = """
+    INSERT INTO comment_stats (
+        run_id, oid, aid, total_comments,
+        male_ratio, female_ratio,
+        age_10s, age_20s, age_30s, age_40s, age_50s, age_60s, age_70s,
+        snapshot_at, collected_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(run_id, oid, aid) DO UPDATE SET
+        total_comments = excluded.total_comments,
+        male_ratio = excluded.male_ratio,
+        female_ratio = excluded.female_ratio,
+        age_10s = excluded.age_10s,
+        age_20s = excluded.age_20s,
+        age_30s = excluded.age_30s,
+        age_40s = excluded.age_40s,
+        age_50s = excluded.age_50s,
+        age_60s = excluded.age_60s,
+        age_70s = excluded.age_70s,
+        snapshot_at = excluded.snapshot_at,
+        collected_at = excluded.collected_at
+    ;
+"""
+
+
+def comment_stats_params(
+    run_id: str,
+    oid: str,
+    aid: str,
+    stats: Dict[str, Any],
+    snapshot_at: Optional[str],
+    collected_at: str,
+) -> Tuple[Any, ...]:
+    """
+    Bind values for UPSERT_COMMENT_STATS_SQL from a CommentStatsService record.
+    """
+    gender = stats.get("gender", {}) if stats else {}
+    age = stats.get("age", {}) if stats else {}
+    return (
+        run_id,
+        oid,
+        aid,
+        stats.get("total_comments", 0) if stats else 0,
+        gender.get("male"),
+        gender.get("female"),
+        age.get("10"),
+        age.get("20"),
+        age.get("30"),
+        age.get("40"),
+        age.get("50"),
+        age.get("60"),
+        age.get("70"),
+        snapshot_at,
+        collected_at,
+    )
+
+
 class CommentRepository:
     def __init__(self, db: Database, run_id: str, store_author_raw: bool = False):
         self.db = db
@@ -24,6 +96,20 @@ class CommentRepository:
         finally:
             conn.close()
 
+    def has_article_status(self, oid: str, aid: str) -> bool:
+        """
+        True once the article has a final (non-PENDING) status in this run.
+        """
+        conn = self.db.get_connection()
+        try:
+            row = conn.execute(
+                "SELECT status FROM articles WHERE run_id = ? AND oid = ? AND aid = ?",
+                (self.run_id, oid, aid),
+            ).fetchone()
+            return bool(row and row["status"] != "PENDING")
+        finally:
+            conn.close()
+
     def set_article_status(
         self,
         oid: str,
@@ -57,49 +143,74 @@ class CommentRepository:
     def persist_comments(self, records: List[Dict[str, Any]], oid: str, aid: str) -> int:
         if not records:
             return 0
-        
-        written = 0
+
+        rows = [
+            (
+                self.run_id,
+                oid,
+                aid,
+                r["comment_no"],
+                r["parent_comment_no"],
+                r["depth"],
+                r["contents"],
+                r["author_hash"],
+                r["author_raw"] if self.store_author_raw else None,
+                r["reg_time"],
+                r["crawl_at"],
+                r["snapshot_at"],
+                r["sympathy_count"],
+                r["antipathy_count"],
+                r["reply_count"],
+                r["is_deleted"],
+                r["is_blind"],
+            )
+            for r in records
+        ]
         with self.db.transaction() as conn:
-            for r in records:
-                author_raw_value = r["author_raw"] if self.store_author_raw else None
-                conn.execute(
-                    """
-                    INSERT INTO comments (
-                        run_id, comment_no, oid, aid, parent_comment_no, depth, contents,
-                        author_hash, author_raw, reg_time, crawl_at, snapshot_at,
-                        sympathy_count, antipathy_count, reply_count, is_deleted, is_blind
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(run_id, comment_no) DO UPDATE SET
-                        contents = excluded.contents,
-                        reply_count = excluded.reply_count,
-                        sympathy_count = excluded.sympathy_count,
-                        antipathy_count = excluded.antipathy_count,
-                        is_deleted = excluded.is_deleted,
-                        is_blind = excluded.is_blind
-                    ;
-                    """,
-                    (
-                        self.run_id,
-                        r["comment_no"],
-                        oid,
-                        aid,
-                        r["parent_comment_no"],
-                        r["depth"],
-                        r["contents"],
-                        r["author_hash"],
-                        author_raw_value,
-                        r["reg_time"],
-                        r["crawl_at"],
-                        r["snapshot_at"],
-                        r["sympathy_count"],
-                        r["antipathy_count"],
-                        r["reply_count"],
-                        r["is_deleted"],
-                        r["is_blind"],
-                    ),
-                )
-                written += 1
-        return written
+            conn.executemany(UPSERT_COMMENT_SQL, rows)
+        return len(rows)
+
+    def persist_rows(self, rows: Sequence[Tuple[Any, ...]], oid: str, aid: str) -> int:
+        """
+        Bulk-insert rows produced by CommentParser.page_to_rows.
+        Each row is prefixed with (run_id, oid, aid) lazily inside executemany.
+        """
+        if not rows:
+            return 0
+
+        prefix = (self.run_id, oid, aid)
+        store_author_raw = self.store_author_raw
+
+        def bind(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+            if not store_author_raw and row[5] is not None:
+                row = row[:5] + (None,) + row[6:]
+            return prefix + row
+
+        with self.db.transaction() as conn:
+            conn.executemany(UPSERT_COMMENT_SQL, map(bind, rows))
+        return len(rows)
+
+    def load_volume_history(self) -> Dict[Tuple[str, str], int]:
+        """
+        Largest comment volume seen per article in earlier runs, from stored rows or stats totals.
+        """
+        conn = self.db.get_connection()
+        try:
+            cursor = conn.execute(
+                """
+                SELECT oid, aid, MAX(volume) AS volume FROM (
+                    SELECT oid, aid, COUNT(*) AS volume FROM comments
+                    WHERE run_id != ? GROUP BY run_id, oid, aid
+                    UNION ALL
+                    SELECT oid, aid, total_comments AS volume FROM comment_stats
+                    WHERE run_id != ? AND total_comments IS NOT NULL
+                ) GROUP BY oid, aid
+                """,
+                (self.run_id, self.run_id),
+            )
+            return {(row["oid"], row["aid"]): row["volume"] for row in cursor}
+        finally:
+            conn.close()
 
     def persist_comment_stats(
         self,
@@ -108,52 +219,13 @@ class CommentRepository:
         stats: Dict[str, Any],
         snapshot_at: Optional[str] = None,
     ) -> None:
-        gender = stats.get("gender", {}) if stats else {}
-        age = stats.get("age", {}) if stats else {}
         collected_at = datetime.now(self.tz).isoformat()
         conn = self.db.get_connection()
         try:
             with conn:
                 conn.execute(
-                    """
-                    INSERT INTO comment_stats (
-                        run_id, oid, aid, total_comments,
-                        male_ratio, female_ratio,
-                        age_10s, age_20s, age_30s, age_40s, age_50s, age_60s, age_70s,
-                        snapshot_at, collected_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(run_id, oid, aid) DO UPDATE SET
-                        total_comments = excluded.total_comments,
-                        male_ratio = excluded.male_ratio,
-                        female_ratio = excluded.female_ratio,
-                        age_10s = excluded.age_10s,
-                        age_20s = excluded.age_20s,
-                        age_30s = excluded.age_30s,
-                        age_40s = excluded.age_40s,
-                        age_50s = excluded.age_50s,
-                        age_60s = excluded.age_60s,
-                        age_70s = excluded.age_70s,
-                        snapshot_at = excluded.snapshot_at,
-                        collected_at = excluded.collected_at
-                    ;
-                    """,
-                    (
-                        self.run_id,
-                        oid,
-                        aid,
-                        stats.get("total_comments", 0) if stats else 0,
-                        gender.get("male"),
-                        gender.get("female"),
-                        age.get("10"),
-                        age.get("20"),
-                        age.get("30"),
-                        age.get("40"),
-                        age.get("50"),
-                        age.get("60"),
-                        age.get("70"),
-                        snapshot_at,
-                        collected_at,
-                    ),
+                    UPSERT_COMMENT_STATS_SQL,
+                    comment_stats_params(self.run_id, oid, aid, stats, snapshot_at, collected_at),
                 )
         finally:
             conn.close()
@@ -0,0 +1,293 @@
+import gzip
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config import ArchiveConfig
+from .db import Database
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl.gz"
+INDEX_FILENAME = "index.sqlite"
+MANIFEST_FILENAME = "manifest.json"
+
+_STOP = object()
+
+
+class ResponseArchive:
+    """
+    Append-only archive of raw comment API bodies for offline reprocessing.
+
+    Records are JSON lines in gzip segments under <root_dir>/<run_id>/. A writer thread
+    takes records off a bounded queue and writes each batch as one gzip member, so the
+    fetch path only pays for a queue put and compression happens off it. Every record is
+    indexed by (oid, aid, scope, parent, page) with its segment, member offset and line,
+    so a single page is read back by decompressing one member. Segment names carry the
+    process id, so workers of one run can share the directory and its SQLite index.
+    """
+
+    def __init__(self, config: ArchiveConfig, run_id: str):
+        self.config = config
+        self.run_id = run_id
+        self.directory = Path(config.root_dir) / run_id
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index = Database(str(self.directory / INDEX_FILENAME), wal_mode=True)
+        self._init_index()
+
+        self.records = 0
+        self.dropped = 0
+        self._segment_seq = 0
+        self._segment_path: Optional[Path] = None
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, config.queue_size))
+        self._writer = threading.Thread(target=self._run_writer, name=f"response-archive-{run_id}", daemon=True)
+        self._writer.start()
+        self._closed = False
+
+    def record(
+        self,
+        scope: str,
+        oid: str,
+        aid: str,
+        page: int,
+        params: Dict[str, Any],
+        body: str,
+        status_code: int = 200,
+        parent: Optional[str] = None,
+        purpose: str = "crawl",
+    ) -> None:
+        """
+        Queue one response for the writer. Blocks only when the writer is queue_size behind.
+        purpose tells crawl pages apart from volume gate and estimator lookups, which a
+        rebuild must not load as crawled comments.
+        """
+        if self._closed:
+            return
+        self._queue.put(
+            {
+                "scope": scope,
+                "oid": oid,
+                "aid": aid,
+                "parent": parent,
+                "purpose": purpose,
+                "page": page,
+                "params": params,
+                "status_code": status_code,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "body": body,
+            }
+        )
+
+    def close(self) -> None:
+        """
+        Flush queued records, stop the writer and refresh the manifest.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        self.write_manifest()
+        logger.info("Archived %d response(s) to %s (%d dropped)", self.records, self.directory, self.dropped)
+
+    # Reading -------------------------------------------------------------------
+    def lookup(self, oid: str, aid: str, scope: str, page: int, parent: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Latest archived record for the key, or None.
+        """
+        conn = self.index.get_connection()
+        try:
+            row = conn.execute(
+                """
+                SELECT segment, member_offset, line FROM archive_index
+                WHERE oid = ? AND aid = ? AND scope = ? AND parent = ? AND page = ?
+                ORDER BY rowid DESC LIMIT 1
+                """,
+                (oid, aid, scope, parent or "", page),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return read_member(self.directory / row["segment"], row["member_offset"])[row["line"]]
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        return iter_archive(self.directory)
+
+    def write_manifest(self) -> Dict[str, Any]:
+        conn = self.index.get_connection()
+        try:
+            rows = conn.execute(
+                """
+                SELECT segment, COUNT(*) AS records, SUM(body_bytes) AS body_bytes,
+                       MIN(fetched_at) AS first_at, MAX(fetched_at) AS last_at
+                FROM archive_index GROUP BY segment ORDER BY segment
+                """
+            ).fetchall()
+        finally:
+            conn.close()
+        manifest = {
+            "run_id": self.run_id,
+            "format": "jsonl+gzip",
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "segments": [
+                {
+                    "name": row["segment"],
+                    "records": row["records"],
+                    "body_bytes": row["body_bytes"],
+                    "compressed_bytes": _file_size(self.directory / row["segment"]),
+                    "first_at": row["first_at"],
+                    "last_at": row["last_at"],
+                }
+                for row in rows
+            ],
+        }
+        # Replace atomically; other workers of the run may be rewriting it too.
+        temp_path = self.directory / f"{MANIFEST_FILENAME}.{os.getpid()}.tmp"
+        temp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.directory / MANIFEST_FILENAME)
+        return manifest
+
+    # Writer --------------------------------------------------------------------
+    def _run_writer(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.config.batch_records:
+                    break
+                try:
+                    item = self._queue.get(timeout=self.config.flush_interval)
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except (OSError, sqlite3.Error) as exc:
+                    self.dropped += len(batch)
+                    logger.error("Failed to archive %d response(s): %s", len(batch), exc)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        segment = self._current_segment()
+        lines = [json.dumps(record, ensure_ascii=False) for record in batch]
+        member = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"), compresslevel=self.config.compress_level)
+        with open(segment, "ab") as handle:
+            offset = handle.tell()
+            handle.write(member)
+
+        conn = self.index.get_connection()
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO archive_index (
+                        oid, aid, scope, parent, page, status_code, fetched_at,
+                        segment, member_offset, line, body_bytes
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            record["oid"],
+                            record["aid"],
+                            record["scope"],
+                            record["parent"] or "",
+                            record["page"],
+                            record["status_code"],
+                            record["fetched_at"],
+                            segment.name,
+                            offset,
+                            line,
+                            len(record["body"]),
+                        )
+                        for line, record in enumerate(batch)
+                    ],
+                )
+        finally:
+            conn.close()
+        self.records += len(batch)
+
+    def _current_segment(self) -> Path:
+        limit = self.config.segment_mb * 1024 * 1024
+        if self._segment_path is None or _file_size(self._segment_path) >= limit:
+            self._segment_seq += 1
+            self._segment_path = self.directory / f"part-{os.getpid()}-{self._segment_seq:05d}{SEGMENT_SUFFIX}"
+        return self._segment_path
+
+    def _init_index(self) -> None:
+        conn = self.index.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS archive_index (
+                        oid TEXT NOT NULL,
+                        aid TEXT NOT NULL,
+                        scope TEXT NOT NULL,
+                        parent TEXT NOT NULL DEFAULT '',
+                        page INTEGER NOT NULL,
+                        status_code INTEGER,
+                        fetched_at TEXT,
+                        segment TEXT NOT NULL,
+                        member_offset INTEGER NOT NULL,
+                        line INTEGER NOT NULL,
+                        body_bytes INTEGER
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_archive_key ON archive_index(oid, aid, scope, parent, page)"
+                )
+        finally:
+            conn.close()
+
+
+def read_member(segment: Path, offset: int) -> List[Dict[str, Any]]:
+    """
+    Decode the one gzip member starting at offset into its records.
+    """
+    decoder = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    chunks = []
+    with open(segment, "rb") as handle:
+        handle.seek(offset)
+        while not decoder.eof:
+            data = handle.read(64 * 1024)
+            if not data:
+                break
+            chunks.append(decoder.decompress(data))
+    return [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines() if line]
+
+
+def iter_archive(directory: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Every record in the archive directory, segment by segment in name order.
+    """
+    for segment in sorted(Path(directory).glob(f"*{SEGMENT_SUFFIX}")):
+        with gzip.open(segment, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def build_response_archive(config: ArchiveConfig, run_id: str) -> Optional[ResponseArchive]:
+    if not config.enabled:
+        return None
+    return ResponseArchive(config, run_id)
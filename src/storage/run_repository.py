@@ -1,6 +1,6 @@
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .db import Database
 
@@ -70,3 +70,23 @@ class RunRepository:
                 )
         finally:
             conn.close()
+
+    def run_totals(self, run_id: str) -> Tuple[int, int]:
+        """
+        (articles, comments) recorded for the run by every process that wrote to it.
+        """
+        conn = self.db.get_connection()
+        try:
+            articles = conn.execute("SELECT COUNT(*) FROM articles WHERE run_id = ?", (run_id,)).fetchone()[0]
+            comments = conn.execute("SELECT COUNT(*) FROM comments WHERE run_id = ?", (run_id,)).fetchone()[0]
+        finally:
+            conn.close()
+        return articles, comments
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        conn = self.db.get_connection()
+        try:
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        finally:
+            conn.close()
+        return dict(row) if row is not None else None
@@ -0,0 +1,103 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .db import Database
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCacheKey(NamedTuple):
+    keyword: str
+    sort: str
+    source: str  # "openapi" | "html"
+    slice_start: str
+    slice_end: str
+    page: int
+    page_size: int
+
+
+class SearchCache:
+    """
+    Cross-run store of search result pages.
+
+    Pages of closed date slices (entirely in the past) are stored without an expiry;
+    every other page expires after ttl_seconds and is fetched again.
+    """
+
+    def __init__(self, db: Database, ttl_seconds: float = 86400.0):
+        self.db = db
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+        # get() is called from the search pool threads.
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: SearchCacheKey) -> Optional[List[Dict[str, Any]]]:
+        conn = self.db.get_connection()
+        try:
+            row = conn.execute(
+                """
+                SELECT payload, expires_at FROM search_cache
+                WHERE keyword = ? AND sort = ? AND source = ? AND slice_start = ?
+                  AND slice_end = ? AND page = ? AND page_size = ?
+                """,
+                key,
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None or (row["expires_at"] and row["expires_at"] <= self._now()):
+            with self._stats_lock:
+                self.misses += 1
+            return None
+        with self._stats_lock:
+            self.hits += 1
+        return json.loads(row["payload"])
+
+    def put(self, key: SearchCacheKey, items: List[Dict[str, Any]], closed: bool = False) -> None:
+        now = datetime.now(timezone.utc)
+        expires_at = None if closed else (now + self.ttl).isoformat()
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO search_cache (
+                        keyword, sort, source, slice_start, slice_end, page, page_size,
+                        payload, fetched_at, expires_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(keyword, sort, source, slice_start, slice_end, page, page_size) DO UPDATE SET
+                        payload = excluded.payload,
+                        fetched_at = excluded.fetched_at,
+                        expires_at = excluded.expires_at
+                    """,
+                    (*key, json.dumps(items, ensure_ascii=False), now.isoformat(), expires_at),
+                )
+        finally:
+            conn.close()
+
+    def purge_expired(self) -> int:
+        conn = self.db.get_connection()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM search_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (self._now(),),
+                )
+                removed = cursor.rowcount
+        finally:
+            conn.close()
+        if removed:
+            logger.info("Purged %d expired search cache page(s).", removed)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,208 @@
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from .db import Database
+
+logger = logging.getLogger(__name__)
+
+# Tables a worker writes to its shard; the queue, runs and search cache stay in the main DB.
+SHARDED_TABLES = ("articles", "comments", "comment_stats", "events")
+
+# SQLite's default SQLITE_MAX_ATTACHED.
+MAX_ATTACHED = 10
+
+# (primary key, recency column) per keyed table. A row crawled by several workers is
+# read once: the most recent copy, and the later file on ties. MERGE_SQL only lets a
+# shard row overwrite one that is not newer, so merging keeps the same copy.
+VIEW_KEYS = {
+    "articles": (("run_id", "oid", "aid"), "crawl_at"),
+    "comments": (("run_id", "comment_no"), "crawl_at"),
+    "comment_stats": (("run_id", "oid", "aid"), "collected_at"),
+}
+
+MERGE_SQL = {
+    "articles": """
+        INSERT INTO main.articles
+        SELECT * FROM {alias}.articles WHERE true
+        ON CONFLICT(run_id, oid, aid) DO UPDATE SET
+            status = excluded.status,
+            status_code = excluded.status_code,
+            error_code = excluded.error_code,
+            error_message = excluded.error_message,
+            crawl_at = excluded.crawl_at
+        WHERE crawl_at IS NULL OR excluded.crawl_at >= crawl_at
+    """,
+    # Same columns as CommentRepository.persist_comments, but only from a copy that is not older.
+    "comments": """
+        INSERT INTO main.comments
+        SELECT * FROM {alias}.comments WHERE true
+        ON CONFLICT(run_id, comment_no) DO UPDATE SET
+            contents = excluded.contents,
+            reply_count = excluded.reply_count,
+            sympathy_count = excluded.sympathy_count,
+            antipathy_count = excluded.antipathy_count,
+            is_deleted = excluded.is_deleted,
+            is_blind = excluded.is_blind,
+            crawl_at = excluded.crawl_at
+        WHERE crawl_at IS NULL OR excluded.crawl_at >= crawl_at
+    """,
+    "comment_stats": """
+        INSERT INTO main.comment_stats
+        SELECT * FROM {alias}.comment_stats WHERE true
+        ON CONFLICT(run_id, oid, aid) DO UPDATE SET
+            total_comments = excluded.total_comments,
+            male_ratio = excluded.male_ratio,
+            female_ratio = excluded.female_ratio,
+            age_10s = excluded.age_10s,
+            age_20s = excluded.age_20s,
+            age_30s = excluded.age_30s,
+            age_40s = excluded.age_40s,
+            age_50s = excluded.age_50s,
+            age_60s = excluded.age_60s,
+            age_70s = excluded.age_70s,
+            snapshot_at = excluded.snapshot_at,
+            collected_at = excluded.collected_at
+        WHERE collected_at IS NULL OR excluded.collected_at >= collected_at
+    """,
+    # Events have no natural key; skip ones already copied so merging twice is harmless.
+    "events": """
+        INSERT INTO main.events (run_id, timestamp, event_type, details)
+        SELECT s.run_id, s.timestamp, s.event_type, s.details FROM {alias}.events s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM main.events m
+            WHERE m.run_id = s.run_id AND m.timestamp = s.timestamp
+              AND m.event_type IS s.event_type AND m.details IS s.details
+        )
+    """,
+}
+
+
+def shard_path(db_path: str, worker_id: str) -> Path:
+    """
+    <dir>/<stem>.shard-<worker_id>.db next to the main DB.
+    """
+    main = Path(db_path)
+    safe_id = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in worker_id)
+    return main.with_name(f"{main.stem}.shard-{safe_id}{main.suffix}")
+
+
+def discover_shards(db_path: str) -> List[Path]:
+    main = Path(db_path)
+    return sorted(main.parent.glob(f"{main.stem}.shard-*{main.suffix}"))
+
+
+def open_shard(main_db: Database, worker_id: str, run_id: str, wal_mode: bool = True) -> Database:
+    """
+    Create (or reopen) the worker's shard with the main schema and a copy of the run row,
+    which the shard's foreign keys refer to.
+    """
+    shard = Database(str(shard_path(str(main_db.db_path), worker_id)), wal_mode=wal_mode)
+    shard.init_schema()
+    conn = shard.get_connection()
+    try:
+        conn.execute("ATTACH DATABASE ? AS origin", (str(main_db.db_path),))
+        with conn:
+            conn.execute("INSERT OR IGNORE INTO main.runs SELECT * FROM origin.runs WHERE run_id = ?", (run_id,))
+        conn.execute("DETACH DATABASE origin")
+    finally:
+        conn.close()
+    logger.info("Writing to shard %s", shard.db_path)
+    return shard
+
+
+class ShardMerger:
+    """
+    Bulk-copies shard DBs into the main DB through ATTACH, one transaction per shard.
+    Rows that already exist are resolved like the repository upserts, so a shard can
+    be merged again after more rows were written to it.
+    """
+
+    def __init__(self, main_db: Database):
+        self.main_db = main_db
+
+    def merge(self, shards: Sequence[Path]) -> Dict[str, int]:
+        copied = {table: 0 for table in SHARDED_TABLES}
+        for shard in shards:
+            for table, count in self._merge_one(shard).items():
+                copied[table] += count
+        logger.info("Merged %d shard(s): %s", len(shards), copied)
+        return copied
+
+    def _merge_one(self, shard: Path) -> Dict[str, int]:
+        conn = self.main_db.get_connection()
+        counts = {}
+        try:
+            conn.execute("ATTACH DATABASE ? AS shard", (str(shard),))
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO main.runs SELECT * FROM shard.runs")
+                for table in SHARDED_TABLES:
+                    before = conn.total_changes
+                    conn.execute(MERGE_SQL[table].format(alias="shard"))
+                    counts[table] = conn.total_changes - before
+            conn.execute("DETACH DATABASE shard")
+        finally:
+            conn.close()
+        return counts
+
+
+def attachable_shards(main_db: Database, shards: Sequence[Path]) -> List[Path]:
+    """
+    Shards a ShardedDatabase can read. When there are more than SQLite can attach,
+    they are merged into the main DB first and nothing is left to attach.
+    """
+    if len(shards) <= MAX_ATTACHED:
+        return list(shards)
+    logger.warning("%d shards exceed the attach limit; merging them into %s", len(shards), main_db.db_path)
+    ShardMerger(main_db).merge(shards)
+    return []
+
+
+class ShardedDatabase:
+    """
+    Read-only stand-in for Database that sees the main DB and its shards as one.
+
+    Connections attach every shard and define TEMP views named after the sharded
+    tables, which shadow the main tables for unqualified queries. Readers such as
+    DataExporter therefore work unchanged without a merge. Keyed tables keep one row
+    per primary key (see VIEW_KEYS), so an article re-leased to a second worker is
+    not counted or exported twice.
+    """
+
+    def __init__(self, main_db: Database, shards: Sequence[Path]):
+        if len(shards) > MAX_ATTACHED:
+            raise ValueError(f"{len(shards)} shards exceed SQLite's {MAX_ATTACHED} attached DBs; merge them first.")
+        self.main_db = main_db
+        self.db_path = main_db.db_path
+        self.shards = list(shards)
+
+    def get_connection(self) -> sqlite3.Connection:
+        conn = self.main_db.get_connection()
+        aliases = []
+        for index, shard in enumerate(self.shards):
+            alias = f"shard{index}"
+            conn.execute(f"ATTACH DATABASE ? AS {alias}", (str(shard),))
+            aliases.append(alias)
+        for table in SHARDED_TABLES:
+            conn.execute(f"CREATE TEMP VIEW {table} AS " + _view_sql(conn, table, ["main"] + aliases))
+        return conn
+
+
+def _view_sql(conn: sqlite3.Connection, table: str, schemas: Sequence[str]) -> str:
+    if table not in VIEW_KEYS:
+        # Events have no natural key; UNION still drops copies identical in several files.
+        return " UNION ".join(f"SELECT * FROM {schema}.{table}" for schema in schemas)
+    key, recency = VIEW_KEYS[table]
+    columns = ", ".join(row["name"] for row in conn.execute(f"PRAGMA main.table_info({table})"))
+    sources = " UNION ALL ".join(
+        f"SELECT *, {position} AS _source FROM {schema}.{table}" for position, schema in enumerate(schemas)
+    )
+    return f"""
+        SELECT {columns} FROM (
+            SELECT *, ROW_NUMBER() OVER (
+                PARTITION BY {", ".join(key)} ORDER BY {recency} DESC, _source DESC
+            ) AS _rank
+            FROM ({sources})
+        ) WHERE _rank = 1
+    """
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from src.collectors.article_parser import ArticleParser
+from src.ops.probe import EndpointProbe
 
 
 @dataclass
@@ -56,6 +57,36 @@ def test_fetch_and_parse_prefers_json_ld():
     assert result["body_length"] == len("Body text")
 
 
+def test_fetch_and_parse_metadata_only_skips_body():
+    html = """
+    <html>
+        <head><title>Fallback Title</title></head>
+        <body>
+            <div class="media_end_head">
+                <a class="media_end_head_top_logo"><img alt="Press Alt"/></a>
+                <span class="media_end_head_info_datestamp_time _MODIFY_DATE_TIME" data-date-time="2025-01-01 11:00"></span>
+                <em class="media_end_head_journalist_name"> Reporter B </em>
+            </div>
+            <article id="dic_area">Body<span class="img_desc">caption</span> tail</article>
+        </body>
+    </html>
+    """
+    full = ArticleParser(StubHttpClient(StubResponse(text=html))).fetch_and_parse("https://news.example.com/a")
+    meta = ArticleParser(StubHttpClient(StubResponse(text=html)), extract_body=False).fetch_and_parse(
+        "https://news.example.com/a"
+    )
+
+    assert full["body"] == "Body\ntail"
+    assert meta["status"] == "CRAWL-OK"
+    assert meta["body"] is None
+    assert meta["body_length"] == 0
+    for key in ("title", "press", "reporter", "updated_at"):
+        assert meta[key] == full[key]
+    assert meta["title"] == "Fallback Title"
+    assert meta["press"] == "Press Alt"
+    assert meta["reporter"] == "Reporter B"
+
+
 def test_fetch_and_parse_handles_http_errors():
     parser = ArticleParser(StubHttpClient(StubResponse(status_code=500)))
 
@@ -64,3 +95,25 @@ def test_fetch_and_parse_handles_http_errors():
     assert result["status"] == "FAIL-HTTP"
     assert result["status_code"] == 500
     assert result["error_code"] == "500"
+
+
+def test_fetch_and_parse_returns_probe_params_without_raw_html():
+    html = """
+    <html>
+        <head><title>T</title><script src="https://cdn.example.com/app.js"></script></head>
+        <body>
+            <div id="dic_area">Body</div>
+            <script>
+                var _cv = "news";
+                var _templateId = "view_politics";
+            </script>
+        </body>
+    </html>
+    """
+    parser = ArticleParser(StubHttpClient(StubResponse(text=html)), extract_body=False, probe=EndpointProbe())
+
+    result = parser.fetch_and_parse("https://news.example.com/article")
+
+    assert "_raw_html" not in result
+    assert result["probe_params"]["ticket"] == "news"
+    assert result["probe_params"]["templateId"] == "view_politics"
@@ -0,0 +1,65 @@
+from src.collectors.article_prioritizer import (
+    ArticlePrioritizer,
+    HistoryVolumeEstimator,
+    IVolumeEstimator,
+)
+from src.ops.volume import VolumeTracker
+
+
+class CountingEstimator(IVolumeEstimator):
+    def __init__(self, values):
+        self.values = values
+        self.calls = []
+
+    def estimate(self, item):
+        self.calls.append(item["aid"])
+        return self.values.get(item["aid"])
+
+
+def _feed(*aids):
+    return [{"oid": "001", "aid": aid, "url": f"u{aid}"} for aid in aids]
+
+
+def test_prioritize_crawls_highest_expected_volume_first_within_lookahead():
+    estimator = CountingEstimator({"a": 5, "b": 500, "c": 50, "d": 1000})
+    prioritizer = ArticlePrioritizer([estimator], VolumeTracker(), target_comments=1000, min_lookahead=3)
+
+    order = [item["aid"] for item in prioritizer.prioritize(_feed("a", "b", "c", "d"), lambda: 0)]
+
+    # "d" is beyond the first window of three, so "b" is picked before it is scored.
+    assert order == ["b", "d", "c", "a"]
+
+
+def test_estimators_are_chained_and_memoized():
+    history = HistoryVolumeEstimator({("001", "a"): 42})
+    fallback = CountingEstimator({"a": 1, "b": 7})
+    prioritizer = ArticlePrioritizer([history, fallback], VolumeTracker(), target_comments=10)
+
+    assert prioritizer.estimate(_feed("a")[0]) == 42
+    assert prioritizer.estimate(_feed("b")[0]) == 7
+    assert prioritizer.estimate(_feed("b")[0]) == 7
+    assert fallback.calls == ["b"]
+
+
+def test_lookahead_follows_volume_tracker_estimate():
+    tracker = VolumeTracker()
+    prioritizer = ArticlePrioritizer([], tracker, target_comments=1000, min_lookahead=2, max_lookahead=30)
+
+    assert prioritizer.lookahead(0) == 2
+    tracker.add_count(100)
+    assert prioritizer.lookahead(0) == 20
+    assert prioritizer.lookahead(900) == 2
+    tracker.add_count(0)
+    tracker.add_count(0)
+    assert prioritizer.lookahead(0) == 30
+
+
+def test_unknown_articles_are_scored_at_tracker_mean():
+    tracker = VolumeTracker()
+    tracker.add_count(100)
+    estimator = CountingEstimator({"a": 10, "c": 500})
+    prioritizer = ArticlePrioritizer([estimator], tracker, target_comments=10_000, min_lookahead=10)
+
+    order = [item["aid"] for item in prioritizer.prioritize(_feed("a", "b", "c"), lambda: 0)]
+
+    assert order == ["c", "b", "a"]
@@ -3,10 +3,12 @@ from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
 import yaml
 
 from src.config import get_default_config_path
-from src.main import parse_args, bootstrap_runtime
+from src.main import RunLoopStats, bootstrap_runtime, parse_args, run_collection_loop
+from src.ops.volume_strategy import TimeBudgetStrategy
 
 
 def _write_config(tmp_path: Path, data: dict) -> Path:
@@ -59,3 +61,71 @@ def test_bootstrap_runtime_prefers_resume_db_path(monkeypatch, tmp_path):
     assert created["db"].init_called is True
     assert re.match(r"\d{8}_\d{6}", context.run_id)
     datetime.fromisoformat(context.snapshot_at)
+
+
+def test_parse_args_queue_mode_options():
+    args = parse_args(["--mode", "work", "--run-id", "20250101_000000", "--worker-id", "w1"])
+
+    assert (args.mode, args.run_id, args.worker_id) == ("work", "20250101_000000", "w1")
+    assert parse_args([]).mode == "single"
+    assert parse_args(["--mode", "merge"]).mode == "merge"
+    reparse = parse_args(["--mode", "reparse", "--run-id", "r1", "--reparse-to", "out.db"])
+    assert (reparse.mode, reparse.reparse_to) == ("reparse", "out.db")
+
+
+@pytest.mark.parametrize("mode", ["work", "reparse"])
+def test_bootstrap_runtime_mode_requires_run_id(tmp_path, mode):
+    config_path = _write_config(tmp_path, {"search": _search_override()})
+    args = SimpleNamespace(config=str(config_path), resume_from_db=None, mode=mode, run_id=None)
+
+    with pytest.raises(ValueError):
+        bootstrap_runtime(args)
+
+
+def test_run_loop_checks_time_budget_before_skipped_articles(monkeypatch):
+    clock = iter(range(0, 100, 5))
+    monkeypatch.setattr("src.main.time.monotonic", lambda: next(clock))
+    repository = SimpleNamespace(is_article_completed=lambda oid, aid: True)
+    feed = [{"url": f"u{index}", "oid": "001", "aid": f"{index:010d}"} for index in range(10)]
+    stats = RunLoopStats()
+
+    result = run_collection_loop(
+        SimpleNamespace(), feed, None, None, None, repository, TimeBudgetStrategy(12), None, None, stats
+    )
+
+    # Every article was already complete, so only the top-of-loop check can stop the run.
+    assert result.stop_reason == "TIME_BUDGET"
+    assert stats.total_articles == 2
+
+
+def test_run_loop_cooldown_ends_when_time_budget_runs_out(monkeypatch):
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr("src.main.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("src.main.time.sleep", sleep)
+    breaker = SimpleNamespace(retry_after=lambda: 60.0)
+    repository = SimpleNamespace(is_article_completed=lambda oid, aid: False)
+    stats = RunLoopStats()
+
+    result = run_collection_loop(
+        SimpleNamespace(),
+        [{"url": "u", "oid": "001", "aid": "0000000001"}],
+        None,
+        None,
+        None,
+        repository,
+        TimeBudgetStrategy(3),
+        None,
+        None,
+        stats,
+        comment_breaker=breaker,
+    )
+
+    # The 60s cool-down was cut short at the 3s budget, in one-second steps.
+    assert result.stop_reason == "TIME_BUDGET"
+    assert sleeps == [1.0, 1.0, 1.0]
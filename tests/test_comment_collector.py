@@ -44,7 +44,7 @@ class TestCommentCollector:
         with pytest.raises(JSONPParseError):
             parser.parse_jsonp("")
 
-    def test_persist_comments_delegates_to_repo(self, collector):
+    def test_persist_rows_delegates_to_repo(self, collector):
         comments = [
             {
                 "commentNo": "100",
@@ -55,15 +55,15 @@ class TestCommentCollector:
             }
         ]
         collector.parser.extract_comments.return_value = comments
-        collector.parser.to_record.return_value = {"comment_no": "100"}
-        collector.repository.persist_comments.return_value = 1
+        collector.parser.page_to_rows.return_value = [("100",)]
+        collector.repository.persist_rows.return_value = 1
         collector.fetcher.fetch.return_value = "{}"
         collector.parser.parse_jsonp.return_value = {}
         collector.parser.extract_cursor.return_value = None
 
         written = collector.collect_article("oid", "aid", {})
         assert written == 1
-        collector.repository.persist_comments.assert_called_once()
+        collector.repository.persist_rows.assert_called_once()
 
     def test_pagination_stops_on_duplicate_cursor(self, collector):
         # Setup mocks
@@ -74,7 +74,7 @@ class TestCommentCollector:
         ]
         # Return same cursor twice
         collector.parser.extract_cursor.side_effect = ["CURSOR_A", "CURSOR_A"]
-        collector.repository.persist_comments.return_value = 1
+        collector.repository.persist_rows.return_value = 1
         
         count = collector.collect_article("oid", "aid", {})
         # Should process page 1, see Cursor A.
@@ -100,6 +100,61 @@ class TestCommentCollector:
         assert record["author_hash"] is not None
         assert record["author_raw"] is None
 
+    def test_page_to_rows_matches_to_record(self, mock_config):
+        parser = CommentParser(mock_config, PrivacyHasher("salt"))
+        comments = [
+            {"commentNo": 1, "contents": "a", "userId": "u1", "regTime": "1700000000", "replyCount": 2},
+            {"commentNo": 2, "contents": "b", "profileUserId": "u2", "regTime": "1700000001", "isBlind": True},
+        ]
+
+        rows = parser.page_to_rows(comments, depth=1, parent="99", snapshot_at="2023-01-01T00:00:00")
+
+        assert len(rows) == 2
+        for row, comment in zip(rows, comments):
+            record = parser.to_record(comment, 1, "99", "2023-01-01T00:00:00")
+            expected = dict(record, crawl_at=row.crawl_at)
+            assert row._asdict() == expected
+        # crawl_at is stamped once per page
+        assert rows[0].crawl_at == rows[1].crawl_at
+
+    def test_page_to_rows_empty_page(self, mock_config):
+        parser = CommentParser(mock_config, PrivacyHasher("salt"))
+        assert parser.page_to_rows([], 0, None, "2023-01-01T00:00:00") == []
+
+    def test_normalize_times_batches_epochs_and_counts_anomalies(self, mock_config):
+        parser = CommentParser(mock_config, PrivacyHasher("salt"))
+        values = ["1700000000", "1700000000123", "2023-11-15T07:13:20+0900", "garbage", None, "123"]
+
+        normalized, anomalies = parser.normalize_times(values)
+
+        assert normalized[0] == "2023-11-15T07:13:20+09:00"
+        assert normalized[1] == "2023-11-15T07:13:20.123000+09:00"
+        assert normalized[2] == "2023-11-15T07:13:20+0900"
+        assert normalized[3] == "garbage"
+        assert normalized[4] is None
+        # garbage, missing and pre-2000 epoch
+        assert anomalies == 3
+        assert normalized[5] == "123"
+
+    def test_normalize_times_keeps_out_of_range_epochs_raw(self, mock_config):
+        parser = CommentParser(mock_config, PrivacyHasher("salt"))
+        values = ["99999999999999999999999", "9999999999999999", "1700000000"]
+
+        normalized, anomalies = parser.normalize_times(values)
+
+        assert normalized == ["99999999999999999999999", "9999999999999999", "2023-11-15T07:13:20+09:00"]
+        assert anomalies == 2
+
+    def test_page_to_rows_accumulates_timestamp_anomalies(self, mock_config):
+        parser = CommentParser(mock_config, PrivacyHasher("salt"))
+        parser.page_to_rows(
+            [{"commentNo": "1", "contents": "a", "regTime": "bad"}, {"commentNo": "2", "contents": "b", "regTime": "1700000000"}],
+            0,
+            None,
+            "2023-01-01T00:00:00",
+        )
+        assert parser.timestamp_anomalies == 1
+
     def test_structural_failure_delegation(self, collector):
         # Setup: Mock structural detector
         mock_detector = Mock()
@@ -127,9 +182,9 @@ class TestCommentCollector:
             [{"commentNo": "1", "contents": "c", "regTime": "now"}],
             [],
         ]
-        collector.parser.to_record.return_value = {"comment_no": "1"}
+        collector.parser.page_to_rows.return_value = [("1",)]
         collector.parser.extract_cursor.return_value = None
-        collector.repository.persist_comments.return_value = 1
+        collector.repository.persist_rows.return_value = 1
         collector.fetcher.fetch.return_value = "{}"
         collector.parser.parse_jsonp.return_value = {}
         collector.stats_service.fetch_stats.return_value = {
@@ -149,8 +204,8 @@ class TestCommentCollector:
         collector.parser.extract_comments.return_value = [
             {"commentNo": "1", "contents": "c", "regTime": "now"}
         ]
-        collector.parser.to_record.return_value = {"comment_no": "1"}
-        collector.repository.persist_comments.return_value = 1
+        collector.parser.page_to_rows.return_value = [("1",)]
+        collector.repository.persist_rows.return_value = 1
         collector.fetcher.fetch.return_value = "{}"
         collector.parser.parse_jsonp.return_value = {}
         collector.parser.extract_cursor.return_value = None
@@ -170,3 +225,148 @@ class TestCommentCollector:
         with pytest.raises(StructuralError):
             collector.collect_article("oid", "aid", {})
 
+
+
+def test_collect_article_reuses_supplied_first_page(mock_config):
+    fetcher = Mock(spec=CommentFetcher)
+    parser = Mock(spec=CommentParser)
+    parser.parse_jsonp.return_value = {"result": {}}
+    parser.extract_total_count.return_value = 0
+    parser.extract_comments.return_value = [{"commentNo": "1", "contents": "c", "regTime": "now"}]
+    parser.extract_cursor.return_value = None
+    parser.page_to_rows.return_value = [("1",)]
+    repo = Mock(spec=CommentRepository)
+    repo.is_article_completed.return_value = False
+    repo.persist_rows.return_value = 1
+    collector = CommentCollector(mock_config, fetcher, parser, repo, "2023-01-01T00:00:00")
+
+    written = collector.collect_article("oid", "aid", {}, first_page="cb({})")
+
+    assert written == 1
+    fetcher.fetch.assert_not_called()
+    fetcher.archive_page.assert_called_once_with("oid", "aid", 1, {}, "cb({})")
+    parser.parse_jsonp.assert_called_once_with("cb({})")
+
+
+def _paging_collector(mock_config, pages=10):
+    fetcher = Mock(spec=CommentFetcher)
+    fetcher.fetch.return_value = "{}"
+    parser = Mock(spec=CommentParser)
+    parser.parse_jsonp.return_value = {"result": {}}
+    parser.extract_total_count.return_value = 0
+    parser.extract_comments.return_value = [{"commentNo": "1", "contents": "c", "regTime": "now", "replyCount": 1}]
+    parser.extract_cursor.side_effect = lambda payload: f"cursor-{fetcher.fetch.call_count}"
+    parser.page_to_rows.return_value = [("1",)]
+    repo = Mock(spec=CommentRepository)
+    repo.is_article_completed.return_value = False
+    repo.persist_rows.return_value = 1
+    return CommentCollector(mock_config, fetcher, parser, repo, "2023-01-01T00:00:00")
+
+
+def test_budget_for_shrinks_caps_to_remaining_target(mock_config):
+    collector = _paging_collector(mock_config)
+
+    full = collector.budget_for()
+    assert (full.max_comment_pages, full.max_reply_pages) == (400, 200)
+
+    tight = collector.budget_for(remaining_comments=45)
+    assert (tight.max_comment_pages, tight.max_reply_pages) == (5, 5)
+
+    mock_config.collection.page_budget.adaptive = False
+    assert collector.budget_for(remaining_comments=45).max_comment_pages == 400
+
+
+def test_collect_article_stops_between_pages_when_budget_exhausted(mock_config):
+    from src.collectors.comment_collector import ArticleBudget
+
+    collector = _paging_collector(mock_config)
+    seen = []
+
+    def should_stop(written):
+        seen.append(written)
+        return written >= 3
+
+    written = collector.collect_article("oid", "aid", {}, budget=ArticleBudget(400, 200, should_stop))
+
+    # Page 1 writes one comment, its reply thread stops after two reply pages,
+    # and the next top-level page is never requested.
+    assert written == 3
+    assert collector.fetcher.fetch.call_count == 3
+    assert seen == [1, 2, 3]
+    collector.repository.set_article_status.assert_called_with(
+        "oid", "aid", status="PARTIAL", error_code="BUDGET_STOP", error_message=ANY
+    )
+
+
+def test_collect_article_marks_adaptive_page_cap_as_partial(mock_config):
+    from src.collectors.comment_collector import ArticleBudget
+
+    collector = _paging_collector(mock_config)
+    collector.parser.extract_comments.return_value = [{"commentNo": "1", "contents": "c", "regTime": "now"}]
+
+    written = collector.collect_article("oid", "aid", {}, budget=ArticleBudget(2, 2))
+
+    assert written == 2
+    assert collector.fetcher.fetch.call_count == 2
+    collector.repository.set_article_status.assert_called_with(
+        "oid", "aid", status="PARTIAL", error_code="PAGE_CAP", error_message=ANY
+    )
+
+
+def test_collect_article_marks_reply_page_cap_as_partial(mock_config):
+    from src.collectors.comment_collector import ArticleBudget
+
+    collector = _paging_collector(mock_config)
+
+    # One top-level page whose reply thread has more pages than the tightened cap.
+    written = collector.collect_article("oid", "aid", {}, budget=ArticleBudget(400, 2))
+
+    assert written == 3
+    assert collector.fetcher.fetch.call_count == 3
+    collector.repository.set_article_status.assert_called_with(
+        "oid", "aid", status="PARTIAL", error_code="PAGE_CAP", error_message=ANY
+    )
+
+
+
+def test_collect_article_keeps_several_pool_pages_in_flight(mock_config):
+    from concurrent.futures import Future
+
+    from src.collectors.page_processor import IPageProcessor, ParsedPage
+
+    class PendingProcessor(IPageProcessor):
+        max_in_flight = 2
+
+        def __init__(self):
+            self.pages = 0
+            self.waits = []
+
+        def process(self, raw_body, depth, parent, snapshot_at):
+            self.pages += 1
+            future = Future()
+            future.set_result(([f"row-{self.pages}"], 0))
+            cursor = None if self.pages == 4 else f"cursor-{self.pages}"
+            return ParsedPage(cursor=cursor, comment_count=1, pending=future)
+
+        def rows(self, page):
+            self.waits.append(self.pages)
+            return page.pending.result()[0]
+
+    processor = PendingProcessor()
+    fetcher = Mock(spec=CommentFetcher)
+    fetcher.fetch.return_value = "{}"
+    repo = Mock(spec=CommentRepository)
+    repo.is_article_completed.return_value = False
+    persisted = []
+    repo.persist_rows.side_effect = lambda rows, oid, aid: persisted.extend(rows) or len(rows)
+    collector = CommentCollector(
+        mock_config, fetcher, Mock(spec=CommentParser), repo, "2023-01-01T00:00:00", page_processor=processor
+    )
+
+    written = collector.collect_article("oid", "aid", {})
+
+    assert written == 4
+    assert persisted == ["row-1", "row-2", "row-3", "row-4"]
+    # Page 1 is first waited on once page 3 is fetched; the rest are flushed at the end.
+    assert processor.waits == [3, 4, 4, 4]
+    collector.repository.set_article_status.assert_called_with("oid", "aid", status="SUCCESS")
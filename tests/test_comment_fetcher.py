@@ -1,6 +1,6 @@
 import requests
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -53,7 +53,7 @@ def test_fetch_returns_response_text(tmp_path):
     result = fetcher.fetch("001", "0001", 1, {}, "comment", None)
 
     assert result == "payload"
-    throttler.observe.assert_called_once_with(200)
+    throttler.observe.assert_called_once_with(200, latency=ANY)
     evidence.log_failed_request.assert_not_called()
 
 
@@ -73,6 +73,21 @@ def test_fetch_logs_and_raises_on_network_error():
     evidence.log_failed_request.assert_called_once()
 
 
+
+def test_fetch_reports_timeouts_separately():
+    http = StubHttpClient(exception=requests.ReadTimeout("slow"))
+    limiter = _rate_limiter()
+    throttler = MagicMock()
+    evidence = MagicMock()
+
+    fetcher = CommentFetcher(http, limiter, throttler, evidence, _config())
+
+    with pytest.raises(AppError) as err:
+        fetcher.fetch("001", "0001", 1, {}, "comment", None)
+
+    assert err.value.severity == Severity.RETRY
+    assert evidence.log_failed_request.call_args.kwargs["error_type"] == "TIMEOUT"
+
 def test_fetch_raises_abort_on_403():
     http = StubHttpClient(StubResponse(status_code=403))
     limiter = _rate_limiter()
@@ -87,3 +102,28 @@ def test_fetch_raises_abort_on_403():
     assert err.value.severity == Severity.ABORT
     assert err.value.kind == ErrorKind.HTTP
     evidence.log_failed_request.assert_called_once()
+
+
+def test_fetch_archives_successful_bodies_only():
+    archive = MagicMock()
+    fetcher = CommentFetcher(
+        StubHttpClient(StubResponse(status_code=200, text="reply-page")),
+        _rate_limiter(),
+        MagicMock(),
+        MagicMock(),
+        _config(),
+        archive=archive,
+    )
+
+    fetcher.fetch("001", "0001", 2, {}, "reply", "c9")
+
+    archive.record.assert_called_once_with(
+        "reply", "001", "0001", 2, ANY, "reply-page", status_code=200, parent="c9", purpose="crawl"
+    )
+
+    failing = CommentFetcher(
+        StubHttpClient(StubResponse(status_code=500)), _rate_limiter(), MagicMock(), MagicMock(), _config(), archive=archive
+    )
+    with pytest.raises(AppError):
+        failing.fetch("001", "0001", 1, {}, "comment", None)
+    assert archive.record.call_count == 1
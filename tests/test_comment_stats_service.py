@@ -66,3 +66,21 @@ class TestCommentStatsService:
 
         with pytest.raises(AppError):
             service.fetch_stats("001", "0001", {})
+
+    def test_fetch_stats_archives_raw_body(self, mock_config, evidence):
+        http_client = Mock()
+        http_client.request.return_value = _make_response("cb({})")
+        archive = Mock()
+
+        service = CommentStatsService(
+            http_client=http_client,
+            evidence=evidence,
+            config=mock_config.collection.comment_stats,
+            parse_jsonp=Mock(return_value={"result": {}}),
+            archive=archive,
+        )
+
+        service.fetch_stats("001", "0001", {})
+
+        scope, oid, aid, page, _query, body = archive.record.call_args.args
+        assert (scope, oid, aid, page, body) == ("comment_stats", "001", "0001", 1, "cb({})")
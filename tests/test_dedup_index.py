@@ -0,0 +1,52 @@
+from src.collectors.dedup_index import DedupIndex
+
+
+def test_add_reports_new_articles_once_and_tracks_keywords():
+    index = DedupIndex()
+
+    assert index.add("001", "0000000123", "u1", "alpha") is True
+    assert index.add("001", "0000000123", "u1", "beta") is False
+    assert index.add("001", "0000000123", "u1", "alpha") is False
+    assert index.add("002", "0000000123", "u2", "beta") is True
+
+    assert index.keywords_for("001", "0000000123") == ["alpha", "beta"]
+    assert index.keywords_for("002", "0000000123") == ["beta"]
+    assert index.keywords_for("003", "0000000123") == []
+    assert len(index) == 2
+
+
+def test_merge_into_sorted_arrays_keeps_membership(monkeypatch):
+    monkeypatch.setattr(DedupIndex, "MERGE_THRESHOLD", 4)
+    index = DedupIndex()
+
+    for aid in (9, 3, 7, 1, 5, 2, 8, 4, 6):
+        assert index.add("001", f"{aid:010d}", "", "alpha") is True
+    for aid in range(1, 10):
+        assert index.add("001", f"{aid:010d}", "", "beta") is False
+
+    assert list(index._keys) == sorted(index._keys)
+    assert len(index._keys) == 8
+    assert all(index.keywords_for("001", f"{aid:010d}") == ["alpha", "beta"] for aid in range(1, 10))
+    assert len(index) == 9
+
+
+def test_more_than_64_keywords_survive_merges(monkeypatch):
+    monkeypatch.setattr(DedupIndex, "MERGE_THRESHOLD", 2)
+    index = DedupIndex()
+    keywords = [f"kw{i}" for i in range(70)]
+
+    for keyword in keywords:
+        index.add("001", "0000000001", "", keyword)
+    index.add("001", "0000000002", "", "kw0")
+    index.add("001", "0000000003", "", "kw0")
+
+    assert index.keywords_for("001", "0000000001") == keywords
+
+
+def test_non_numeric_ids_fall_back_to_url():
+    index = DedupIndex()
+
+    assert index.add(None, None, "https://example.com/a", "alpha") is True
+    assert index.add(None, None, "https://example.com/a", "beta") is False
+
+    assert index.keywords_for(None, None, "https://example.com/a") == ["alpha", "beta"]
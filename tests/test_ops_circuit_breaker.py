@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.common.errors import AppError
+from src.config import BreakerConfig, CircuitBreakerConfig
+from src.http.client import CircuitBreakingHttpClient
+from src.ops.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedHttpClient:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(url)
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(status_code=status)
+
+
+def _breaker(clock, threshold=2, cooldown=10.0, trials=1):
+    config = BreakerConfig(failure_threshold=threshold, cooldown_seconds=cooldown, half_open_max_calls=trials)
+    return CircuitBreaker("comment_stats", config, clock=clock)
+
+
+def test_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as err:
+        breaker.before_call()
+    assert isinstance(err.value, AppError)
+    assert err.value.retry_after == pytest.approx(10.0)
+
+
+def test_half_open_allows_limited_trials_then_closes():
+    clock = FakeClock()
+    breaker = _breaker(clock, threshold=1)
+    breaker.record_failure()
+
+    clock.now = 10.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.before_call()
+
+
+def test_half_open_failure_reopens_for_full_cooldown():
+    clock = FakeClock()
+    breaker = _breaker(clock, threshold=1)
+    breaker.record_failure()
+
+    clock.now = 10.0
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after() == pytest.approx(10.0)
+
+
+def test_registry_applies_endpoint_overrides_and_logs_transitions():
+    events = []
+    logger = SimpleNamespace(log=lambda event_type, summary, payload=None: events.append(event_type))
+    config = CircuitBreakerConfig(
+        default=BreakerConfig(failure_threshold=5),
+        endpoints={"comment_stats": BreakerConfig(failure_threshold=1)},
+    )
+    registry = CircuitBreakerRegistry(config, event_logger=logger, clock=FakeClock())
+
+    registry.get("comment_stats").record_failure()
+    registry.get("comment_list").record_failure()
+
+    assert registry.snapshot() == {"comment_stats": "OPEN", "comment_list": "CLOSED"}
+    assert events == ["CIRCUIT_OPEN"]
+
+
+def test_http_client_skips_requests_while_open():
+    clock = FakeClock()
+    breaker = _breaker(clock, threshold=2)
+    inner = ScriptedHttpClient([503, ConnectionError("reset"), 200])
+    client = CircuitBreakingHttpClient(inner, breaker)
+
+    assert client.request("GET", "https://apis.naver.com/stats").status_code == 503
+    with pytest.raises(ConnectionError):
+        client.request("GET", "https://apis.naver.com/stats")
+    with pytest.raises(CircuitOpenError):
+        client.request("GET", "https://apis.naver.com/stats")
+    assert len(inner.calls) == 2
+
+    clock.now = 10.0
+    assert client.request("GET", "https://apis.naver.com/stats").status_code == 200
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_http_client_routes_by_url_prefix():
+    clock = FakeClock()
+    api_breaker = _breaker(clock, threshold=1)
+    html_breaker = _breaker(clock, threshold=1)
+    inner = ScriptedHttpClient([429, 200])
+    client = CircuitBreakingHttpClient(inner, api_breaker, routes={"https://search.naver.com/": html_breaker})
+
+    client.request("GET", "https://openapi.naver.com/v1/search/news.json")
+    response = client.request("GET", "https://search.naver.com/search.naver")
+
+    assert response.status_code == 200
+    assert api_breaker.state is CircuitState.OPEN
+    assert html_breaker.state is CircuitState.CLOSED
+
+
+def test_client_errors_do_not_count_as_failures():
+    breaker = _breaker(FakeClock(), threshold=1)
+    client = CircuitBreakingHttpClient(ScriptedHttpClient([404]), breaker)
+
+    client.request("GET", "https://n.news.naver.com/article/001/0001")
+
+    assert breaker.state is CircuitState.CLOSED
@@ -33,7 +33,7 @@ class TestHealthCheck:
         # 1. Metadata OK
         mock_deps["parser"].fetch_and_parse.return_value = {
             "status": "CRAWL-OK",
-            "_raw_html": "<html></html>",
+            "probe_params": None,
         }
         
         # 2. Probe Param
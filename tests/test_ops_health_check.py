@@ -40,7 +40,7 @@ class StubProbe:
         self.validations = list(validations)
         self.calls = 0
 
-    def get_candidate_configs(self, url: str, raw_html: str):
+    def get_candidate_configs(self, url: str, article_html: str = "", discovered=None):
         self.calls += 1
         return list(self.configs)
 
@@ -84,9 +84,9 @@ def _health_check_with_stubs(mock_config, validations, payloads, should_raise=Fa
     )
     parser = StubParser(
         [
-            {"status": "CRAWL-OK", "_raw_html": "<html></html>"},
-            {"status": "CRAWL-OK", "_raw_html": "<html></html>"},
-            {"status": "CRAWL-OK", "_raw_html": "<html></html>"},
+            {"status": "CRAWL-OK", "probe_params": None},
+            {"status": "CRAWL-OK", "probe_params": None},
+            {"status": "CRAWL-OK", "probe_params": None},
         ]
     )
     probe = StubProbe(
@@ -126,3 +126,38 @@ def test_health_check_fails_and_logs_evidence(mock_config):
 
     assert hc.run_preflight_check(run_id="hc") is False
     assert len(evidence.logged) > 0
+
+
+def test_health_check_discovers_params_when_parser_has_no_probe(mock_config):
+    from types import SimpleNamespace
+
+    from src.ops.probe import EndpointProbe
+
+    class RecordingProbe(EndpointProbe):
+        def __init__(self):
+            super().__init__()
+            self.discovered = []
+
+        def get_candidate_configs(self, url, article_html="", discovered=None):
+            self.discovered.append(discovered)
+            return super().get_candidate_configs(url, article_html, discovered=discovered)
+
+    class HttpClient:
+        def request(self, method, url, **kwargs):
+            return SimpleNamespace(status_code=200, text='<script>var _templateId = "view_it";</script>')
+
+    parser = StubParser([{"status": "CRAWL-OK", "probe_params": None}])
+    parser.http_client = HttpClient()
+    probe = RecordingProbe()
+    hc = HealthCheck(
+        config=mock_config,
+        searcher=StubSearcher([StubSearchResult("001", "0001", "https://a")]),
+        parser=parser,
+        probe=probe,
+        comment_fetcher=StubCommentFetcher(payloads=[]),
+        evidence=StubEvidence(),
+    )
+
+    hc.run_preflight_check(run_id="hc")
+
+    assert probe.discovered[0]["templateId"] == "view_it"
@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.common.errors import AppError, Severity, is_timeout
+from src.config import TimeoutConfig
+from src.http.client import LatencyTrackingHttpClient
+from src.ops.latency import LatencyHistogram, LatencyTracker
+
+
+def _config(**overrides):
+    values = dict(
+        connect=5.0,
+        read=30.0,
+        adaptive=True,
+        adaptive_percentile=0.99,
+        adaptive_multiplier=2.0,
+        adaptive_min_read=1.0,
+        adaptive_max_read=20.0,
+        adaptive_min_samples=10,
+    )
+    values.update(overrides)
+    return TimeoutConfig(**values)
+
+
+def test_histogram_percentiles_within_bucket_width():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.observe(value / 100)
+
+    for q, expected in ((0.50, 0.50), (0.95, 0.95), (0.99, 0.99)):
+        reported = histogram.percentile(q)
+        assert expected <= reported <= expected * LatencyHistogram.GROWTH
+
+
+def test_histogram_empty_and_out_of_range():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) is None
+
+    histogram.observe(0.0)
+    histogram.observe(10_000.0)
+
+    assert histogram.percentile(0.01) == LatencyHistogram.MIN_SECONDS
+    assert histogram.percentile(1.0) == LatencyHistogram.MAX_SECONDS
+
+
+def test_read_timeout_waits_for_samples_then_tracks_percentile():
+    tracker = LatencyTracker(_config())
+    for _ in range(9):
+        tracker.observe("comment_list", 0.5)
+    assert tracker.read_timeout("comment_list") is None
+    assert tracker.timeout_for("comment_list", (5.0, 30.0)) == (5.0, 30.0)
+
+    tracker.observe("comment_list", 0.5)
+
+    read = tracker.read_timeout("comment_list")
+    assert 1.0 <= read <= 2.0 * 0.5 * LatencyHistogram.GROWTH
+    assert tracker.timeout_for("comment_list", 10) == (5.0, read)
+
+
+def test_read_timeout_clamped_to_bounds():
+    tracker = LatencyTracker(_config())
+    for _ in range(10):
+        tracker.observe("fast", 0.01)
+        tracker.observe("slow", 60.0)
+
+    assert tracker.read_timeout("fast") == 1.0
+    assert tracker.read_timeout("slow") == 20.0
+
+
+class ScriptedHttpClient:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.kwargs = None
+
+    def request(self, method, url, **kwargs):
+        self.kwargs = kwargs
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return SimpleNamespace(status_code=self.outcome)
+
+
+def test_http_client_records_latency_and_applies_timeout():
+    tracker = LatencyTracker(_config(adaptive_min_samples=1))
+    tracker.observe("search_html", 1.0)
+    inner = ScriptedHttpClient(200)
+    client = LatencyTrackingHttpClient(inner, tracker, "search", routes={"https://search.naver.com/": "search_html"})
+
+    client.request("GET", "https://search.naver.com/search.naver", timeout=10)
+    adaptive_timeout = inner.kwargs["timeout"]
+    # "search" has no samples yet, so the caller's timeout is kept.
+    client.request("GET", "https://openapi.naver.com/v1/search/news.json", timeout=10)
+
+    snapshot = tracker.snapshot()
+    assert snapshot["search_html"]["count"] == 2
+    assert snapshot["search"]["count"] == 1
+    assert adaptive_timeout[0] == 5.0
+    assert 2.0 <= adaptive_timeout[1] <= 2.0 * LatencyHistogram.GROWTH
+    assert inner.kwargs["timeout"] == 10
+
+
+def test_http_client_counts_timeouts():
+    tracker = LatencyTracker(_config())
+    client = LatencyTrackingHttpClient(ScriptedHttpClient(requests.ReadTimeout("slow")), tracker, "comment_stats")
+
+    with pytest.raises(requests.Timeout):
+        client.request("GET", "https://apis.naver.com/stats", timeout=10)
+
+    assert tracker.snapshot()["comment_stats"]["timeouts"] == 1
+
+
+def test_is_timeout_unwraps_app_errors():
+    wrapped = AppError("timed out", Severity.RETRY, original_exception=requests.ConnectTimeout("x"))
+
+    assert is_timeout(wrapped)
+    assert is_timeout(TimeoutError())
+    assert not is_timeout(AppError("boom", original_exception=requests.ConnectionError("x")))
@@ -46,6 +46,58 @@ class TestEndpointProbe:
         # 3. Known Config B
         assert candidates[2]["ticket"] == "news"
 
+    def test_get_candidate_configs_uses_precomputed_discovery(self, probe):
+        discovered = {"ticket": "pre", "templateId": "pre_tmpl"}
+        candidates = probe.get_candidate_configs("http://url", discovered=discovered)
+        assert candidates[0] == discovered
+        assert len(candidates) == 3
+
+        # Nothing discovered -> only the known configs
+        assert len(probe.get_candidate_configs("http://url", discovered=None)) == 2
+
+    def test_extract_script_region_keeps_inline_scripts_only(self, probe):
+        html = """
+        <script src="x.js">var _cv = "external";</script>
+        <script type="application/ld+json">{"templateId": "ld"}</script>
+        <div>templateId: "markup"</div>
+        <script>var _cv = "inline";</script>
+        """
+        region = probe.extract_script_region(html)
+        assert 'var _cv = "inline";' in region
+        assert "external" not in region
+        assert "ld" not in region
+        assert "markup" not in region
+
+        assert len(probe.extract_script_region("<script>" + "x" * 100 + "</script>", max_chars=10)) == 10
+
+    def test_scan_parameters_reports_matching_pattern(self, probe):
+        html = """
+        <div>serviceName: "markup_only"</div>
+        <script>
+            var _cv = "cv_value";
+            var _templateId = "tmpl_value";
+            pool: "cbox9",
+        </script>
+        """
+        params, sources = probe.scan_parameters(html)
+
+        # Markup outside <script> is ignored, so the ticket falls back to _cv
+        assert params["ticket"] == "cv_value"
+        assert sources["ticket"] == "_cv="
+        assert params["templateId"] == "tmpl_value"
+        assert sources["templateId"] == "_templateId="
+        assert params["cv"] == "cv_value"
+        assert params["pool"] == "cbox9"
+        assert "template" not in params
+
+    def test_scan_parameters_prefers_primary_patterns(self, probe):
+        text = '_templateId = "late"; var _cv = "cv"; templateId: "early"; serviceName: "svc"'
+        params, sources = probe.scan_parameters(text)
+        assert params["templateId"] == "early"
+        assert sources["templateId"] == "templateId:"
+        assert params["ticket"] == "svc"
+        assert sources["ticket"] == "serviceName:"
+
     def test_deep_validate_response_success(self, probe):
         valid = {
             "success": True,
@@ -0,0 +1,93 @@
+import multiprocessing
+
+import pytest
+
+from src.config import RateLimitConfig
+from src.ops.rate_limiter import RateLimiter
+from src.ops.shared_budget import SharedRateBudget, build_shared_budget
+from src.storage.db import Database
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _budget(path, clock, rate=2.0, burst=1.0):
+    return SharedRateBudget(Database(str(path), wal_mode=True), "naver", rate, burst=burst, clock=clock)
+
+
+def test_reservations_queue_at_configured_rate(tmp_path):
+    clock = FakeClock()
+    budget = _budget(tmp_path / "budget.db", clock, rate=2.0, burst=2.0)
+
+    waits = [budget.reserve() for _ in range(4)]
+
+    assert waits == pytest.approx([0.0, 0.0, 0.5, 1.0])
+
+
+def test_bucket_refills_up_to_burst(tmp_path):
+    clock = FakeClock()
+    budget = _budget(tmp_path / "budget.db", clock, rate=2.0, burst=1.0)
+    budget.reserve()
+
+    clock.now += 60.0
+
+    assert budget.reserve() == 0.0
+    assert budget.reserve() == pytest.approx(0.5)
+
+
+def test_instances_on_one_file_share_the_budget(tmp_path):
+    clock = FakeClock()
+    first = _budget(tmp_path / "budget.db", clock)
+    second = _budget(tmp_path / "budget.db", clock)
+
+    waits = [first.reserve(), second.reserve(), first.reserve(), second.reserve()]
+
+    assert waits == pytest.approx([0.0, 0.5, 1.0, 1.5])
+
+
+def _reserve_many(path, count, queue):
+    clock = FakeClock()
+    budget = SharedRateBudget(Database(path, wal_mode=True), "naver", 100.0, clock=lambda: clock.now)
+    due = []
+    for _ in range(count):
+        # Every reservation happens at the same instant, so no tokens refill in between.
+        due.append(clock.now + budget.reserve())
+    queue.put(due)
+
+
+def test_processes_do_not_double_spend_tokens(tmp_path):
+    path = str(tmp_path / "budget.db")
+    _budget(path, FakeClock())  # create the table before the workers race
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_reserve_many, args=(path, 10, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    due = sorted(when for _ in workers for when in queue.get(timeout=30))
+    for worker in workers:
+        worker.join(timeout=30)
+
+    # 30 tokens at 100/s, each handed out exactly once.
+    assert due == pytest.approx([1000.0 + index / 100.0 for index in range(30)])
+
+
+def test_rate_limiter_waits_for_shared_token(tmp_path, monkeypatch):
+    clock = FakeClock()
+    budget = _budget(tmp_path / "budget.db", clock, rate=1.0)
+    limiter = RateLimiter(RateLimitConfig(min_delay=0.0, max_delay=0.0, baseline_min_delay=0.0), shared_budget=budget)
+    slept = []
+    monkeypatch.setattr("src.ops.rate_limiter.time.sleep", slept.append)
+
+    limiter.wait()
+    limiter.wait()
+
+    assert slept == [pytest.approx(1.0)]
+
+
+def test_build_shared_budget_disabled_by_default():
+    assert build_shared_budget(RateLimitConfig()) is None
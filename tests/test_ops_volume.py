@@ -80,3 +80,137 @@ class TestVolumeTracker:
             collected_comments=50, 
             remaining_capacity=10
         ) is False
+
+
+from src.config import VolumeStrategyConfig
+from src.ops.volume_strategy import (
+    CompositeStrategy,
+    DiminishingReturnsStrategy,
+    RateEtaStrategy,
+    TimeBudgetStrategy,
+    build_stop_strategy,
+)
+
+class TestTimeAndYieldStrategies:
+    def test_time_budget_stops_at_budget(self):
+        strategy = TimeBudgetStrategy(budget_seconds=60)
+        assert strategy.decide(current_volume=0, elapsed_seconds=59.9).should_stop is False
+        decision = strategy.decide(current_volume=0, elapsed_seconds=60)
+        assert decision.should_stop is True
+        assert decision.reason == "TIME_BUDGET"
+
+    def test_rate_eta_stops_before_next_article_would_overrun(self):
+        strategy = RateEtaStrategy(budget_seconds=100, target_comments=1000)
+        assert strategy.decide(current_volume=100, elapsed_seconds=20).should_stop is False
+        decision = strategy.decide(current_volume=200, elapsed_seconds=40)
+        assert decision.should_stop is False
+        assert decision.eta_seconds == strategy.eta_seconds == 160
+        assert strategy.decide(current_volume=300, elapsed_seconds=60).should_stop is False
+        # Articles take ~20s, so starting another one at 85s would end past the 100s budget.
+        decision = strategy.decide(current_volume=400, elapsed_seconds=85)
+        assert decision.should_stop is True
+        assert decision.reason == "ETA_OVERRUN"
+
+    def test_diminishing_returns_uses_trimmed_mean_of_recent_yields(self):
+        strategy = DiminishingReturnsStrategy(min_yield=5, window=5)
+        volume = 0
+        for yield_ in (100, 3, 2, 1, 0):
+            volume += yield_
+            decision = strategy.decide(current_volume=volume, elapsed_seconds=0)
+        # Trimmed window [1, 2, 3] ignores the single 100-comment outlier.
+        assert decision.should_stop is True
+        assert decision.reason == "DIMINISHING_RETURNS"
+
+        strategy = DiminishingReturnsStrategy(min_yield=5, window=5)
+        volume = 0
+        for yield_ in (0, 10, 10, 10, 0):
+            volume += yield_
+            decision = strategy.decide(current_volume=volume, elapsed_seconds=0)
+        assert decision.should_stop is False
+
+    def test_composite_returns_first_stop(self):
+        strategy = CompositeStrategy([FixedTargetStrategy(100), TimeBudgetStrategy(10)])
+        assert strategy.decide(current_volume=50, elapsed_seconds=5).should_stop is False
+        assert strategy.decide(current_volume=50, elapsed_seconds=11).reason == "TIME_BUDGET"
+        assert strategy.decide(current_volume=150, elapsed_seconds=11).reason == "TARGET_REACHED"
+
+    def test_build_stop_strategy_from_config(self):
+        assert isinstance(build_stop_strategy(VolumeStrategyConfig(target_comments=10)), FixedTargetStrategy)
+        assert build_stop_strategy(VolumeStrategyConfig(target_comments=0)) is None
+        # time_budget without a budget is skipped
+        single = build_stop_strategy(
+            VolumeStrategyConfig(target_comments=10, stop_strategies=["fixed_target", "time_budget"])
+        )
+        assert isinstance(single, FixedTargetStrategy)
+        combined = build_stop_strategy(
+            VolumeStrategyConfig(
+                stop_strategies=["fixed_target", "time_budget", "rate_eta", "diminishing_returns"],
+                time_budget_seconds=3600,
+            )
+        )
+        assert [type(s) for s in combined.strategies] == [
+            FixedTargetStrategy,
+            TimeBudgetStrategy,
+            RateEtaStrategy,
+            DiminishingReturnsStrategy,
+        ]
+
+    def test_should_interrupt_does_not_advance_per_article_state(self):
+        strategy = CompositeStrategy(
+            [FixedTargetStrategy(100), DiminishingReturnsStrategy(min_yield=5, window=1)]
+        )
+        assert strategy.should_interrupt(current_volume=50, elapsed_seconds=0) is False
+        assert strategy.should_interrupt(current_volume=100, elapsed_seconds=0) is True
+        # Interrupt checks did not count as articles for the yield window.
+        assert strategy.decide(current_volume=50, elapsed_seconds=0).should_stop is False
+
+
+    def test_check_names_the_interrupting_strategy(self):
+        strategy = CompositeStrategy([FixedTargetStrategy(100), TimeBudgetStrategy(10)])
+        assert strategy.check(current_volume=50, elapsed_seconds=5).should_stop is False
+        assert strategy.check(current_volume=50, elapsed_seconds=10).reason == "TIME_BUDGET"
+        assert strategy.check(current_volume=100, elapsed_seconds=0).reason == "TARGET_REACHED"
+
+
+from src.ops.volume import OrderStatistics, trimmed_mean
+
+class TestOrderStatistics:
+    def test_matches_sorted_reference_while_growing(self):
+        stats = OrderStatistics(initial_size=4)
+        values = []
+        for value in [5, 0, 1200, 7, 7, 33, 90000, 2, 18, 400]:
+            stats.add(value)
+            values.append(value)
+            assert stats.trimmed_mean() == pytest.approx(trimmed_mean(values))
+        ordered = sorted(values)
+        assert [stats.kth(i) for i in range(len(values))] == ordered
+        assert stats.smallest_sum(3) == sum(ordered[:3])
+
+    def test_percentiles_interpolate(self):
+        stats = OrderStatistics()
+        for value in [1, 2, 3, 4]:
+            stats.add(value)
+        assert stats.percentile(0.5) == 2.5
+        assert stats.percentile(0.0) == 1
+        assert stats.percentile(1.0) == 4
+
+    def test_rejects_negative_values(self):
+        with pytest.raises(ValueError):
+            OrderStatistics().add(-1)
+
+class TestVolumeEstimators:
+    def test_estimator_selects_yield(self):
+        counts = [1, 2, 3, 4, 1000]
+        trackers = {name: VolumeTracker(estimator=name) for name in ("trimmed_mean_p20_p80", "median", "mean")}
+        for tracker in trackers.values():
+            for count in counts:
+                tracker.add_count(count)
+
+        assert trackers["trimmed_mean_p20_p80"].estimate_yield() == 3.0
+        assert trackers["median"].estimate_yield() == 3.0
+        assert trackers["mean"].estimate_yield() == 202.0
+        assert trackers["mean"].estimate_remaining_articles(target_comments=1000, collected_comments=0) == 5
+
+    def test_unknown_estimator_rejected(self):
+        with pytest.raises(ValueError):
+            VolumeTracker(estimator="p95")
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from src.collectors.comment_parser import CommentParser, JSONPParseError, SchemaMismatchError
+from src.collectors.page_processor import InlinePageProcessor, ProcessPoolPageProcessor, process_page
+from src.privacy.hashing import PrivacyHasher
+
+SNAPSHOT = "2025-01-01T00:00:00"
+
+
+def _page(comments, cursor=None, total=None):
+    result = {"commentList": comments, "pageModel": {"next": cursor}}
+    if total is not None:
+        result["count"] = {"comment": total}
+    return "cb(" + json.dumps({"result": result}) + ");"
+
+
+def _comment(no, replies=0, reg_time="1700000000000"):
+    return {"commentNo": no, "contents": f"c{no}", "regTime": reg_time, "userId": f"u{no}", "replyCount": replies}
+
+
+def _parser(mock_config):
+    return CommentParser(mock_config, PrivacyHasher("salt"))
+
+
+def test_process_page_summarizes_page(mock_config):
+    body = _page([_comment("1", replies=2), _comment("2")], cursor="next", total=40)
+
+    parsed = process_page(_parser(mock_config), body, 0, None, SNAPSHOT)
+
+    assert [row.comment_no for row in parsed.rows] == ["1", "2"]
+    assert parsed.reply_threads == [("1", 2)]
+    assert (parsed.cursor, parsed.reported_total, parsed.comment_count) == ("next", 40, 2)
+    assert parsed.has_result_block and parsed.missing_fields is None
+
+
+def test_process_page_reports_missing_fields_without_rows(mock_config):
+    body = _page([_comment("1"), {"commentNo": "2", "contents": "", "regTime": "x"}])
+
+    parsed = process_page(_parser(mock_config), body, 0, None, SNAPSHOT)
+
+    assert parsed.missing_fields == (1, ["contents"])
+    assert parsed.rows == []
+
+
+def test_process_pool_matches_inline(mock_config):
+    inline_parser = _parser(mock_config)
+    pool_parser = _parser(mock_config)
+    body = _page([_comment("1"), _comment("2", reg_time="yesterday")], cursor="next")
+    pool = ProcessPoolPageProcessor(mock_config, "salt", pool_parser, workers=2)
+    try:
+        expected = InlinePageProcessor(inline_parser).process(body, 1, "99", SNAPSHOT)
+        actual = pool.process(body, 1, "99", SNAPSHOT)
+
+        # Pagination fields are read in-process; only the rows are still building.
+        assert actual.pending is not None and actual.row_count == 2
+        assert (actual.cursor, actual.reply_threads) == (expected.cursor, expected.reply_threads)
+        strip = lambda rows: [row._replace(crawl_at=None) for row in rows]
+        assert strip(pool.rows(actual)) == strip(expected.rows)
+        assert pool_parser.timestamp_anomalies == inline_parser.timestamp_anomalies == 1
+
+        with pytest.raises(JSONPParseError):
+            pool.process("<html></html>", 0, None, SNAPSHOT)
+        with pytest.raises(SchemaMismatchError):
+            pool.process('{"result": {"commentList": [{"commentNo": "1"}]}}', 0, None, SNAPSHOT)
+    finally:
+        pool.close()
@@ -1,6 +1,8 @@
+import pytest
+
 from src.config import PrivacyConfig
 from src.privacy.hashing import PrivacyHasher
-from src.privacy.factory import build_privacy_hasher
+from src.privacy.factory import build_privacy_hasher, hasher_from_salt
 
 
 def test_hash_identifier_is_deterministic():
@@ -25,8 +27,74 @@ def test_build_privacy_hasher_ephemeral_uses_random_salt(monkeypatch):
     assert hasher.hash_identifier("user") == PrivacyHasher("abc123").hash_identifier("user")
 
 
+
+def test_build_privacy_hasher_ephemeral_accepts_shared_salt():
+    config = PrivacyConfig(mode="ephemeral")
+    first, _ = build_privacy_hasher(config, run_id="run-1", ephemeral_salt="shared")
+    second, salt = build_privacy_hasher(config, run_id="run-1", ephemeral_salt="shared")
+    assert salt == "shared"
+    assert first.hash_identifier("user") == second.hash_identifier("user")
+
 def test_build_privacy_hasher_longitudinal_requires_fixed_salt():
     config = PrivacyConfig(mode="longitudinal", fixed_salt="fixed-salt")
     hasher, salt = build_privacy_hasher(config, run_id="run-1")
     assert salt == "fixed-salt"
     assert hasher.hash_identifier("user") == PrivacyHasher("fixed-salt").hash_identifier("user")
+
+
+def test_hash_identifier_memoizes_with_bounded_lru():
+    hasher = PrivacyHasher("salt", cache_size=2)
+
+    first = hasher.hash_identifier("a")
+    assert hasher.hash_identifier("a") == first
+    hasher.hash_identifier("b")
+    hasher.hash_identifier("c")  # evicts "a"
+
+    assert hasher.cache_hits == 1
+    assert hasher.cache_misses == 3
+    assert hasher.cache_stats()["size"] == 2
+    assert hasher.hash_identifier("a") == first
+    assert hasher.cache_misses == 4
+
+
+def test_hash_many_preserves_order_and_empty_values():
+    hasher = PrivacyHasher("salt")
+    values = hasher.hash_many(["a", None, "b", "a", ""])
+
+    assert values == [
+        hasher.hash_identifier("a"),
+        None,
+        hasher.hash_identifier("b"),
+        hasher.hash_identifier("a"),
+        None,
+    ]
+    assert hasher.hit_rate > 0
+
+
+def test_blake2b_algorithm_is_keyed_and_distinct():
+    sha = PrivacyHasher("salt")
+    blake = PrivacyHasher("salt", algorithm="blake2b")
+
+    assert blake.hash_identifier("user") != sha.hash_identifier("user")
+    assert blake.hash_identifier("user") != PrivacyHasher("other", algorithm="blake2b").hash_identifier("user")
+    assert len(blake.hash_identifier("user")) == 64
+
+
+def test_build_privacy_hasher_honours_hash_algorithm():
+    config = PrivacyConfig(mode="ephemeral", hash_algorithm="blake2b")
+    hasher, salt = build_privacy_hasher(config, run_id="run-1")
+    assert hasher.algorithm == "blake2b"
+    assert hasher.hash_identifier("user") == PrivacyHasher(salt, algorithm="blake2b").hash_identifier("user")
+
+
+def test_hasher_from_salt_matches_the_run_hasher():
+    config = PrivacyConfig(mode="ephemeral", hash_algorithm="blake2b", hash_cache_size=0)
+    hasher, salt = build_privacy_hasher(config, run_id="run-1")
+    rebuilt = hasher_from_salt(config, salt)
+    assert rebuilt.algorithm == "blake2b"
+    assert rebuilt.hash_identifier("user") == hasher.hash_identifier("user")
+
+
+def test_longitudinal_mode_rejects_non_sha256():
+    with pytest.raises(ValueError):
+        PrivacyConfig(mode="longitudinal", fixed_salt="fixed", hash_algorithm="blake2b")
@@ -43,3 +43,13 @@ def test_update_min_delay_adjusts_spread():
     assert limiter.min_delay == 2.0
     # Spread defaults to at least 1.0, so max should be min + spread
     assert limiter.max_delay == limiter.min_delay + 1.0
+
+
+def test_update_delay_range_sets_both_bounds():
+    limiter = RateLimiter(_config())
+
+    limiter.update_delay_range(0.8, 0.4)
+
+    assert limiter.min_delay == 0.8
+    assert limiter.max_delay == 0.8
+
@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+from src.collectors.reparse import ArchiveReparser, list_members
+from src.config import ArchiveConfig
+from src.privacy.hashing import PrivacyHasher
+from src.storage.db import Database
+from src.storage.response_archive import ResponseArchive
+from src.storage.run_repository import RunRepository
+
+SNAPSHOT = "2025-01-01T00:00:00"
+
+
+def _page(comments):
+    return "cb(" + json.dumps({"result": {"commentList": comments, "pageModel": {"next": None}}}) + ");"
+
+
+def _comment(no, contents=None, sympathy=0):
+    return {
+        "commentNo": no,
+        "contents": contents or f"c{no}",
+        "regTime": "1700000000000",
+        "userId": f"u{no}",
+        "sympathyCount": sympathy,
+    }
+
+
+def _archive(tmp_path):
+    config = ArchiveConfig(enabled=True, root_dir=str(tmp_path / "archive"), batch_records=2, flush_interval=0.01)
+    archive = ResponseArchive(config, "run-r")
+    archive.record("comment", "001", "0001", 1, {}, _page([_comment("1", sympathy=1), _comment("2")]))
+    archive.record("reply", "001", "0001", 1, {}, _page([_comment("3")]), parent="1")
+    archive.record("comment", "001", "0002", 1, {}, "<html>blocked</html>")
+    archive.record("comment_stats", "001", "0001", 1, {}, 'cb({"result": {"commentCount": 3}})')
+    # Refetched later with a newer count; the later body wins.
+    archive.record("comment", "001", "0001", 1, {}, _page([_comment("1", sympathy=7), _comment("2")]))
+    archive.close()
+    return archive.directory
+
+
+def _rows(db, sql):
+    conn = db.get_connection()
+    try:
+        return [tuple(row) for row in conn.execute(sql).fetchall()]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reparse_rebuilds_comments_and_stats_offline(mock_config, tmp_path, workers):
+    archive_dir = _archive(tmp_path)
+    target = str(tmp_path / "rebuilt.db")
+
+    summary = ArchiveReparser(mock_config, "salt", "run-r", SNAPSHOT, workers=workers).run(archive_dir, target)
+
+    rebuilt = Database(target, wal_mode=False)
+    assert _rows(rebuilt, "SELECT comment_no, parent_comment_no, depth, sympathy_count FROM comments ORDER BY comment_no") == [
+        ("1", None, 0, 7),
+        ("2", None, 0, 0),
+        ("3", "1", 1, 0),
+    ]
+    assert _rows(rebuilt, "SELECT author_hash FROM comments WHERE comment_no = '1'") == [
+        (PrivacyHasher("salt").hash_identifier("u1"),)
+    ]
+    assert _rows(rebuilt, "SELECT oid, aid, total_comments FROM comment_stats") == [("001", "0001", 3)]
+    assert (summary.members, summary.pages, summary.stats, summary.errors) == (3, 3, 1, 1)
+    assert RunRepository(rebuilt).get_run("run-r")["total_comments"] == 3
+
+
+def test_reparse_keeps_index_order_across_archive_writers(mock_config, tmp_path, monkeypatch):
+    import src.storage.response_archive as response_archive
+
+    config = ArchiveConfig(enabled=True, root_dir=str(tmp_path / "archive"), batch_records=2, flush_interval=0.01)
+    # Two workers of one run; the later one's segment name sorts first.
+    for pid, sympathy in ((9999, 1), (12345, 7)):
+        monkeypatch.setattr(response_archive.os, "getpid", lambda pid=pid: pid)
+        archive = ResponseArchive(config, "run-r")
+        archive.record("comment", "001", "0001", 1, {}, _page([_comment("1", sympathy=sympathy)]))
+        archive.close()
+    monkeypatch.undo()
+    target = str(tmp_path / "rebuilt.db")
+
+    ArchiveReparser(mock_config, "salt", "run-r", SNAPSHOT, workers=1).run(archive.directory, target)
+
+    rebuilt = Database(target, wal_mode=False)
+    assert _rows(rebuilt, "SELECT sympathy_count FROM comments WHERE comment_no = '1'") == [(7,)]
+
+
+def test_reparse_skips_gate_and_probe_lookups(mock_config, tmp_path):
+    config = ArchiveConfig(enabled=True, root_dir=str(tmp_path / "archive"), batch_records=2, flush_interval=0.01)
+    archive = ResponseArchive(config, "run-r")
+    archive.record("comment", "001", "0001", 1, {}, _page([_comment("1")]))
+    # Article 0002 was skipped by the low-volume gate after a probe; it was never crawled.
+    archive.record("comment", "001", "0002", 1, {}, _page([_comment("9")]), purpose="count_probe")
+    archive.record("comment_stats", "001", "0002", 1, {}, 'cb({"result": {"commentCount": 1}})', purpose="gate")
+    archive.close()
+    target = str(tmp_path / "rebuilt.db")
+
+    summary = ArchiveReparser(mock_config, "salt", "run-r", SNAPSHOT, workers=1).run(archive.directory, target)
+
+    rebuilt = Database(target, wal_mode=False)
+    assert _rows(rebuilt, "SELECT aid, comment_no FROM comments") == [("0001", "1")]
+    assert _rows(rebuilt, "SELECT aid FROM articles") == [("0001",)]
+    assert (summary.pages, summary.stats) == (1, 0)
+
+
+def test_reparse_copies_run_and_article_metadata_from_source(mock_config, tmp_path, db):
+    RunRepository(db).start_run(run_id="run-r", snapshot_at=SNAPSHOT, tz_name="Asia/Seoul", config_payload={})
+    conn = db.get_connection()
+    with conn:
+        conn.execute("INSERT INTO articles (run_id, oid, aid, title, status) VALUES ('run-r', '001', '0001', 'T', 'SUCCESS')")
+    conn.close()
+    target = str(tmp_path / "rebuilt.db")
+
+    ArchiveReparser(mock_config, "salt", "run-r", SNAPSHOT, workers=1).run(_archive(tmp_path), target, source=db)
+
+    rebuilt = Database(target, wal_mode=False)
+    assert _rows(rebuilt, "SELECT aid, title FROM articles ORDER BY aid") == [("0001", "T")]
+    assert _rows(rebuilt, "SELECT config_json FROM runs") == [("{}",)]
+
+
+def test_reparse_refuses_existing_target_and_missing_archive(mock_config, tmp_path):
+    existing = tmp_path / "existing.db"
+    existing.write_bytes(b"")
+    reparser = ArchiveReparser(mock_config, "salt", "run-r", SNAPSHOT, workers=1)
+
+    with pytest.raises(FileExistsError):
+        reparser.run(tmp_path, str(existing))
+    with pytest.raises(FileNotFoundError):
+        list_members(tmp_path / "nowhere")
@@ -64,7 +64,7 @@ def test_register_article_accumulates_keywords():
 
     assert collector._register_article(entry.copy(), "alpha") is True
     assert collector._register_article(entry.copy(), "beta") is False
-    assert collector._dedup_index["001:000123"]["matched_keywords"] == ["alpha", "beta"]
+    assert collector.matched_keywords("001", "000123") == ["alpha", "beta"]
 
 
 def test_search_keyword_uses_fallback_when_credentials_missing(mocker):
@@ -88,9 +88,9 @@ def test_search_fallback_parses_articles(monkeypatch):
         </li>
     </ul>
     """
-    # Second response returns no articles to terminate loop
-    responses = [StubResponse(text=html), StubResponse(text="<html></html>")]
-    collector = SearchCollector(make_search_config(), http_client=StubHttpClient(responses))
+    # Later pages return no articles to terminate the loop
+    http = RoutingHttpClient(lambda url, params: StubResponse(text=html if params["start"] == 1 else "<html></html>"))
+    collector = SearchCollector(make_search_config(), http_client=http)
     monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
 
     results = list(collector._search_fallback("alpha"))
@@ -126,3 +126,254 @@ def test_search_keyword_openapi_yields_normalized_results(monkeypatch):
     assert len(results) == 1
     assert results[0]["oid"] == "005"
     assert results[0]["search_rank"] == 1
+
+
+class RoutingHttpClient:
+    """Answers by request params so concurrent page fetches stay deterministic."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.handler(url, kwargs.get("params") or {})
+
+
+def _openapi_item(oid: str, aid: str, pub_date: str = "Wed, 01 Jan 2025 09:00:00 +0900"):
+    return {"originallink": f"https://n.news.naver.com/mnews/article/{oid}/{aid}", "pubDate": pub_date}
+
+
+def test_search_openapi_fetches_pages_concurrently_in_rank_order(monkeypatch):
+    config = make_search_config(
+        use_openapi=True,
+        client_id="id",
+        client_secret="secret",
+        max_articles_per_keyword=250,
+        max_concurrent=3,
+    )
+
+    def handler(url, params):
+        start = params["start"]
+        items = [_openapi_item("001", f"{start + i:010d}") for i in range(params["display"])]
+        return StubResponse(json_payload={"items": items})
+
+    http = RoutingHttpClient(handler)
+    collector = SearchCollector(config, http_client=http)
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+
+    results = list(collector.search_keyword("alpha"))
+
+    assert len(results) == 250
+    assert [r["search_rank"] for r in results] == list(range(1, 251))
+    assert results[0]["aid"] == f"{1:010d}"
+    assert results[-1]["aid"] == f"{250:010d}"
+    # Only the three pages needed for 250 results are requested
+    assert sorted(call[2]["params"]["start"] for call in http.calls) == [1, 101, 201]
+
+
+def test_search_openapi_filters_by_date_range_and_tops_up_with_fallback(monkeypatch):
+    config = make_search_config(
+        use_openapi=True,
+        client_id="id",
+        client_secret="secret",
+        max_articles_per_keyword=2,
+    )
+    fallback_html = """
+    <ul class="list_news"><li><a class="news_tit" href="https://n.news.naver.com/mnews/article/009/000009">F</a></li></ul>
+    """
+
+    def handler(url, params):
+        if url == collector.base_url:
+            if params["start"] > 1:
+                return StubResponse(json_payload={"items": []})
+            return StubResponse(
+                json_payload={
+                    "items": [
+                        _openapi_item("001", "000001"),
+                        _openapi_item("001", "000002", "Mon, 01 Dec 2025 09:00:00 +0900"),
+                    ]
+                }
+            )
+        if params["start"] == 1:
+            return StubResponse(text=fallback_html)
+        return StubResponse(text="<html></html>")
+
+    http = RoutingHttpClient(handler)
+    collector = SearchCollector(config, http_client=http)
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+
+    results = list(collector.search_keyword("alpha"))
+
+    assert [(r["oid"], r["aid"]) for r in results] == [("001", "000001"), ("009", "000009")]
+    assert [r["search_rank"] for r in results] == [1, 2]
+    fallback_params = [c[2]["params"] for c in http.calls if c[1] == collector.fallback_url]
+    assert fallback_params[0]["ds"] == "2025.01.01"
+    assert fallback_params[0]["de"] == "2025.01.02"
+    assert "p:from20250101to20250102" in fallback_params[0]["nso"]
+
+
+def test_search_fallback_splits_slices_that_hit_the_cap(monkeypatch):
+    config = make_search_config(
+        date_range=DateRangeConfig(start="2025-01-01", end="2025-01-04"),
+        slice_days=4,
+    )
+
+    def handler(url, params):
+        ds = params["ds"]
+        aid = f"{params['start']:03d}{ds[-2:]}"
+        html = f'<ul class="list_news"><li><a class="news_tit" href="https://n.news.naver.com/mnews/article/001/{aid}">T</a></li></ul>'
+        return StubResponse(text=html)
+
+    http = RoutingHttpClient(handler)
+    collector = SearchCollector(config, http_client=http)
+    collector.FALLBACK_MAX_START = 11  # two pages per slice
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+
+    list(collector._search_fallback("alpha"))
+
+    windows = [(c[2]["params"]["ds"], c[2]["params"]["de"]) for c in http.calls]
+    assert windows[:2] == [("2025.01.01", "2025.01.04")] * 2
+    assert ("2025.01.01", "2025.01.02") in windows
+    assert ("2025.01.03", "2025.01.04") in windows
+    assert ("2025.01.04", "2025.01.04") in windows
+
+
+def test_closed_fallback_slices_are_served_from_cache_on_next_run(db, monkeypatch):
+    from src.storage.search_cache import SearchCache
+
+    html = """
+    <ul class="list_news"><li><a class="news_tit" href="https://n.news.naver.com/mnews/article/001/000001">A</a></li></ul>
+    """
+
+    def handler(url, params):
+        return StubResponse(text=html if params["start"] == 1 else "<html></html>")
+
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+    config = make_search_config(slice_days=2, max_concurrent=1)
+
+    first_http = RoutingHttpClient(handler)
+    first = list(SearchCollector(config, first_http, cache=SearchCache(db))._search_fallback("alpha"))
+
+    second_http = RoutingHttpClient(handler)
+    second = list(SearchCollector(config, second_http, cache=SearchCache(db))._search_fallback("alpha"))
+
+    assert [item["aid"] for item in first] == ["000001"]
+    assert second == first
+    assert len(first_http.calls) == 2
+    # Only the empty end-of-results page is fetched again; empty pages are never cached.
+    assert [call[2]["params"]["start"] for call in second_http.calls] == [11]
+
+
+def test_empty_closed_pages_are_not_cached(db, monkeypatch):
+    from src.storage.search_cache import SearchCache
+
+    html = """
+    <ul class="list_news"><li><a class="news_tit" href="https://n.news.naver.com/mnews/article/001/000001">A</a></li></ul>
+    """
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+    config = make_search_config(slice_days=2, max_concurrent=1)
+
+    # A captcha/block page parses as empty for the first run.
+    blocked = RoutingHttpClient(lambda url, params: StubResponse(text="<html>captcha</html>"))
+    assert list(SearchCollector(config, blocked, cache=SearchCache(db))._search_fallback("alpha")) == []
+
+    recovered = RoutingHttpClient(lambda url, params: StubResponse(text=html if params["start"] == 1 else ""))
+    results = list(SearchCollector(config, recovered, cache=SearchCache(db))._search_fallback("alpha"))
+
+    assert [item["aid"] for item in results] == ["000001"]
+
+
+def test_open_pages_are_refetched_once_expired(db, monkeypatch):
+    from src.storage.search_cache import SearchCache
+
+    config = make_search_config(
+        use_openapi=True,
+        client_id="id",
+        client_secret="secret",
+        max_articles_per_keyword=1,
+    )
+
+    def handler(url, params):
+        return StubResponse(json_payload={"items": [_openapi_item("001", "000001")]})
+
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+    http = RoutingHttpClient(handler)
+
+    fresh = SearchCache(db, ttl_seconds=3600)
+    list(SearchCollector(config, http, cache=fresh).search_keyword("alpha"))
+    list(SearchCollector(config, http, cache=fresh).search_keyword("alpha"))
+    assert len(http.calls) == 1
+
+    # Pages stored with a zero TTL are stale on the next lookup.
+    stale = SearchCache(db, ttl_seconds=0)
+    list(SearchCollector(config, http, cache=stale).search_keyword("beta"))
+    list(SearchCollector(config, http, cache=stale).search_keyword("beta"))
+    assert len(http.calls) == 3
+
+
+def _fallback_page(aids):
+    items = "".join(
+        f'<li><div><a class="news_tit extra" href="https://n.news.naver.com/mnews/article/001/{aid}">'
+        f"T<mark>{aid}</mark></a></div><a class=\"news_tit\" href=\"https://example.com/ignored\">x</a></li>"
+        for aid in aids
+    )
+    return f'<ul class="list_news">{items}</ul>'
+
+
+def test_fallback_fetches_page_windows_and_stops_at_first_empty_page(monkeypatch):
+    def handler(url, params):
+        page = (params["start"] - 1) // 10 + 1
+        if page > 4:
+            return StubResponse(text="<html><body></body></html>")
+        return StubResponse(text=_fallback_page([f"{page:03d}{i:03d}" for i in range(2)]))
+
+    http = RoutingHttpClient(handler)
+    collector = SearchCollector(make_search_config(max_concurrent=3, max_articles_per_keyword=50), http)
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+
+    results = list(collector._search_fallback("alpha"))
+
+    assert [item["aid"] for item in results] == ["001000", "001001", "002000", "002001", "003000", "003001", "004000", "004001"]
+    assert [item["search_rank"] for item in results] == list(range(1, 9))
+    assert results[0]["title"] == "T001000"
+    # Windows of 1, 2 and 3 pages; the last window ends at the empty page 5.
+    requested = sorted(call[2]["params"]["start"] for call in http.calls)
+    assert requested[:5] == [1, 11, 21, 31, 41]
+    assert max(requested) <= 51
+
+
+def test_fallback_does_not_request_full_window_past_short_results(monkeypatch):
+    def handler(url, params):
+        if params["start"] == 1:
+            return StubResponse(text=_fallback_page(["000001"]))
+        return StubResponse(text="<html><body></body></html>")
+
+    http = RoutingHttpClient(handler)
+    collector = SearchCollector(make_search_config(max_concurrent=8, max_articles_per_keyword=50), http)
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+
+    results = list(collector._search_fallback("alpha"))
+
+    assert [item["aid"] for item in results] == ["000001"]
+    # The window had only grown to two pages when the results ran out.
+    assert max(call[2]["params"]["start"] for call in http.calls) <= 21
+
+
+def test_fallback_slice_reports_result_cap(monkeypatch):
+    http = RoutingHttpClient(lambda url, params: StubResponse(text=_fallback_page([f"{params['start']:06d}"])))
+    collector = SearchCollector(make_search_config(max_concurrent=2), http)
+    monkeypatch.setattr(SearchCollector, "FALLBACK_MAX_START", 30)
+    monkeypatch.setattr("src.collectors.search_collector.time.sleep", lambda *args, **kwargs: None)
+
+    walk = collector._search_fallback_slice("alpha", collector._date_window, 1, 1)
+    items = []
+    while True:
+        try:
+            items.append(next(walk))
+        except StopIteration as stop:
+            hit_cap = stop.value
+            break
+
+    assert hit_cap is True
+    assert [item["aid"] for item in items] == ["000001", "000011", "000021"]
@@ -0,0 +1,31 @@
+from datetime import date
+
+import pytest
+
+from src.collectors.search_planner import DateSlice, plan_date_slices, parse_date_range
+from src.config import DateRangeConfig
+
+
+def test_plan_date_slices_covers_range_without_gaps():
+    slices = plan_date_slices(DateRangeConfig(start="2025-01-01", end="2025-01-20"), slice_days=7)
+
+    assert slices == [
+        DateSlice(date(2025, 1, 1), date(2025, 1, 7)),
+        DateSlice(date(2025, 1, 8), date(2025, 1, 14)),
+        DateSlice(date(2025, 1, 15), date(2025, 1, 20)),
+    ]
+    assert sum(s.days for s in slices) == 20
+
+
+def test_date_slice_split_halves_inclusive_range():
+    left, right = DateSlice(date(2025, 1, 1), date(2025, 1, 7)).split()
+
+    assert left == DateSlice(date(2025, 1, 1), date(2025, 1, 3))
+    assert right == DateSlice(date(2025, 1, 4), date(2025, 1, 7))
+    with pytest.raises(ValueError):
+        DateSlice(date(2025, 1, 1), date(2025, 1, 1)).split()
+
+
+def test_parse_date_range_rejects_inverted_range():
+    with pytest.raises(ValueError):
+        parse_date_range(DateRangeConfig(start="2025-02-01", end="2025-01-01"))
@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+
+from src.collectors.search_stream import SearchStream
+
+
+class StubSearcher:
+    def __init__(self, results, gates=None):
+        self.results = results
+        self.gates = gates or {}
+        self.produced = {keyword: 0 for keyword in results}
+
+    def search_keyword(self, keyword):
+        gate = self.gates.get(keyword)
+        if gate is not None:
+            gate.wait(timeout=5)
+        for item in self.results[keyword]:
+            self.produced[keyword] += 1
+            yield item
+
+
+def _items(keyword, ranks, **extra):
+    return [dict({"keyword": keyword, "search_rank": rank, "url": f"{keyword}-{rank}"}, **extra) for rank in ranks]
+
+
+def test_round_robin_interleaves_keywords():
+    searcher = StubSearcher({"alpha": _items("alpha", [1, 2, 3]), "beta": _items("beta", [1, 2])})
+    # Let both producers finish first so the rotation order is deterministic.
+    stream = SearchStream(searcher, ["alpha", "beta"], policy="round_robin")
+    stream._start()
+    for thread in stream._threads:
+        thread.join(timeout=5)
+
+    urls = [item["url"] for item in stream]
+
+    assert urls == ["alpha-1", "beta-1", "alpha-2", "beta-2", "alpha-3"]
+
+
+def test_round_robin_does_not_wait_for_slow_keyword():
+    slow = threading.Event()
+    searcher = StubSearcher(
+        {"alpha": _items("alpha", [1, 2]), "beta": _items("beta", [1])},
+        gates={"beta": slow},
+    )
+    stream = SearchStream(searcher, ["alpha", "beta"], policy="round_robin")
+
+    feed = iter(stream)
+    first = next(feed)
+    second = next(feed)
+    slow.set()
+    rest = list(feed)
+
+    assert [first["url"], second["url"]] == ["alpha-1", "alpha-2"]
+    assert [item["url"] for item in rest] == ["beta-1"]
+
+
+def test_rank_first_merges_by_search_rank():
+    searcher = StubSearcher({"alpha": _items("alpha", [1, 4, 5]), "beta": _items("beta", [2, 3])})
+    stream = SearchStream(searcher, ["alpha", "beta"], policy="rank_first")
+
+    ranks = [(item["keyword"], item["search_rank"]) for item in stream]
+
+    assert ranks == [("alpha", 1), ("beta", 2), ("beta", 3), ("alpha", 4), ("alpha", 5)]
+
+
+def test_volume_first_prefers_higher_estimate():
+    searcher = StubSearcher(
+        {
+            "alpha": _items("alpha", [1], volume=10) + _items("alpha", [2], volume=500),
+            "beta": _items("beta", [1], volume=200),
+        }
+    )
+    stream = SearchStream(
+        searcher,
+        ["alpha", "beta"],
+        policy="volume_first",
+        volume_estimator=lambda item: item["volume"],
+    )
+
+    volumes = [item["volume"] for item in stream]
+
+    assert volumes == [200, 10, 500]
+
+
+def test_volume_first_without_estimator_degrades_to_rank_first():
+    stream = SearchStream(StubSearcher({"alpha": []}), ["alpha"], policy="volume_first")
+
+    assert stream.policy == "rank_first"
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        SearchStream(StubSearcher({"alpha": []}), ["alpha"], policy="random")
+
+
+def test_lookahead_bounds_producers_and_close_stops_them():
+    searcher = StubSearcher({"alpha": _items("alpha", range(1, 101))})
+    stream = SearchStream(searcher, ["alpha"], lookahead=3)
+
+    feed = iter(stream)
+    next(feed)
+    stream._threads[0].join(timeout=0.2)
+
+    assert searcher.produced["alpha"] <= 5
+
+    feed.close()
+    stream._threads[0].join(timeout=5)
+    assert not stream._threads[0].is_alive()
@@ -0,0 +1,154 @@
+import threading
+
+from src.storage.crawl_queue import CrawlQueue
+from src.storage.repository import CommentRepository
+from src.storage.run_repository import RunRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _items(count, start=1):
+    return [
+        {"oid": "001", "aid": f"{index:010d}", "url": f"https://n.news.naver.com/article/001/{index:010d}"}
+        for index in range(start, start + count)
+    ]
+
+
+def _queue(db, clock=None, **kwargs):
+    RunRepository(db).start_run(run_id="run-q", snapshot_at="2025-01-01T00:00:00", tz_name="Asia/Seoul", config_payload={})
+    queue = CrawlQueue(db, "run-q", clock=clock or FakeClock(), **kwargs)
+    queue.start_planning()
+    return queue
+
+
+def test_fill_ignores_duplicates_and_claims_in_feed_order(db):
+    queue = _queue(db)
+
+    assert queue.fill(_items(3) + _items(2) + [{"url": "no-ids"}], batch_size=2) == 3
+
+    first = queue.claim("w1")
+    second = queue.claim("w2")
+    assert [first["aid"], second["aid"]] == ["0000000001", "0000000002"]
+    assert queue.counts() == {"QUEUED": 1, "LEASED": 2, "DONE": 0, "FAILED": 0}
+
+
+def test_expired_leases_are_requeued_until_max_attempts(db):
+    clock = FakeClock()
+    queue = _queue(db, clock=clock, lease_seconds=10, max_attempts=2)
+    queue.fill(_items(1))
+
+    assert queue.claim("crashed-1")["aid"] == "0000000001"
+    clock.now += 11
+    assert queue.claim("w2")["aid"] == "0000000001"
+
+    clock.now += 11
+    assert queue.claim("w3") is None
+    assert queue.counts()["FAILED"] == 1
+
+
+def test_renew_keeps_lease_alive(db):
+    clock = FakeClock()
+    queue = _queue(db, clock=clock, lease_seconds=10)
+    queue.fill(_items(1))
+    queue.claim("w1")
+
+    clock.now += 8
+    assert queue.renew("w1") == 1
+    clock.now += 8
+
+    assert queue.claim("w2") is None
+    assert queue.counts()["LEASED"] == 1
+
+
+def test_claims_feed_completes_items_and_stops_when_drained(db):
+    queue = _queue(db)
+    queue.fill(_items(2))
+    queue.finish_planning()
+
+    seen = [item["aid"] for item in queue.claims("w1", poll_interval=0)]
+
+    assert seen == ["0000000001", "0000000002"]
+    assert queue.counts()["DONE"] == 2
+    assert queue.is_drained()
+
+
+def test_closing_feed_requeues_unprocessed_article(db):
+    queue = _queue(db)
+    queue.fill(_items(2))
+    repository = CommentRepository(db, "run-q")
+
+    feed = queue.claims("w1", poll_interval=0)
+    first = next(feed)
+    repository.set_article_status(first["oid"], first["aid"], status="SUCCESS")
+    next(feed)
+    feed.close()
+
+    assert queue.counts() == {"QUEUED": 1, "LEASED": 0, "DONE": 1, "FAILED": 0}
+
+    feed = queue.claims("w2", poll_interval=0)
+    third = next(feed)
+    repository.set_article_status(third["oid"], third["aid"], status="FAIL-HTTP")
+    feed.close()
+
+    # A processed article is done even if the feed closed before asking for the next one.
+    assert queue.counts()["DONE"] == 2
+
+
+def test_claim_finalize_once_after_drain(db):
+    queue = _queue(db)
+    queue.fill(_items(1))
+
+    assert not queue.claim_finalize()
+    queue.finish_planning()
+    assert not queue.claim_finalize()
+
+    list(queue.claims("w1", poll_interval=0))
+
+    assert queue.claim_finalize()
+    assert not queue.claim_finalize()
+
+
+def test_worker_summary_aggregates_every_worker_report(db):
+    queue = _queue(db)
+    queue.report("w1", "SUCCESS", timestamp_anomalies=2)
+    queue.report("w2", "PARTIAL", timestamp_anomalies=1, failure_reason="boom")
+    queue.report("w3", "STOPPED", stop_reason="target_met")
+    # A restarted worker keeps its earlier anomalies and takes its latest status.
+    queue.report("w1", "SUCCESS", timestamp_anomalies=3)
+
+    assert queue.worker_summary() == {
+        "workers": 3,
+        "status": "PARTIAL",
+        "timestamp_anomalies": 6,
+        "stop_reasons": ["target_met"],
+        "failure_reasons": ["boom"],
+    }
+
+
+def test_concurrent_workers_never_share_an_article(db):
+    queue = _queue(db)
+    queue.fill(_items(40))
+    claimed = []
+    lock = threading.Lock()
+
+    def worker(name):
+        while True:
+            item = queue.claim(name)
+            if item is None:
+                return
+            with lock:
+                claimed.append(item["aid"])
+
+    threads = [threading.Thread(target=worker, args=(f"w{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert sorted(claimed) == [item["aid"] for item in _items(40)]
@@ -130,3 +130,80 @@ def test_persist_comments_respects_privacy_flag(tmp_path):
         assert rows[1]["run_id"] == "run-2" and rows[1]["author_raw"] == "raw-name"
     finally:
         conn.close()
+
+
+def test_persist_rows_writes_parser_rows(tmp_path):
+    from src.collectors.comment_parser import CommentRow
+
+    database = Database(str(tmp_path / "rows.db"), wal_mode=False)
+    database.init_schema()
+
+    conn = database.get_connection()
+    try:
+        with conn:
+            conn.execute(
+                "INSERT INTO runs (run_id, snapshot_at, start_at, timezone) VALUES (?, ?, ?, ?)",
+                ("run-1", "2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z", "UTC"),
+            )
+    finally:
+        conn.close()
+
+    repo = CommentRepository(database, run_id="run-1", store_author_raw=False)
+    repo.set_article_status("001", "0001", status="SUCCESS")
+
+    rows = [
+        CommentRow("c1", None, 0, "hello", "hash1", "raw-name", None, "t", "s", 1, 0, 2, 0, 0),
+        CommentRow("c2", "c1", 1, "reply", "hash2", None, None, "t", "s", 0, 0, 0, 0, 1),
+    ]
+    assert repo.persist_rows(rows, oid="001", aid="0001") == 2
+    # Re-persisting the same page updates counters without duplicating rows
+    assert repo.persist_rows([rows[0]._replace(sympathy_count=5)], oid="001", aid="0001") == 1
+
+    conn = database.get_connection()
+    try:
+        fetched = conn.execute(
+            "SELECT comment_no, parent_comment_no, author_raw, sympathy_count, is_blind FROM comments ORDER BY comment_no"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert [tuple(r) for r in fetched] == [("c1", None, None, 5, 0), ("c2", "c1", None, 0, 1)]
+
+
+def test_load_volume_history_uses_other_runs(tmp_path):
+    database = Database(str(tmp_path / "history.db"), wal_mode=False)
+    database.init_schema()
+    conn = database.get_connection()
+    try:
+        with conn:
+            for run_id in ("old", "new"):
+                conn.execute(
+                    "INSERT INTO runs (run_id, snapshot_at, start_at, timezone) VALUES (?, ?, ?, ?)",
+                    (run_id, "2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z", "UTC"),
+                )
+    finally:
+        conn.close()
+
+    old = CommentRepository(database, run_id="old")
+    old.set_article_status("001", "0001", status="SUCCESS")
+    old.set_article_status("001", "0002", status="SUCCESS")
+    old.persist_comments(
+        [
+            {
+                "comment_no": str(n), "parent_comment_no": None, "depth": 0, "contents": "c",
+                "author_hash": None, "author_raw": None, "reg_time": None, "crawl_at": None,
+                "snapshot_at": None, "sympathy_count": 0, "antipathy_count": 0, "reply_count": 0,
+                "is_deleted": False, "is_blind": False,
+            }
+            for n in range(3)
+        ],
+        "001",
+        "0001",
+    )
+    old.persist_comment_stats("001", "0002", {"total_comments": 120})
+
+    new = CommentRepository(database, run_id="new")
+    new.set_article_status("001", "0003", status="SUCCESS")
+    new.persist_comment_stats("001", "0003", {"total_comments": 999})
+
+    assert new.load_volume_history() == {("001", "0001"): 3, ("001", "0002"): 120}
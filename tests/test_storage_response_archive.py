@@ -0,0 +1,46 @@
+import json
+
+from src.config import ArchiveConfig
+from src.storage.response_archive import ResponseArchive, build_response_archive, iter_archive
+
+
+def _archive(tmp_path, **overrides):
+    settings = {"enabled": True, "root_dir": str(tmp_path / "archive"), "flush_interval": 0.01}
+    settings.update(overrides)
+    return ResponseArchive(ArchiveConfig(**settings), "run-a")
+
+
+def test_disabled_archive_is_not_built(tmp_path):
+    assert build_response_archive(ArchiveConfig(root_dir=str(tmp_path)), "run-a") is None
+
+
+def test_records_are_indexed_by_page_key_and_read_back(tmp_path):
+    archive = _archive(tmp_path, batch_records=2)
+    archive.record("comment", "001", "0001", 1, {"page": 1}, "first")
+    archive.record("comment", "001", "0001", 2, {"page": 2}, "second")
+    archive.record("reply", "001", "0001", 1, {"page": 1}, "thread", parent="c1")
+    archive.record("comment_stats", "001", "0001", 1, {}, "stats")
+    # A later fetch of the same page supersedes the earlier one.
+    archive.record("comment", "001", "0001", 1, {"page": 1}, "first-again")
+    archive.close()
+
+    assert archive.lookup("001", "0001", "comment", 2)["body"] == "second"
+    assert archive.lookup("001", "0001", "comment", 1)["body"] == "first-again"
+    assert archive.lookup("001", "0001", "reply", 1, parent="c1")["body"] == "thread"
+    assert archive.lookup("001", "0001", "reply", 1) is None
+    assert [record["body"] for record in iter_archive(archive.directory)] == [
+        "first", "second", "thread", "stats", "first-again",
+    ]
+
+
+def test_segments_rotate_and_manifest_lists_them(tmp_path):
+    archive = _archive(tmp_path, segment_mb=0, batch_records=1)
+    for page in range(1, 4):
+        archive.record("comment", "001", "0001", page, {}, "x" * 100)
+    archive.close()
+
+    manifest = json.loads((archive.directory / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["run_id"] == "run-a"
+    assert [segment["records"] for segment in manifest["segments"]] == [1, 1, 1]
+    assert all(segment["compressed_bytes"] > 0 for segment in manifest["segments"])
+    assert archive.lookup("001", "0001", "comment", 3)["body"] == "x" * 100
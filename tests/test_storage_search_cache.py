@@ -0,0 +1,29 @@
+from src.storage.search_cache import SearchCache, SearchCacheKey
+
+
+def _key(page=1):
+    return SearchCacheKey("alpha", "rel", "html", "2025-01-01", "2025-01-07", page, 10)
+
+
+def test_search_cache_round_trip(db):
+    cache = SearchCache(db)
+    items = [{"url": "https://n.news.naver.com/mnews/article/001/000001", "title": "국민연금"}]
+
+    assert cache.get(_key()) is None
+    cache.put(_key(), items)
+
+    assert cache.get(_key()) == items
+    assert cache.get(_key(page=11)) is None
+    assert cache.stats() == {"hits": 1, "misses": 2}
+
+
+def test_search_cache_expires_open_pages_but_keeps_closed_ones(db):
+    cache = SearchCache(db, ttl_seconds=0)
+    cache.put(_key(1), [{"url": "open"}])
+    cache.put(_key(11), [{"url": "closed"}], closed=True)
+
+    assert cache.get(_key(1)) is None
+    assert cache.get(_key(11)) == [{"url": "closed"}]
+
+    assert cache.purge_expired() == 1
+    assert cache.get(_key(11)) == [{"url": "closed"}]
@@ -0,0 +1,170 @@
+import csv
+
+import pytest
+
+from src.collectors.comment_parser import CommentRow
+from src.ops.run_events import RunEventLogger
+from src.storage.crawl_queue import CrawlQueue
+from src.storage.exporters import DataExporter
+from src.storage.repository import CommentRepository
+from src.storage.run_repository import RunRepository
+from src.storage.shards import (
+    MAX_ATTACHED,
+    ShardedDatabase,
+    ShardMerger,
+    attachable_shards,
+    discover_shards,
+    open_shard,
+    shard_path,
+)
+
+
+def _row(comment_no, contents, sympathy=0):
+    return CommentRow(comment_no, None, 0, contents, "hash", None, None, "t", "s", sympathy, 0, 0, 0, 0)
+
+
+@pytest.fixture
+def run(db):
+    RunRepository(db).start_run(run_id="run-s", snapshot_at="2025-01-01T00:00:00", tz_name="Asia/Seoul", config_payload={})
+    return "run-s"
+
+
+def _crawl(shard, run_id, aid, rows):
+    repo = CommentRepository(shard, run_id)
+    repo.set_article_status("001", aid, "SUCCESS", http_status=200)
+    repo.persist_rows(rows, "001", aid)
+    return repo
+
+
+def _count(database, table, run_id):
+    conn = database.get_connection()
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE run_id = ?", (run_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_shards_sit_next_to_main_db_and_carry_the_run_row(db, run):
+    shard = open_shard(db, "host/1", run, wal_mode=False)
+
+    assert shard.db_path == shard_path(str(db.db_path), "host/1")
+    assert shard.db_path.name == "test.shard-host_1.db"
+    assert discover_shards(str(db.db_path)) == [shard.db_path]
+    assert _count(shard, "runs", run) == 1
+
+
+def test_merge_upserts_like_the_repository_and_is_repeatable(db, run):
+    first = open_shard(db, "w1", run, wal_mode=False)
+    second = open_shard(db, "w2", run, wal_mode=False)
+    _crawl(first, run, "0000000001", [_row("c1", "old", sympathy=1)])
+    # A re-leased article crawled again by another worker, with fresher counts.
+    _crawl(second, run, "0000000001", [_row("c1", "new", sympathy=5), _row("c2", "other")])
+    RunEventLogger(first, run).log("SHARD_TEST", "written by w1")
+
+    merger = ShardMerger(db)
+    merger.merge([first.db_path, second.db_path])
+    merger.merge([first.db_path, second.db_path])
+
+    conn = db.get_connection()
+    try:
+        comments = conn.execute(
+            "SELECT comment_no, contents, sympathy_count FROM comments WHERE run_id = ? ORDER BY comment_no", (run,)
+        ).fetchall()
+        events = conn.execute("SELECT COUNT(*) FROM events WHERE event_type = 'SHARD_TEST'").fetchone()[0]
+    finally:
+        conn.close()
+    assert [tuple(row) for row in comments] == [("c1", "new", 5), ("c2", "other", 0)]
+    assert _count(db, "articles", run) == 1
+    assert events == 1
+
+
+def test_exporter_reads_shards_through_union_views_without_merging(db, run, tmp_path):
+    first = open_shard(db, "w1", run, wal_mode=False)
+    second = open_shard(db, "w2", run, wal_mode=False)
+    _crawl(first, run, "0000000001", [_row("c1", "a")])
+    _crawl(second, run, "0000000002", [_row("c2", "b"), _row("c3", "c")])
+
+    shards = discover_shards(str(db.db_path))
+    DataExporter(db, export_dir=str(tmp_path / "exports"), shards=shards).export_run(run)
+
+    with open(tmp_path / "exports" / "comments.csv", newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert sorted(row["comment_no"] for row in rows) == ["c1", "c2", "c3"]
+    assert RunRepository(ShardedDatabase(db, shards)).run_totals(run) == (2, 3)
+    # Nothing was copied into the main DB.
+    assert _count(db, "comments", run) == 0
+
+
+def test_union_views_read_an_article_in_two_shards_once(db, run, tmp_path):
+    first = open_shard(db, "w1", run, wal_mode=False)
+    second = open_shard(db, "w2", run, wal_mode=False)
+    # The lease expired on w1 and the article was crawled again by w2.
+    _crawl(first, run, "0000000001", [_row("c1", "old", sympathy=1)])
+    _crawl(second, run, "0000000001", [_row("c1", "new", sympathy=5), _row("c2", "other")])
+
+    shards = discover_shards(str(db.db_path))
+    sharded = ShardedDatabase(db, shards)
+    DataExporter(db, export_dir=str(tmp_path / "exports"), shards=shards).export_run(run)
+
+    with open(tmp_path / "exports" / "comments.csv", newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert sorted((row["comment_no"], row["contents"]) for row in rows) == [("c1", "new"), ("c2", "other")]
+    assert RunRepository(sharded).run_totals(run) == (1, 2)
+
+
+def test_merge_and_views_keep_the_same_newest_copy(db, run, tmp_path):
+    first = open_shard(db, "w1", run, wal_mode=False)
+    second = open_shard(db, "w2", run, wal_mode=False)
+    # w2 sorts last but holds the older crawl of the article.
+    _crawl(first, run, "0000000001", [_row("c1", "new", sympathy=5)])
+    _crawl(second, run, "0000000001", [_row("c1", "old", sympathy=1)])
+    for shard, crawl_at in ((first, "2025-01-01T00:10:00"), (second, "2025-01-01T00:00:00")):
+        conn = shard.get_connection()
+        with conn:
+            conn.execute("UPDATE comments SET crawl_at = ?", (crawl_at,))
+            conn.execute("UPDATE articles SET crawl_at = ?", (crawl_at,))
+        conn.close()
+    shards = discover_shards(str(db.db_path))
+    query = "SELECT comment_no, contents, sympathy_count FROM comments"
+
+    conn = ShardedDatabase(db, shards).get_connection()
+    try:
+        viewed = [tuple(row) for row in conn.execute(query).fetchall()]
+    finally:
+        conn.close()
+    ShardMerger(db).merge(shards)
+    conn = db.get_connection()
+    try:
+        merged = [tuple(row) for row in conn.execute(query).fetchall()]
+    finally:
+        conn.close()
+
+    assert viewed == merged == [("c1", "new", 5)]
+
+
+def test_too_many_shards_are_merged_instead_of_attached(db, run):
+    for index in range(MAX_ATTACHED + 1):
+        shard = open_shard(db, f"w{index}", run, wal_mode=False)
+        _crawl(shard, run, f"{index:010d}", [_row(f"c{index}", "x")])
+    shards = discover_shards(str(db.db_path))
+
+    with pytest.raises(ValueError):
+        ShardedDatabase(db, shards)
+    assert attachable_shards(db, shards) == []
+    assert _count(db, "comments", run) == MAX_ATTACHED + 1
+
+
+def test_released_lease_uses_the_shard_to_decide_done(db, run):
+    shard = open_shard(db, "w1", run, wal_mode=False)
+    repo = CommentRepository(shard, run)
+    queue = CrawlQueue(db, run)
+    queue.start_planning()
+    queue.fill([{"oid": "001", "aid": "0000000001"}])
+    queue.finish_planning()
+
+    feed = queue.claims("w1", poll_interval=0, is_processed=repo.has_article_status)
+    item = next(feed)
+    repo.set_article_status(item["oid"], item["aid"], "SUCCESS")
+    feed.close()
+
+    assert queue.counts()["DONE"] == 1
@@ -1,5 +1,6 @@
 import pytest
-from src.ops.throttle import AutoThrottler
+from src.config import AutoThrottleConfig
+from src.ops.throttle import AdaptiveThrottler, AutoThrottler, build_throttler
 from src.ops.rate_limiter import RateLimiter
 
 class TestAutoThrottle:
@@ -49,4 +50,111 @@ class TestAutoThrottle:
         
         # Hack: manually set recovery_history maxlen if possible or rely on simple loop
         # Testing recovery takes 200 reqs. Let's make test config smaller recovery window?
-        pass # Skip complex recovery test for brief TDD 
+        pass # Skip complex recovery test for brief TDD
+
+
+def _limiter(mock_config, baseline=0.0):
+    return RateLimiter(mock_config.collection.rate_limit.copy(update={"baseline_min_delay": baseline}))
+
+
+def _aimd_config(**overrides):
+    values = dict(
+        mode="aimd",
+        window=5,
+        ratio_429_threshold=0.2,
+        aimd_increase_step=0.1,
+        aimd_decrease_factor=2.0,
+        aimd_success_window=3,
+        aimd_jitter=0.0,
+        floor_delay=0.2,
+        ceiling_delay=5.0,
+        latency_tolerance=2.0,
+    )
+    values.update(overrides)
+    return AutoThrottleConfig(**values)
+
+
+class TestAdaptiveThrottle:
+    def test_build_throttler_selects_mode(self, mock_config, db):
+        limiter = _limiter(mock_config)
+
+        assert type(build_throttler(mock_config.collection.auto_throttle, limiter, db, "test")) is AutoThrottler
+        assert isinstance(build_throttler(_aimd_config(), limiter, db, "test"), AdaptiveThrottler)
+
+    def test_starts_within_floor(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        AdaptiveThrottler(_aimd_config(), limiter, db, "test")
+
+        assert limiter.min_delay == 0.2
+
+    def test_additive_increase_after_clean_streak(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        throttler = AdaptiveThrottler(_aimd_config(), limiter, db, "test")
+        limiter.update_delay_range(1.0, 1.0)
+
+        for _ in range(3):
+            throttler.observe(200, latency=0.1)
+
+        assert limiter.min_delay == pytest.approx(0.9)
+
+    def test_multiplicative_decrease_on_429_with_cooldown(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        throttler = AdaptiveThrottler(_aimd_config(), limiter, db, "test")
+        limiter.update_delay_range(1.0, 1.0)
+
+        throttler.observe(429)
+        assert limiter.min_delay == pytest.approx(2.0)
+
+        # A second 429 inside the same window does not compound the back-off.
+        throttler.observe(503)
+        assert limiter.min_delay == pytest.approx(2.0)
+
+    def test_decrease_capped_at_ceiling(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        throttler = AdaptiveThrottler(_aimd_config(window=1), limiter, db, "test")
+        limiter.update_delay_range(4.0, 4.0)
+
+        throttler.observe(429)
+
+        assert limiter.min_delay == 5.0
+
+    def test_rising_latency_holds_increase(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        throttler = AdaptiveThrottler(_aimd_config(), limiter, db, "test")
+        limiter.update_delay_range(1.0, 1.0)
+
+        throttler.observe(200, latency=0.1)
+        for _ in range(5):
+            throttler.observe(200, latency=2.0)
+
+        assert limiter.min_delay == 1.0
+
+    def test_emergency_stop_on_403(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        throttler = AdaptiveThrottler(_aimd_config(), limiter, db, "test")
+
+        throttler.observe(403)
+
+        assert throttler.is_stopped
+
+    def test_increase_goes_below_rate_limit_baseline_to_floor_delay(self, mock_config, db):
+        limiter = _limiter(mock_config, baseline=1.0)
+        throttler = AdaptiveThrottler(_aimd_config(floor_delay=0.2), limiter, db, "test")
+        limiter.update_delay_range(1.0, 1.0)
+
+        for _ in range(60):
+            throttler.observe(200, latency=0.1)
+
+        assert limiter.min_delay == pytest.approx(0.2)
+
+    def test_latency_floor_relaxes_after_lasting_shift(self, mock_config, db):
+        limiter = _limiter(mock_config)
+        throttler = AdaptiveThrottler(_aimd_config(), limiter, db, "test")
+        limiter.update_delay_range(3.0, 3.0)
+
+        throttler.observe(200, latency=0.1)
+        for _ in range(400):
+            throttler.observe(200, latency=1.0)
+
+        # The slower latency became the new normal, so increases resumed.
+        assert limiter.min_delay < 3.0
@@ -0,0 +1,81 @@
+import json
+from unittest.mock import Mock
+
+from src.collectors.comment_fetcher import CommentFetcher
+from src.collectors.comment_parser import CommentParser
+from src.collectors.volume_gate import LowVolumeGate
+from src.common.errors import AppError, ErrorKind, Severity
+from src.config import VolumeGateConfig
+from src.ops.probe import EndpointProbe
+from src.privacy.hashing import PrivacyHasher
+
+ITEM = {"oid": "001", "aid": "0001", "url": "https://n.news.naver.com/mnews/article/001/0001"}
+
+
+def _page(total, comments=0):
+    result = {"count": {"comment": total}, "commentList": [{"commentNo": str(n)} for n in range(comments)]}
+    return f"cb({json.dumps({'result': result})});"
+
+
+def _gate(mock_config, minimum=10, source="page1", stats_service=None):
+    fetcher = Mock(spec=CommentFetcher)
+    parser = CommentParser(mock_config, PrivacyHasher("salt"))
+    gate = LowVolumeGate(
+        VolumeGateConfig(min_comments_to_crawl=minimum, source=source),
+        fetcher,
+        parser,
+        EndpointProbe(),
+        stats_service=stats_service,
+    )
+    return gate, fetcher
+
+
+def test_page1_gate_skips_low_volume_and_keeps_page_for_reuse(mock_config):
+    gate, fetcher = _gate(mock_config)
+    fetcher.fetch.return_value = _page(3, comments=3)
+
+    result = gate.check(dict(ITEM))
+
+    assert result.passed is False
+    assert result.total == 3
+    assert fetcher.fetch.call_args.kwargs["purpose"] == "gate"
+
+    fetcher.fetch.return_value = _page(25, comments=20)
+    result = gate.check(dict(ITEM))
+    default_params = EndpointProbe().known_configs[0]
+    assert result.passed is True
+    assert result.reusable_page(default_params) == fetcher.fetch.return_value
+    assert result.reusable_page({"ticket": "news", "templateId": "other"}) is None
+
+
+def test_page1_gate_passes_when_total_unreadable(mock_config):
+    gate, fetcher = _gate(mock_config)
+    fetcher.fetch.side_effect = AppError("boom", Severity.RETRY, ErrorKind.HTTP)
+
+    assert gate.check(dict(ITEM)).passed is True
+
+    fetcher.fetch.side_effect = None
+    fetcher.fetch.return_value = "<html>blocked</html>"
+    assert gate.check(dict(ITEM)).passed is True
+
+
+def test_page1_gate_reuses_count_probe_page(mock_config):
+    gate, fetcher = _gate(mock_config)
+    item = dict(ITEM, count_probe={"params": EndpointProbe().known_configs[0], "raw": _page(2, comments=2)})
+
+    result = gate.check(item)
+
+    assert result.passed is False
+    fetcher.fetch.assert_not_called()
+
+
+def test_stats_gate_uses_reported_total(mock_config):
+    stats_service = Mock()
+    stats_service.fetch_stats.return_value = {"total_comments": 4}
+    gate, fetcher = _gate(mock_config, source="stats", stats_service=stats_service)
+
+    result = gate.check(dict(ITEM))
+
+    assert result.passed is False
+    assert result.first_page is None
+    fetcher.fetch.assert_not_called()
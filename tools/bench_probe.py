@@ -0,0 +1,102 @@
+"""
+Benchmark EndpointProbe parameter discovery over a corpus of saved article pages.
+
+Compares the current single-scan discovery against the previous implementation
+(one uncompiled re.search per key over the whole page) and checks both agree.
+
+Usage:
+    python tools/bench_probe.py path/to/saved_pages [--repeat 20] [--glob "*.html"]
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.ops.probe import EndpointProbe
+
+
+def legacy_discover(article_html):
+    """Reference copy of the pre-scan discovery logic."""
+    discovered = {}
+    if article_html:
+        ticket_match = re.search(r'serviceName\s*:\s*["\']([^"\']+)["\']', article_html)
+        if not ticket_match:
+            ticket_match = re.search(r'_cv\s*=\s*["\']([^"\']+)["\']', article_html)
+        discovered['ticket'] = ticket_match.group(1) if ticket_match else 'news'
+
+        tmpl_match = re.search(r'templateId\s*:\s*["\']([^"\']+)["\']', article_html)
+        if not tmpl_match:
+            tmpl_match = re.search(r'_templateId\s*=\s*["\']([^"\']+)["\']', article_html)
+        if tmpl_match:
+            discovered['templateId'] = tmpl_match.group(1)
+
+        pool_match = re.search(r'pool\s*[:=]\s*["\']([^"\']+)["\']', article_html)
+        if pool_match:
+            discovered['pool'] = pool_match.group(1)
+
+        cv_match = re.search(r'_cv\s*=\s*["\']([^"\']+)["\']', article_html)
+        if cv_match:
+            discovered['cv'] = cv_match.group(1)
+
+        t_match = re.search(r'template\s*:\s*["\']([^"\']+)["\']', article_html)
+        if t_match:
+            discovered['template'] = t_match.group(1)
+
+    if discovered.get('ticket') and discovered.get('templateId'):
+        return discovered
+    return None
+
+
+def _time(fn, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            fn(page)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark probe parameter discovery.")
+    parser.add_argument("corpus", help="Directory containing saved article HTML pages.")
+    parser.add_argument("--glob", default="*.html", help="File pattern inside the corpus directory.")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the corpus per implementation.")
+    args = parser.parse_args(argv)
+
+    paths = sorted(Path(args.corpus).glob(args.glob))
+    if not paths:
+        print(f"No pages matching {args.glob} in {args.corpus}")
+        return 1
+    pages = [path.read_text(encoding="utf-8", errors="replace") for path in paths]
+
+    probe = EndpointProbe()
+    mismatches = []
+    label_counts = {}
+    for path, page in zip(paths, pages):
+        current, sources = probe.scan_parameters(page)
+        for key, label in sources.items():
+            label_counts[f"{key}<-{label}"] = label_counts.get(f"{key}<-{label}", 0) + 1
+        if probe.discover_parameters("", page) != legacy_discover(page):
+            mismatches.append(path.name)
+
+    legacy_s = _time(legacy_discover, pages, args.repeat)
+    current_s = _time(lambda page: probe.discover_parameters("", page), pages, args.repeat)
+    total_mb = sum(len(page) for page in pages) / (1024 * 1024)
+    calls = len(pages) * args.repeat
+
+    print(f"pages={len(pages)} size={total_mb:.1f}MiB repeat={args.repeat}")
+    print(f"legacy : {legacy_s:.3f}s ({legacy_s / calls * 1e3:.3f} ms/page)")
+    print(f"current: {current_s:.3f}s ({current_s / calls * 1e3:.3f} ms/page)")
+    if current_s:
+        print(f"speedup: {legacy_s / current_s:.2f}x")
+    print("matched patterns: " + ", ".join(f"{k}={v}" for k, v in sorted(label_counts.items())))
+    if mismatches:
+        # Expected only when params live outside <script> blocks (legacy scanned markup too).
+        print(f"results differ on {len(mismatches)} page(s): {', '.join(mismatches[:10])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())